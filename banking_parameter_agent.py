@@ -367,7 +367,7 @@ def render_dashboard():
     
     # Data refresh button
     if st.sidebar.button("🔄 Refresh All Data"):
-        st.experimental_rerun()
+        st.rerun()
     
     # Get all data
     climate_data = agent.get_climate_data()
@@ -14,10 +14,18 @@ import folium
 from streamlit_folium import folium_static
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to the pandas CSV parser and groupby
+    pa = pc = pa_csv = None
+
 # Page configuration
 st.set_page_config(
     page_title="AI Micro-Lending Risk Assessment Platform",
@@ -26,41 +34,148 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+EXCEL_PATH = "input_excel/input_data.xlsx"
+
+# Borrower CSVs in order of preference; the first one present is loaded
+BORROWER_FILES = (
+    'data/enhanced_borrowers.csv',
+    'data/borrowers.csv'
+)
+
+# Low-cardinality string columns stored as categoricals so value_counts/groupby run over integer codes
+CATEGORICAL_COLUMNS = ('risk_category', 'education_level', 'occupation', 'district', 'block', 'panchayat')
+
+@st.cache_data
+def simulated_feature_importance(n_features, seed=42):
+    """Simulated feature importance scores, fixed across reruns and sorted descending"""
+    return np.sort(np.random.default_rng(seed).uniform(0.1, 0.9, n_features))[::-1]
+
+@st.cache_data
+def risk_correlation_matrix(data_key, _df, columns):
+    """Pairwise Pearson correlation of the given columns, computed once per file version (data_key)"""
+    return _df[list(columns)].corr()
+
+RISK_CATEGORY_COLORS = {
+    'Low Risk': '#2ecc71',
+    'Medium Risk': '#f39c12',
+    'High Risk': '#e74c3c',
+    'Very High Risk': '#8e44ad'
+}
+
+@st.cache_data
+def bar_figure_json(x, y, title, color_scale, orientation='v', tickangle=None):
+    """Serialized bar chart with bars coloured by value; built once per distinct input"""
+    values = x if orientation == 'h' else y
+    fig = go.Figure(go.Bar(
+        x=x,
+        y=y,
+        orientation=orientation,
+        marker=dict(color=values, colorscale=color_scale, showscale=True)
+    ))
+    fig.update_layout(title=title)
+    if tickangle is not None:
+        fig.update_layout(xaxis_tickangle=tickangle)
+    return fig.to_json()
+
+@st.cache_data
+def pie_figure_json(labels, values, title, color_map):
+    """Serialized pie chart with per-label colours; built once per distinct input"""
+    fig = go.Figure(go.Pie(
+        labels=labels,
+        values=values,
+        marker=dict(colors=[color_map.get(label) for label in labels])
+    ))
+    fig.update_layout(title=title)
+    return fig.to_json()
+
+@st.cache_data
+def histogram_counts(data_key, column, _values, bins=20):
+    """Bin counts and bin centres of a column, so charts ship one bar per bin instead of every raw value"""
+    values = np.asarray(_values, dtype=float)
+    counts, edges = np.histogram(values[~np.isnan(values)], bins=bins)
+    return (edges[:-1] + edges[1:]) / 2, counts, edges[1] - edges[0]
+
+@st.cache_data
+def group_mean(data_key, _df, group_col, value_col):
+    """Mean of value_col per group, using Arrow's grouped aggregation kernel when available (data_key identifies the file version)"""
+    if pa is None:
+        return _df.groupby(group_col, observed=True)[value_col].mean().reset_index()
+    # Match pandas: drop null keys, keep the key dtype and sort by key (category order for
+    # categoricals); Arrow keeps null groups and returns them in first-appearance order
+    table = pa.Table.from_pandas(_df[[group_col, value_col]], preserve_index=False)
+    table = table.filter(pc.is_valid(table[group_col]))
+    result = table.group_by(group_col).aggregate([(value_col, 'mean')])
+    return pd.DataFrame({
+        group_col: pd.Series(result.column(group_col).to_pylist()).astype(_df[group_col].dtype),
+        value_col: result.column(f'{value_col}_mean').to_numpy()
+    }).sort_values(group_col, ignore_index=True)
+
+@st.cache_data
+def top_value_counts(data_key, column, _values, n=10):
+    """Counts of a column's n most frequent non-null values, using Arrow's value_counts kernel when available"""
+    if pa is None:
+        return _values.value_counts().head(n)
+    counts = pc.value_counts(pa.array(_values).drop_null())
+    counts = pd.Series(counts.field('counts').to_numpy(), index=counts.field('values').to_pylist())
+    return counts.sort_values(ascending=False).head(n)
+
+def read_csv_columnar(file_path):
+    """Read a CSV through pyarrow's multithreaded columnar reader when available"""
+    if pa_csv is None:
+        return pd.read_csv(file_path)
+    table = pa_csv.read_csv(file_path, read_options=pa_csv.ReadOptions(block_size=1 << 20))
+    return table.to_pandas()
+
+def read_borrower_data(data_files):
+    """Read the first available borrower CSV; returns (path, dataframe, errors)"""
+    errors = []
+    for file_path in data_files:
+        if os.path.exists(file_path):
+            try:
+                df = read_csv_columnar(file_path)
+                for col in CATEGORICAL_COLUMNS:
+                    if col in df.columns:
+                        df[col] = df[col].astype('category')
+                return file_path, df, errors
+            except Exception as e:
+                errors.append((file_path, e))
+    return None, None, errors
+
 class ExcelIntegratedDashboard:
     def __init__(self):
-        self.excel_path = "input_excel/input_data.xlsx"
+        self.excel_path = EXCEL_PATH
         self.excel_data = None
         self.borrowers_df = None
+        self.borrowers_key = None
+        self.load_messages = []
         self.load_data()
     
     def load_data(self):
-        """Load Excel and generated data"""
-        
-        # Try to load Excel data
-        if os.path.exists(self.excel_path):
-            try:
-                self.excel_data = pd.read_excel(self.excel_path)
-                st.sidebar.success(f"📊 Excel data loaded: {self.excel_data.shape[0]} rows")
-            except Exception as e:
-                st.sidebar.error(f"❌ Error loading Excel: {e}")
+        """Load Excel and generated data, recording status messages for the sidebar"""
         
-        # Load generated borrower data
-        data_files = [
-            'data/enhanced_borrowers.csv',
-            'data/borrowers.csv'
-        ]
-        
-        for file_path in data_files:
-            if os.path.exists(file_path):
+        # The Excel parse and the CSV read are independent, so overlap them
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            excel_future = executor.submit(pd.read_excel, self.excel_path) if os.path.exists(self.excel_path) else None
+            borrowers_future = executor.submit(read_borrower_data, BORROWER_FILES)
+            
+            if excel_future is not None:
                 try:
-                    self.borrowers_df = pd.read_csv(file_path)
-                    st.sidebar.success(f"✅ Loaded {file_path}: {self.borrowers_df.shape[0]} borrowers")
-                    break
+                    self.excel_data = excel_future.result()
+                    self.load_messages.append(f"📊 Excel data loaded: {self.excel_data.shape[0]} rows")
                 except Exception as e:
-                    st.sidebar.error(f"❌ Error loading {file_path}: {e}")
+                    self.load_messages.append(f"❌ Error loading Excel: {e}")
+            
+            loaded_path, self.borrowers_df, errors = borrowers_future.result()
         
-        if self.borrowers_df is None:
-            st.sidebar.warning("⚠️ No borrower data found. Please generate data first.")
+        for file_path, e in errors:
+            self.load_messages.append(f"❌ Error loading {file_path}: {e}")
+        
+        if self.borrowers_df is not None:
+            # (path, mtime) identifies this borrower data in the cached helpers, which skip hashing the frame
+            self.borrowers_key = (loaded_path, os.path.getmtime(loaded_path))
+            self.load_messages.append(f"✅ Loaded {loaded_path}: {self.borrowers_df.shape[0]} borrowers")
+        else:
+            self.load_messages.append("⚠️ No borrower data found. Please generate data first.")
     
     def display_excel_analysis(self):
         """Display Excel data analysis"""
@@ -78,7 +193,7 @@ class ExcelIntegratedDashboard:
         with col2:
             st.metric("Columns", len(self.excel_data.columns))
         with col3:
-            st.metric("Missing Values", self.excel_data.isnull().sum().sum())
+            st.metric("Missing Values", int(self.excel_data.isna().to_numpy().sum()))
         
         # Display column information
         st.subheader("📋 Column Information")
@@ -124,7 +239,7 @@ class ExcelIntegratedDashboard:
         
         # Risk aggregation by administrative level
         if 'overall_risk_score' in self.borrowers_df.columns:
-            risk_agg = self.borrowers_df.groupby(group_col).agg({
+            risk_agg = self.borrowers_df.groupby(group_col, observed=True).agg({
                 'overall_risk_score': ['mean', 'std', 'count'],
                 'requested_loan_amount': ['sum', 'mean'] if 'requested_loan_amount' in self.borrowers_df.columns else ['count'],
                 'monthly_income': 'mean' if 'monthly_income' in self.borrowers_df.columns else 'count'
@@ -147,16 +262,15 @@ class ExcelIntegratedDashboard:
                 st.dataframe(low_risk)
             
             # Risk distribution chart
-            fig = px.bar(
-                risk_agg.head(20),
-                x=group_col,
-                y='overall_risk_score_mean',
-                title=f'Risk Scores by {admin_level}',
-                color='overall_risk_score_mean',
-                color_continuous_scale='Reds'
+            chart_data = risk_agg.head(20)
+            fig_json = bar_figure_json(
+                chart_data[group_col].astype(str).tolist(),
+                chart_data['overall_risk_score_mean'].tolist(),
+                f'Risk Scores by {admin_level}',
+                'Reds',
+                tickangle=45
             )
-            fig.update_layout(xaxis_tickangle=45)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(json.loads(fig_json), use_container_width=True)
         
         # Geographic scatter plot
         if all(col in self.borrowers_df.columns for col in ['latitude', 'longitude']):
@@ -188,7 +302,7 @@ class ExcelIntegratedDashboard:
         if 'risk_category' in self.borrowers_df.columns:
             col1, col2, col3, col4 = st.columns(4)
             
-            risk_counts = self.borrowers_df['risk_category'].value_counts()
+            risk_counts = self.borrowers_df['risk_category'].value_counts(sort=False)
             
             with col1:
                 st.metric("Low Risk", risk_counts.get('Low Risk', 0))
@@ -200,18 +314,13 @@ class ExcelIntegratedDashboard:
                 st.metric("Very High Risk", risk_counts.get('Very High Risk', 0))
             
             # Risk distribution pie chart
-            fig = px.pie(
-                values=risk_counts.values,
-                names=risk_counts.index,
-                title="Risk Category Distribution",
-                color_discrete_map={
-                    'Low Risk': '#2ecc71',
-                    'Medium Risk': '#f39c12',
-                    'High Risk': '#e74c3c',
-                    'Very High Risk': '#8e44ad'
-                }
+            fig_json = pie_figure_json(
+                risk_counts.index.astype(str).tolist(),
+                risk_counts.tolist(),
+                "Risk Category Distribution",
+                RISK_CATEGORY_COLORS
             )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(json.loads(fig_json), use_container_width=True)
         
         # Risk factor correlation analysis
         risk_columns = [col for col in self.borrowers_df.columns if 'risk' in col.lower() and 'score' in col.lower()]
@@ -219,7 +328,7 @@ class ExcelIntegratedDashboard:
         if len(risk_columns) > 1:
             st.subheader("🔗 Risk Factor Correlations")
             
-            corr_matrix = self.borrowers_df[risk_columns].corr()
+            corr_matrix = risk_correlation_matrix(self.borrowers_key, self.borrowers_df, tuple(risk_columns))
             
             fig = px.imshow(
                 corr_matrix,
@@ -258,45 +367,38 @@ class ExcelIntegratedDashboard:
         # Age distribution
         if 'age' in self.borrowers_df.columns:
             with col1:
-                fig = px.histogram(
-                    self.borrowers_df,
-                    x='age',
-                    nbins=20,
-                    title="Age Distribution",
-                    color_discrete_sequence=['#3498db']
-                )
+                centres, counts, width = histogram_counts(self.borrowers_key, 'age', self.borrowers_df['age'].to_numpy(), bins=20)
+                fig = go.Figure(go.Bar(x=centres, y=counts, width=width, marker_color='#3498db'))
+                fig.update_layout(title="Age Distribution", xaxis_title='age', yaxis_title='count', bargap=0)
                 st.plotly_chart(fig, use_container_width=True)
         
         # Education vs Risk
         if all(col in self.borrowers_df.columns for col in ['education_level', 'overall_risk_score']):
             with col2:
-                edu_risk = self.borrowers_df.groupby('education_level')['overall_risk_score'].mean().reset_index()
-                fig = px.bar(
-                    edu_risk,
-                    x='education_level',
-                    y='overall_risk_score',
-                    title="Average Risk by Education Level",
-                    color='overall_risk_score',
-                    color_continuous_scale='Reds'
+                edu_risk = group_mean(self.borrowers_key, self.borrowers_df, 'education_level', 'overall_risk_score')
+                fig_json = bar_figure_json(
+                    edu_risk['education_level'].astype(str).tolist(),
+                    edu_risk['overall_risk_score'].tolist(),
+                    "Average Risk by Education Level",
+                    'Reds',
+                    tickangle=45
                 )
-                fig.update_layout(xaxis_tickangle=45)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(json.loads(fig_json), use_container_width=True)
         
         # Occupation analysis
         if 'occupation' in self.borrowers_df.columns:
             st.subheader("💼 Occupation Analysis")
             
-            occ_counts = self.borrowers_df['occupation'].value_counts().head(10)
+            occ_counts = top_value_counts(self.borrowers_key, 'occupation', self.borrowers_df['occupation'], 10)
             
-            fig = px.bar(
-                x=occ_counts.index,
-                y=occ_counts.values,
-                title="Top 10 Occupations",
-                color=occ_counts.values,
-                color_continuous_scale='Blues'
+            fig_json = bar_figure_json(
+                occ_counts.index.astype(str).tolist(),
+                occ_counts.tolist(),
+                "Top 10 Occupations",
+                'Blues',
+                tickangle=45
             )
-            fig.update_layout(xaxis_tickangle=45)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(json.loads(fig_json), use_container_width=True)
         
         # Income distribution by risk category
         if all(col in self.borrowers_df.columns for col in ['monthly_income', 'risk_category']):
@@ -339,18 +441,16 @@ class ExcelIntegratedDashboard:
             'Age', 'Collateral Value', 'SHG Membership', 'Insurance Coverage'
         ]
         
-        importance_scores = np.random.uniform(0.1, 0.9, len(features))
-        importance_scores = sorted(importance_scores, reverse=True)
-        
-        fig = px.bar(
-            x=importance_scores,
-            y=features,
-            orientation='h',
-            title="Feature Importance for Risk Prediction",
-            color=importance_scores,
-            color_continuous_scale='Viridis'
+        importance_scores = simulated_feature_importance(len(features))
+
+        fig_json = bar_figure_json(
+            importance_scores.tolist(),
+            features,
+            "Feature Importance for Risk Prediction",
+            'Viridis',
+            orientation='h'
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(json.loads(fig_json), use_container_width=True)
         
         # Risk prediction insights
         st.subheader("💡 Key Insights")
@@ -380,6 +480,9 @@ class ExcelIntegratedDashboard:
         
         # Data status
         st.sidebar.header("📊 Data Status")
+        # One markdown element for all load messages rather than one delta per message
+        if self.load_messages:
+            st.sidebar.markdown("\n\n".join(self.load_messages))
         
         # Main content tabs
         tab1, tab2, tab3, tab4, tab5 = st.tabs([
@@ -409,10 +512,21 @@ class ExcelIntegratedDashboard:
         st.markdown("---")
         st.markdown("*Powered by AI-driven risk assessment algorithms | Tamil Nadu Micro-Finance Initiative*")
 
+def input_versions():
+    """Modification times of the Excel input and borrower CSVs (None for missing files)"""
+    return tuple(
+        os.path.getmtime(path) if os.path.exists(path) else None
+        for path in (EXCEL_PATH, *BORROWER_FILES)
+    )
+
+@st.cache_resource(max_entries=1)
+def get_dashboard(versions):
+    """Dashboard shared across reruns, reloaded whenever an input file is added, removed or rewritten"""
+    return ExcelIntegratedDashboard()
+
 def main():
     """Main application entry point"""
-    dashboard = ExcelIntegratedDashboard()
-    dashboard.run_dashboard()
+    get_dashboard(input_versions()).run_dashboard()
 
 if __name__ == "__main__":
     main()
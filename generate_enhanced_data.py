@@ -4,13 +4,49 @@ Enhanced Data Generator using Excel input for Block/Panchayat level analysis
 import pandas as pd
 import numpy as np
 import os
+import importlib.util
 from datetime import datetime
-import random
 
-# Set random seeds for reproducibility
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to pandas' CSV writer
+    pa = pa_csv = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy risk functions are used instead
+    njit = None
+
+# Prefer the Rust-based calamine reader for Excel input; otherwise use openpyxl
+EXCEL_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') else 'openpyxl'
+
+# Single seeded generator for reproducibility
 RANDOM_SEED = 42
-np.random.seed(RANDOM_SEED)
-random.seed(RANDOM_SEED)
+rng = np.random.default_rng(RANDOM_SEED)
+
+# Education risk by level; unknown levels score 0.5
+EDUCATION_RISK_MAP = {
+    'illiterate': 0.8, 'primary': 0.6, 'secondary': 0.4,
+    'higher_secondary': 0.3, 'graduate': 0.1, 'postgraduate': 0.05
+}
+EDUCATION_LEVELS = list(EDUCATION_RISK_MAP)
+
+# Risk categories: each threshold is the inclusive upper bound of its category
+RISK_THRESHOLDS = np.array([0.2, 0.4, 0.6, 0.8])
+RISK_LABELS = ['Very Low', 'Low', 'Medium', 'High', 'Very High']
+
+RISK_COMPONENTS = ['demographic_risk', 'financial_risk', 'asset_risk', 'geographic_risk', 'social_risk']
+
+def read_excel_sheets(excel_path):
+    """Read every sheet of a workbook into DataFrames keyed by sheet name"""
+    if EXCEL_ENGINE == 'calamine':
+        # Open the workbook once and read every sheet from the same handle
+        with pd.ExcelFile(excel_path, engine='calamine') as excel_file:
+            return pd.read_excel(excel_file, sheet_name=None)
+    
+    # pandas already opens openpyxl workbooks read-only with cached values
+    return pd.read_excel(excel_path, sheet_name=None, engine='openpyxl')
 
 def load_excel_data():
     """Load and analyze Excel input data"""
@@ -23,15 +59,10 @@ def load_excel_data():
         return None
     
     try:
-        # Try to read all sheets
-        excel_file = pd.ExcelFile(excel_path)
-        sheets = {}
+        sheets = read_excel_sheets(excel_path)
+        print(f"📋 Found {len(sheets)} sheets: {list(sheets)}")
         
-        print(f"📋 Found {len(excel_file.sheet_names)} sheets: {excel_file.sheet_names}")
-        
-        for sheet_name in excel_file.sheet_names:
-            df = pd.read_excel(excel_path, sheet_name=sheet_name)
-            sheets[sheet_name] = df
+        for sheet_name, df in sheets.items():
             print(f"✅ Loaded '{sheet_name}': {df.shape[0]} rows, {df.shape[1]} columns")
             
             # Show column names
@@ -76,6 +107,11 @@ def extract_geographic_hierarchy(excel_data):
     
     return hierarchy
 
+def unique_name_combinations(df, columns):
+    """Distinct combinations of stripped names in the given columns, skipping rows with missing values"""
+    names = df[columns].dropna().astype(str).apply(lambda col: col.str.strip())
+    return names.drop_duplicates().itertuples(index=False, name=None)
+
 def create_hierarchy_from_excel(df, geo_columns):
     """Create hierarchy from Excel data"""
     
@@ -83,71 +119,57 @@ def create_hierarchy_from_excel(df, geo_columns):
     
     # Extract districts
     if 'district' in geo_columns:
-        district_col = geo_columns['district']
-        unique_districts = df[district_col].dropna().unique()
+        unique_districts = unique_name_combinations(df, [geo_columns['district']])
         
-        for i, district_name in enumerate(unique_districts):
+        for i, (district_name,) in enumerate(unique_districts):
             hierarchy['districts'].append({
                 'district_id': i + 1,
-                'district_name': str(district_name).strip(),
-                'coordinates': generate_tamil_nadu_coordinates()
+                'district_name': district_name
             })
         
         print(f"📍 Extracted {len(hierarchy['districts'])} districts from Excel")
     
+    district_id_by_name = {d['district_name']: d['district_id'] for d in hierarchy['districts']}
+    
     # Extract blocks
     if 'block' in geo_columns and 'district' in geo_columns:
-        # Group by district and block
-        block_groups = df.groupby([geo_columns['district'], geo_columns['block']]).size()
+        # Distinct district/block pairs
+        block_pairs = unique_name_combinations(df, [geo_columns['district'], geo_columns['block']])
         
         block_id = 1
-        for (district_name, block_name), count in block_groups.items():
-            # Find district_id
-            district_id = None
-            for d in hierarchy['districts']:
-                if d['district_name'] == str(district_name).strip():
-                    district_id = d['district_id']
-                    break
+        for district_name, block_name in block_pairs:
+            district_id = district_id_by_name.get(district_name)
             
             if district_id:
                 hierarchy['blocks'].append({
                     'district_id': district_id,
                     'block_id': block_id,
-                    'block_name': str(block_name).strip(),
-                    'coordinates': generate_tamil_nadu_coordinates()
+                    'block_name': block_name
                 })
                 block_id += 1
         
         print(f"📍 Extracted {len(hierarchy['blocks'])} blocks from Excel")
     
+    block_id_by_key = {(b['district_id'], b['block_name']): b['block_id'] for b in hierarchy['blocks']}
+    
     # Extract panchayats
     if 'panchayat' in geo_columns and 'block' in geo_columns and 'district' in geo_columns:
-        # Group by all three levels
-        panchayat_groups = df.groupby([geo_columns['district'], geo_columns['block'], geo_columns['panchayat']]).size()
+        # Distinct district/block/panchayat triples
+        panchayat_triples = unique_name_combinations(
+            df, [geo_columns['district'], geo_columns['block'], geo_columns['panchayat']]
+        )
         
         panchayat_id = 1
-        for (district_name, block_name, panchayat_name), count in panchayat_groups.items():
-            # Find district_id and block_id
-            district_id = None
-            block_id = None
-            
-            for d in hierarchy['districts']:
-                if d['district_name'] == str(district_name).strip():
-                    district_id = d['district_id']
-                    break
-            
-            for b in hierarchy['blocks']:
-                if b['district_id'] == district_id and b['block_name'] == str(block_name).strip():
-                    block_id = b['block_id']
-                    break
+        for district_name, block_name, panchayat_name in panchayat_triples:
+            district_id = district_id_by_name.get(district_name)
+            block_id = block_id_by_key.get((district_id, block_name))
             
             if district_id and block_id:
                 hierarchy['panchayats'].append({
                     'district_id': district_id,
                     'block_id': block_id,
                     'panchayat_id': panchayat_id,
-                    'panchayat_name': str(panchayat_name).strip(),
-                    'coordinates': generate_tamil_nadu_coordinates()
+                    'panchayat_name': panchayat_name
                 })
                 panchayat_id += 1
         
@@ -155,6 +177,7 @@ def create_hierarchy_from_excel(df, geo_columns):
     
     # Fill missing levels if needed
     hierarchy = ensure_complete_hierarchy(hierarchy)
+    assign_tamil_nadu_coordinates(hierarchy)
     
     return hierarchy
 
@@ -175,45 +198,35 @@ def create_default_tamil_nadu_hierarchy():
     for i, district_name in enumerate(tn_districts):
         districts.append({
             'district_id': i + 1,
-            'district_name': district_name,
-            'coordinates': generate_tamil_nadu_coordinates()
+            'district_name': district_name
         })
     
     # Create blocks (3-5 per district)
     block_id = 1
     for district in districts:
-        num_blocks = np.random.randint(3, 6)
+        num_blocks = rng.integers(3, 6)
         for j in range(num_blocks):
             blocks.append({
                 'district_id': district['district_id'],
                 'block_id': block_id,
-                'block_name': f"{district['district_name']}_Block_{j+1:02d}",
-                'coordinates': generate_tamil_nadu_coordinates()
+                'block_name': f"{district['district_name']}_Block_{j+1:02d}"
             })
             block_id += 1
     
     # Create panchayats (5-10 per block)
     panchayat_id = 1
     for block in blocks:
-        num_panchayats = np.random.randint(5, 11)
+        num_panchayats = rng.integers(5, 11)
         for k in range(num_panchayats):
-            # Find district name
-            district_name = None
-            for d in districts:
-                if d['district_id'] == block['district_id']:
-                    district_name = d['district_name']
-                    break
-            
             panchayats.append({
                 'district_id': block['district_id'],
                 'block_id': block['block_id'],
                 'panchayat_id': panchayat_id,
-                'panchayat_name': f"{block['block_name']}_Panchayat_{k+1:02d}",
-                'coordinates': generate_tamil_nadu_coordinates()
+                'panchayat_name': f"{block['block_name']}_Panchayat_{k+1:02d}"
             })
             panchayat_id += 1
     
-    return {'districts': districts, 'blocks': blocks, 'panchayats': panchayats}
+    return assign_tamil_nadu_coordinates({'districts': districts, 'blocks': blocks, 'panchayats': panchayats})
 
 def ensure_complete_hierarchy(hierarchy):
     """Ensure all levels of hierarchy are complete"""
@@ -231,8 +244,7 @@ def ensure_complete_hierarchy(hierarchy):
                 hierarchy['blocks'].append({
                     'district_id': district['district_id'],
                     'block_id': block_id,
-                    'block_name': f"{district['district_name']}_Block_{j+1:02d}",
-                    'coordinates': generate_tamil_nadu_coordinates()
+                    'block_name': f"{district['district_name']}_Block_{j+1:02d}"
                 })
                 block_id += 1
     
@@ -245,24 +257,31 @@ def ensure_complete_hierarchy(hierarchy):
                     'district_id': block['district_id'],
                     'block_id': block['block_id'],
                     'panchayat_id': panchayat_id,
-                    'panchayat_name': f"{block['block_name']}_Panchayat_{k+1:02d}",
-                    'coordinates': generate_tamil_nadu_coordinates()
+                    'panchayat_name': f"{block['block_name']}_Panchayat_{k+1:02d}"
                 })
                 panchayat_id += 1
     
     return hierarchy
 
-def generate_tamil_nadu_coordinates():
-    """Generate coordinates within Tamil Nadu bounds"""
-    lat = np.random.uniform(8.0, 13.5)   # Tamil Nadu latitude range
-    lon = np.random.uniform(76.0, 80.5)  # Tamil Nadu longitude range
-    return (lat, lon)
+def assign_tamil_nadu_coordinates(hierarchy):
+    """Place every district, block and panchayat lacking coordinates within Tamil Nadu bounds
+    
+    All latitudes and longitudes are drawn in two bulk calls and stored as scalar fields.
+    """
+    entities = [entity for level in hierarchy.values() for entity in level if 'latitude' not in entity]
+    latitudes = rng.uniform(8.0, 13.5, len(entities))   # Tamil Nadu latitude range
+    longitudes = rng.uniform(76.0, 80.5, len(entities))  # Tamil Nadu longitude range
+    for entity, lat, lon in zip(entities, latitudes, longitudes):
+        entity['latitude'] = lat
+        entity['longitude'] = lon
+    return hierarchy
 
 def generate_enhanced_borrower_data(hierarchy):
-    """Generate enhanced borrower data with comprehensive risk factors"""
+    """Generate enhanced borrower data with comprehensive risk factors
     
-    borrowers = []
-    borrower_id = 1
+    Every field is drawn as one typed array covering all borrowers, and the DataFrame
+    is built directly from those columns.
+    """
     
     # Enhanced occupations specific to Tamil Nadu
     occupations = [
@@ -280,334 +299,393 @@ def generate_enhanced_borrower_data(hierarchy):
         'home_improvement', 'vehicle_purchase', 'emergency', 'marriage'
     ]
     
-    for panchayat in hierarchy['panchayats']:
-        # Generate 80-200 borrowers per panchayat for realistic density
-        num_borrowers = np.random.randint(80, 201)
+    panchayats = hierarchy['panchayats']
+    
+    # Generate 80-200 borrowers per panchayat for realistic density
+    borrowers_per_panchayat = rng.integers(80, 201, len(panchayats))
+    panchayat_idx = np.repeat(np.arange(len(panchayats)), borrowers_per_panchayat)
+    n = len(panchayat_idx)
+    borrower_ids = np.arange(1, n + 1, dtype=np.int32)
+    
+    # Demographic factors
+    age = rng.integers(18, 75, n, dtype=np.int32)
+    gender = pd.Categorical.from_codes(rng.integers(0, 2, n), categories=['Male', 'Female'])
+    income = generate_realistic_income(age)
+    education = pd.Categorical.from_codes(rng.integers(0, len(EDUCATION_LEVELS), n), categories=EDUCATION_LEVELS)
+    occupation = pd.Categorical.from_codes(rng.integers(0, len(occupations), n), categories=occupations)
+    family_size = rng.integers(2, 8, n, dtype=np.int32)
+    
+    # Geographic coordinates near panchayat
+    base_lat = np.array([p['latitude'] for p in panchayats])[panchayat_idx]
+    base_lon = np.array([p['longitude'] for p in panchayats])[panchayat_idx]
+    borrower_lat = base_lat + rng.normal(0, 0.01, n)  # Within ~1km
+    borrower_lon = base_lon + rng.normal(0, 0.01, n)
+    
+    # Financial factors
+    credit_history_months = rng.integers(0, 120, n, dtype=np.int32)  # 0-10 years
+    existing_loans = rng.integers(0, 4, n, dtype=np.int32)
+    has_bank_account = rng.integers(0, 2, n).astype(bool)
+    has_savings_account = has_bank_account & rng.integers(0, 2, n).astype(bool)
+    monthly_expenses = generate_realistic_expenses(income, family_size)
+    
+    # Asset ownership
+    owns_land = rng.integers(0, 2, n).astype(bool)
+    land_size_acres = np.where(owns_land, rng.uniform(0.1, 5.0, n), 0)
+    owns_livestock = rng.integers(0, 2, n).astype(bool)
+    livestock_count = np.where(owns_livestock, rng.integers(1, 20, n, dtype=np.int32), np.int32(0))
+    owns_vehicle = rng.integers(0, 2, n).astype(bool)
+    
+    # Infrastructure and geographic factors
+    distance_to_bank = rng.uniform(0.5, 25.0, n)
+    distance_to_market = rng.uniform(0.2, 30.0, n)
+    road_connectivity = rng.integers(1, 5, n, dtype=np.int8)  # 1=poor, 5=excellent
+    electricity_access = rng.integers(0, 2, n).astype(bool)
+    water_sources = ['piped', 'well', 'borewell', 'public_tap', 'river']
+    water_source = pd.Categorical.from_codes(rng.integers(0, len(water_sources), n), categories=water_sources)
+    
+    # Behavioral and social factors
+    group_membership = rng.integers(0, 2, n).astype(bool)  # SHG membership
+    government_scheme_beneficiary = rng.integers(0, 2, n).astype(bool)
+    seasonal_migration = rng.integers(0, 2, n).astype(bool)
+    mobile_phone_ownership = rng.integers(0, 2, n).astype(bool)
+    
+    # Calculate comprehensive risk scores
+    demographic_risk, financial_risk, asset_risk, geographic_risk, social_risk, overall_risk = calculate_risk_scores(
+        age, income, education, family_size, credit_history_months, existing_loans,
+        has_savings_account, monthly_expenses, owns_land, land_size_acres, owns_livestock, livestock_count,
+        distance_to_bank, distance_to_market, road_connectivity, electricity_access,
+        group_membership, government_scheme_beneficiary, mobile_phone_ownership
+    )
+    
+    # Loan characteristics based on risk profile
+    loan_amount = generate_loan_amount(income, overall_risk, owns_land, owns_livestock)
+    loan_purpose = pd.Categorical.from_codes(rng.integers(0, len(loan_purposes), n), categories=loan_purposes)
+    
+    return pd.DataFrame({
+        # Basic identifiers
+        'borrower_id': borrower_ids,
+        'district_id': np.array([p['district_id'] for p in panchayats], dtype=np.int32)[panchayat_idx],
+        'block_id': np.array([p['block_id'] for p in panchayats], dtype=np.int32)[panchayat_idx],
+        'panchayat_id': np.array([p['panchayat_id'] for p in panchayats], dtype=np.int32)[panchayat_idx],
         
-        for _ in range(num_borrowers):
-            # Demographic factors
-            age = np.random.randint(18, 75)
-            gender = random.choice(['Male', 'Female'])
-            income = generate_realistic_income(age)
-            education = random.choice(['illiterate', 'primary', 'secondary', 'higher_secondary', 'graduate', 'postgraduate'])
-            occupation = random.choice(occupations)
-            family_size = np.random.randint(2, 8)
-            
-            # Geographic coordinates near panchayat
-            base_lat, base_lon = panchayat['coordinates']
-            borrower_lat = base_lat + np.random.normal(0, 0.01)  # Within ~1km
-            borrower_lon = base_lon + np.random.normal(0, 0.01)
-            
-            # Financial factors
-            credit_history_months = np.random.randint(0, 120)  # 0-10 years
-            existing_loans = np.random.randint(0, 4)
-            has_bank_account = random.choice([True, False])
-            has_savings_account = random.choice([True, False]) if has_bank_account else False
-            monthly_expenses = generate_realistic_expenses(income, family_size)
-            
-            # Asset ownership
-            owns_land = random.choice([True, False])
-            land_size_acres = np.random.uniform(0.1, 5.0) if owns_land else 0
-            owns_livestock = random.choice([True, False])
-            livestock_count = np.random.randint(1, 20) if owns_livestock else 0
-            owns_vehicle = random.choice([True, False])
-            
-            # Infrastructure and geographic factors
-            distance_to_bank = np.random.uniform(0.5, 25.0)
-            distance_to_market = np.random.uniform(0.2, 30.0)
-            road_connectivity = np.random.randint(1, 5)  # 1=poor, 5=excellent
-            electricity_access = random.choice([True, False])
-            water_source = random.choice(['piped', 'well', 'borewell', 'public_tap', 'river'])
-            
-            # Behavioral and social factors
-            group_membership = random.choice([True, False])  # SHG membership
-            government_scheme_beneficiary = random.choice([True, False])
-            seasonal_migration = random.choice([True, False])
-            mobile_phone_ownership = random.choice([True, False])
-            
-            # Calculate comprehensive risk scores
-            demographic_risk = calculate_demographic_risk(age, income, education, family_size)
-            financial_risk = calculate_financial_risk(credit_history_months, existing_loans, has_savings_account, income, monthly_expenses)
-            asset_risk = calculate_asset_risk(owns_land, land_size_acres, owns_livestock, livestock_count)
-            geographic_risk = calculate_geographic_risk(distance_to_bank, distance_to_market, road_connectivity, electricity_access)
-            social_risk = calculate_social_risk(group_membership, government_scheme_beneficiary, mobile_phone_ownership)
-            
-            # Overall risk with weights
-            overall_risk = (
-                demographic_risk * 0.20 +
-                financial_risk * 0.30 +
-                asset_risk * 0.20 +
-                geographic_risk * 0.20 +
-                social_risk * 0.10
-            )
-            
-            # Loan characteristics based on risk profile
-            loan_amount = generate_loan_amount(income, overall_risk, owns_land, owns_livestock)
-            loan_purpose = random.choice(loan_purposes)
-            
-            borrower = {
-                # Basic identifiers
-                'borrower_id': borrower_id,
-                'district_id': panchayat['district_id'],
-                'block_id': panchayat['block_id'],
-                'panchayat_id': panchayat['panchayat_id'],
-                
-                # Personal details
-                'name': f'Borrower_{borrower_id:05d}',
-                'age': age,
-                'gender': gender,
-                'family_size': family_size,
-                'education': education,
-                'occupation': occupation,
-                
-                # Financial details
-                'monthly_income': income,
-                'monthly_expenses': monthly_expenses,
-                'credit_history_months': credit_history_months,
-                'existing_loans': existing_loans,
-                'has_bank_account': has_bank_account,
-                'has_savings_account': has_savings_account,
-                
-                # Asset ownership
-                'owns_land': owns_land,
-                'land_size_acres': round(land_size_acres, 2),
-                'owns_livestock': owns_livestock,
-                'livestock_count': livestock_count,
-                'owns_vehicle': owns_vehicle,
-                
-                # Geographic factors
-                'latitude': round(borrower_lat, 6),
-                'longitude': round(borrower_lon, 6),
-                'distance_to_bank_km': round(distance_to_bank, 1),
-                'distance_to_market_km': round(distance_to_market, 1),
-                'road_connectivity_score': road_connectivity,
-                'has_electricity': electricity_access,
-                'water_source': water_source,
-                
-                # Social factors
-                'shg_member': group_membership,
-                'govt_scheme_beneficiary': government_scheme_beneficiary,
-                'seasonal_migrant': seasonal_migration,
-                'owns_mobile_phone': mobile_phone_ownership,
-                
-                # Risk scores
-                'demographic_risk': round(demographic_risk, 4),
-                'financial_risk': round(financial_risk, 4),
-                'asset_risk': round(asset_risk, 4),
-                'geographic_risk': round(geographic_risk, 4),
-                'social_risk': round(social_risk, 4),
-                'overall_risk_score': round(overall_risk, 4),
-                'risk_category': categorize_risk(overall_risk),
-                
-                # Loan details
-                'loan_amount': loan_amount,
-                'loan_purpose': loan_purpose
-            }
-            
-            borrowers.append(borrower)
-            borrower_id += 1
-            
-    return borrowers
+        # Personal details
+        'name': [f'Borrower_{i:05d}' for i in borrower_ids],
+        'age': age,
+        'gender': gender,
+        'family_size': family_size,
+        'education': education,
+        'occupation': occupation,
+        
+        # Financial details
+        'monthly_income': income,
+        'monthly_expenses': monthly_expenses,
+        'credit_history_months': credit_history_months,
+        'existing_loans': existing_loans,
+        'has_bank_account': has_bank_account,
+        'has_savings_account': has_savings_account,
+        
+        # Asset ownership
+        'owns_land': owns_land,
+        'land_size_acres': np.round(land_size_acres, 2).astype(np.float32),
+        'owns_livestock': owns_livestock,
+        'livestock_count': livestock_count,
+        'owns_vehicle': owns_vehicle,
+        
+        # Geographic factors
+        'latitude': np.round(borrower_lat, 6),
+        'longitude': np.round(borrower_lon, 6),
+        'distance_to_bank_km': np.round(distance_to_bank, 1).astype(np.float32),
+        'distance_to_market_km': np.round(distance_to_market, 1).astype(np.float32),
+        'road_connectivity_score': road_connectivity,
+        'has_electricity': electricity_access,
+        'water_source': water_source,
+        
+        # Social factors
+        'shg_member': group_membership,
+        'govt_scheme_beneficiary': government_scheme_beneficiary,
+        'seasonal_migrant': seasonal_migration,
+        'owns_mobile_phone': mobile_phone_ownership,
+        
+        # Risk scores
+        'demographic_risk': np.round(demographic_risk, 4).astype(np.float32),
+        'financial_risk': np.round(financial_risk, 4).astype(np.float32),
+        'asset_risk': np.round(asset_risk, 4).astype(np.float32),
+        'geographic_risk': np.round(geographic_risk, 4).astype(np.float32),
+        'social_risk': np.round(social_risk, 4).astype(np.float32),
+        'overall_risk_score': np.round(overall_risk, 4).astype(np.float32),
+        'risk_category': categorize_risk(overall_risk),
+        
+        # Loan details
+        'loan_amount': loan_amount,
+        'loan_purpose': loan_purpose
+    }, copy=False)
 
 def generate_realistic_income(age):
-    """Generate realistic income based on age"""
-    if age < 25:
-        return np.random.randint(8000, 25000)
-    elif age < 45:
-        return np.random.randint(12000, 45000)
-    elif age < 60:
-        return np.random.randint(10000, 40000)
-    else:
-        return np.random.randint(5000, 20000)
+    """Generate realistic income based on age (element-wise over arrays)"""
+    age_bands = [age < 25, age < 45, age < 60]
+    low = np.select(age_bands, [8000, 12000, 10000], default=5000)
+    high = np.select(age_bands, [25000, 45000, 40000], default=20000)
+    return rng.integers(low, high, dtype=np.int32)
 
 def generate_realistic_expenses(income, family_size):
-    """Generate realistic expenses based on income and family size"""
-    base_expenses = income * np.random.uniform(0.6, 0.9)
+    """Generate realistic expenses based on income and family size (element-wise over arrays)"""
+    base_expenses = income * rng.uniform(0.6, 0.9, np.shape(income))
     family_factor = 1 + (family_size - 2) * 0.1
-    return int(base_expenses * family_factor)
+    return (base_expenses * family_factor).astype(np.int32)
 
 def generate_loan_amount(income, risk_score, owns_land, owns_livestock):
-    """Generate loan amount based on income and risk profile"""
-    base_amount = income * np.random.uniform(3, 8)  # 3-8 months of income
-    
-    # Adjust based on risk
-    risk_factor = 1.5 - risk_score  # Lower risk = higher loan
+    """Generate loan amount based on income and risk profile (element-wise over arrays)"""
+    base_amount = income * rng.uniform(3, 8, np.shape(income))  # 3-8 months of income
     
-    # Adjust based on collateral
-    if owns_land:
-        risk_factor *= 1.3
-    if owns_livestock:
-        risk_factor *= 1.1
+    # Lower risk = higher loan, adjusted upwards for collateral
+    risk_factor = (1.5 - risk_score) * np.where(owns_land, 1.3, 1.0) * np.where(owns_livestock, 1.1, 1.0)
     
-    loan_amount = int(base_amount * risk_factor)
-    return max(5000, min(500000, loan_amount))  # Cap between 5k and 5 lakh
+    loan_amount = (base_amount * risk_factor).astype(np.int32)
+    return np.clip(loan_amount, 5000, 500000)  # Cap between 5k and 5 lakh
+
+def lookup_education_risk(education):
+    """Education risk per borrower, looked up once per category and taken by category code"""
+    education = pd.Categorical(education)
+    level_risk = pd.Series(EDUCATION_RISK_MAP).reindex(education.categories).fillna(0.5).to_numpy()
+    # Missing values have code -1, which picks the trailing 0.5 default
+    return np.append(level_risk, 0.5)[education.codes]
 
 def calculate_demographic_risk(age, income, education, family_size):
-    """Calculate demographic risk component"""
+    """Calculate demographic risk component (element-wise over arrays)"""
     # Age risk (U-shaped curve)
-    if 25 <= age <= 50:
-        age_risk = 0.1
-    elif age < 25 or age > 60:
-        age_risk = 0.7
-    else:
-        age_risk = 0.4
+    age_risk = np.where((age >= 25) & (age <= 50), 0.1,
+                        np.where((age < 25) | (age > 60), 0.7, 0.4))
     
     # Income risk
-    income_risk = max(0, min(1, (30000 - income) / 30000))
+    income_risk = np.clip((30000 - income) / 30000, 0, 1)
     
     # Education risk
-    education_risk_map = {
-        'illiterate': 0.8, 'primary': 0.6, 'secondary': 0.4,
-        'higher_secondary': 0.3, 'graduate': 0.1, 'postgraduate': 0.05
-    }
-    education_risk = education_risk_map.get(education, 0.5)
+    education_risk = lookup_education_risk(education)
     
     # Family size risk
-    family_risk = min(1, max(0, (family_size - 4) * 0.1))
+    family_risk = np.clip((family_size - 4) * 0.1, 0, 1)
     
     return (age_risk + income_risk + education_risk + family_risk) / 4
 
 def calculate_financial_risk(credit_months, existing_loans, has_savings, income, expenses):
-    """Calculate financial risk component"""
+    """Calculate financial risk component (element-wise over arrays)"""
     # Credit history risk
-    credit_risk = max(0, (24 - credit_months) / 24) if credit_months < 24 else 0.1
+    credit_risk = np.where(credit_months < 24, np.maximum(0, (24 - credit_months) / 24), 0.1)
     
     # Existing loan burden
-    loan_risk = min(1, existing_loans / 3)
+    loan_risk = np.minimum(1, existing_loans / 3)
     
     # Savings risk
-    savings_risk = 0.2 if has_savings else 0.6
+    savings_risk = np.where(has_savings, 0.2, 0.6)
     
     # Income-expense ratio risk
     expense_ratio = expenses / income
-    expense_risk = max(0, min(1, (expense_ratio - 0.5) / 0.3))
+    expense_risk = np.clip((expense_ratio - 0.5) / 0.3, 0, 1)
     
     return (credit_risk + loan_risk + savings_risk + expense_risk) / 4
 
 def calculate_asset_risk(owns_land, land_size, owns_livestock, livestock_count):
-    """Calculate asset-based risk component"""
-    # Land ownership risk
-    if owns_land:
-        land_risk = max(0, (2 - land_size) / 2)  # Risk decreases with land size
-    else:
-        land_risk = 0.8
+    """Calculate asset-based risk component (element-wise over arrays)"""
+    # Land ownership risk, decreasing with land size
+    land_risk = np.where(owns_land, np.maximum(0, (2 - land_size) / 2), 0.8)
     
     # Livestock risk
-    if owns_livestock:
-        livestock_risk = max(0, (5 - livestock_count) / 5)
-    else:
-        livestock_risk = 0.6
+    livestock_risk = np.where(owns_livestock, np.maximum(0, (5 - livestock_count) / 5), 0.6)
     
     return (land_risk + livestock_risk) / 2
 
 def calculate_geographic_risk(bank_distance, market_distance, road_score, has_electricity):
-    """Calculate geographic risk component"""
+    """Calculate geographic risk component (element-wise over arrays)"""
     # Distance risks
-    bank_risk = min(1, bank_distance / 20)
-    market_risk = min(1, market_distance / 25)
+    bank_risk = np.minimum(1, bank_distance / 20)
+    market_risk = np.minimum(1, market_distance / 25)
     
     # Infrastructure risks
     road_risk = (5 - road_score) / 4
-    electricity_risk = 0.2 if has_electricity else 0.6
+    electricity_risk = np.where(has_electricity, 0.2, 0.6)
     
     return (bank_risk + market_risk + road_risk + electricity_risk) / 4
 
 def calculate_social_risk(shg_member, govt_beneficiary, mobile_phone):
-    """Calculate social risk component"""
-    shg_risk = 0.2 if shg_member else 0.6
-    govt_risk = 0.3 if govt_beneficiary else 0.5
-    mobile_risk = 0.1 if mobile_phone else 0.7
+    """Calculate social risk component (element-wise over arrays)"""
+    shg_risk = np.where(shg_member, 0.2, 0.6)
+    govt_risk = np.where(govt_beneficiary, 0.3, 0.5)
+    mobile_risk = np.where(mobile_phone, 0.1, 0.7)
     
     return (shg_risk + govt_risk + mobile_risk) / 3
 
-def categorize_risk(score):
-    """Categorize risk score into levels"""
-    if score <= 0.2:
-        return "Very Low"
-    elif score <= 0.4:
-        return "Low"
-    elif score <= 0.6:
-        return "Medium"
-    elif score <= 0.8:
-        return "High"
-    else:
-        return "Very High"
+if njit is not None:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _fused_risk_kernel(age, income, education_risk, family_size, credit_months, existing_loans,
+                           has_savings, expenses, owns_land, land_size, owns_livestock, livestock_count,
+                           bank_distance, market_distance, road_score, has_electricity,
+                           shg_member, govt_beneficiary, mobile_phone, out):
+        """Per-borrower loop computing all risk components in one pass; columns of out are
+        demographic, financial, asset, geographic, social and overall risk"""
+        for i in prange(age.shape[0]):
+            # Demographic risk
+            if 25 <= age[i] <= 50:
+                age_risk = 0.1
+            elif age[i] < 25 or age[i] > 60:
+                age_risk = 0.7
+            else:
+                age_risk = 0.4
+            income_risk = min(1.0, max(0.0, (30000 - income[i]) / 30000))
+            family_risk = min(1.0, max(0.0, (family_size[i] - 4) * 0.1))
+            demographic = (age_risk + income_risk + education_risk[i] + family_risk) / 4
+            
+            # Financial risk
+            credit_risk = max(0.0, (24 - credit_months[i]) / 24) if credit_months[i] < 24 else 0.1
+            loan_risk = min(1.0, existing_loans[i] / 3)
+            savings_risk = 0.2 if has_savings[i] else 0.6
+            expense_risk = min(1.0, max(0.0, (expenses[i] / income[i] - 0.5) / 0.3))
+            financial = (credit_risk + loan_risk + savings_risk + expense_risk) / 4
+            
+            # Asset risk
+            land_risk = max(0.0, (2 - land_size[i]) / 2) if owns_land[i] else 0.8
+            livestock_risk = max(0.0, (5 - livestock_count[i]) / 5) if owns_livestock[i] else 0.6
+            asset = (land_risk + livestock_risk) / 2
+            
+            # Geographic risk
+            bank_risk = min(1.0, bank_distance[i] / 20)
+            market_risk = min(1.0, market_distance[i] / 25)
+            road_risk = (5 - road_score[i]) / 4
+            electricity_risk = 0.2 if has_electricity[i] else 0.6
+            geographic = (bank_risk + market_risk + road_risk + electricity_risk) / 4
+            
+            # Social risk
+            social = ((0.2 if shg_member[i] else 0.6) +
+                      (0.3 if govt_beneficiary[i] else 0.5) +
+                      (0.1 if mobile_phone[i] else 0.7)) / 3
+            
+            out[i, 0] = demographic
+            out[i, 1] = financial
+            out[i, 2] = asset
+            out[i, 3] = geographic
+            out[i, 4] = social
+            out[i, 5] = (demographic * 0.20 + financial * 0.30 + asset * 0.20 +
+                         geographic * 0.20 + social * 0.10)
+
+def calculate_risk_scores(age, income, education, family_size, credit_months, existing_loans,
+                          has_savings, expenses, owns_land, land_size, owns_livestock, livestock_count,
+                          bank_distance, market_distance, road_score, has_electricity,
+                          shg_member, govt_beneficiary, mobile_phone):
+    """Calculate all risk components and the weighted overall risk
+    
+    Returns (demographic, financial, asset, geographic, social, overall) arrays, computed by
+    the Numba kernel when numba is installed and by the NumPy component functions otherwise.
+    """
+    if njit is not None:
+        out = np.empty((len(age), 6), dtype=np.float64)
+        _fused_risk_kernel(
+            age, income, lookup_education_risk(education), family_size, credit_months, existing_loans,
+            has_savings, expenses, owns_land, land_size, owns_livestock, livestock_count,
+            bank_distance, market_distance, road_score, has_electricity,
+            shg_member, govt_beneficiary, mobile_phone, out
+        )
+        return tuple(out.T)
+    
+    demographic_risk = calculate_demographic_risk(age, income, education, family_size)
+    financial_risk = calculate_financial_risk(credit_months, existing_loans, has_savings, income, expenses)
+    asset_risk = calculate_asset_risk(owns_land, land_size, owns_livestock, livestock_count)
+    geographic_risk = calculate_geographic_risk(bank_distance, market_distance, road_score, has_electricity)
+    social_risk = calculate_social_risk(shg_member, govt_beneficiary, mobile_phone)
+    
+    # Overall risk with weights
+    overall_risk = (
+        demographic_risk * 0.20 +
+        financial_risk * 0.30 +
+        asset_risk * 0.20 +
+        geographic_risk * 0.20 +
+        social_risk * 0.10
+    )
+    return demographic_risk, financial_risk, asset_risk, geographic_risk, social_risk, overall_risk
+
+def categorize_risk(scores):
+    """Categorize risk scores into levels (element-wise over arrays)"""
+    codes = np.searchsorted(RISK_THRESHOLDS, scores, side='left')
+    return pd.Categorical.from_codes(codes, categories=RISK_LABELS)
+
+def rollup_partials(partials, keys):
+    """Combine partial sums from a finer administrative level into coarser groups"""
+    how = {col: 'sum' for col in partials.columns}
+    how['min_risk_score'] = 'min'
+    how['max_risk_score'] = 'max'
+    return partials.groupby(level=keys, sort=False).agg(how)
+
+def summarize_partials(partials):
+    """Turn partial sums (count, sum, sum of squares, min/max) into the published aggregate columns"""
+    n = partials['num_borrowers']
+    summary = pd.DataFrame(index=partials.index)
+    summary['avg_risk_score'] = partials['risk_sum'] / n
+    # Sample standard deviation from the sum of squares; undefined for single-borrower groups
+    variance = (partials['risk_sumsq'] - n * summary['avg_risk_score'] ** 2) / (n - 1)
+    summary['risk_score_std'] = np.sqrt(variance.clip(lower=0)).where(n > 1)
+    summary['min_risk_score'] = partials['min_risk_score']
+    summary['max_risk_score'] = partials['max_risk_score']
+    for component in RISK_COMPONENTS:
+        summary[f'avg_{component}'] = partials[f'{component}_sum'] / n
+    summary['num_borrowers'] = n
+    summary['total_loan_volume'] = partials['total_loan_volume']
+    summary['avg_income'] = partials['income_sum'] / n
+    return summary
 
 def create_aggregations(borrowers_df):
-    """Create administrative level aggregations"""
+    """Create administrative level aggregations
+    
+    Borrowers are scanned once, at panchayat level, into additive partial sums;
+    blocks are rolled up from panchayat partials and districts from block partials.
+    """
     
     aggregations = {}
     
+    # Panchayat level partial sums: the only pass over individual borrowers
+    columns = ['district_id', 'block_id', 'panchayat_id', 'borrower_id', 'overall_risk_score',
+               *RISK_COMPONENTS, 'loan_amount', 'monthly_income', 'land_size_acres', 'distance_to_bank_km']
+    panchayat_partials = borrowers_df[columns].assign(
+        overall_risk_score_sq=borrowers_df['overall_risk_score'].astype(np.float64) ** 2
+    ).groupby(['district_id', 'block_id', 'panchayat_id'], sort=False, observed=True).agg(
+        num_borrowers=('borrower_id', 'count'),
+        risk_sum=('overall_risk_score', 'sum'),
+        risk_sumsq=('overall_risk_score_sq', 'sum'),
+        min_risk_score=('overall_risk_score', 'min'),
+        max_risk_score=('overall_risk_score', 'max'),
+        **{f'{component}_sum': (component, 'sum') for component in RISK_COMPONENTS},
+        total_loan_volume=('loan_amount', 'sum'),
+        income_sum=('monthly_income', 'sum'),
+        land_size_sum=('land_size_acres', 'sum'),
+        bank_distance_sum=('distance_to_bank_km', 'sum')
+    )
+    
     # Panchayat level aggregation
-    panchayat_agg = borrowers_df.groupby(['district_id', 'block_id', 'panchayat_id']).agg({
-        'overall_risk_score': ['mean', 'std', 'min', 'max'],
-        'demographic_risk': 'mean',
-        'financial_risk': 'mean',
-        'asset_risk': 'mean',
-        'geographic_risk': 'mean',
-        'social_risk': 'mean',
-        'borrower_id': 'count',
-        'loan_amount': 'sum',
-        'monthly_income': 'mean',
-        'land_size_acres': 'mean',
-        'distance_to_bank_km': 'mean'
-    }).round(4)
-    
-    panchayat_agg.columns = [
-        'avg_risk_score', 'risk_score_std', 'min_risk_score', 'max_risk_score',
-        'avg_demographic_risk', 'avg_financial_risk', 'avg_asset_risk', 'avg_geographic_risk', 'avg_social_risk',
-        'num_borrowers', 'total_loan_volume', 'avg_income', 'avg_land_size', 'avg_bank_distance'
-    ]
-    panchayat_agg = panchayat_agg.reset_index()
-    panchayat_agg['risk_level'] = panchayat_agg['avg_risk_score'].apply(categorize_risk)
+    panchayat_agg = summarize_partials(panchayat_partials)
+    panchayat_agg['avg_land_size'] = panchayat_partials['land_size_sum'] / panchayat_partials['num_borrowers']
+    panchayat_agg['avg_bank_distance'] = panchayat_partials['bank_distance_sum'] / panchayat_partials['num_borrowers']
+    panchayat_agg = panchayat_agg.round(4).reset_index()
+    panchayat_agg['risk_level'] = categorize_risk(panchayat_agg['avg_risk_score'].to_numpy())
     aggregations['panchayat'] = panchayat_agg
     
     # Block level aggregation
-    block_agg = borrowers_df.groupby(['district_id', 'block_id']).agg({
-        'overall_risk_score': ['mean', 'std', 'min', 'max'],
-        'demographic_risk': 'mean',
-        'financial_risk': 'mean',
-        'asset_risk': 'mean',
-        'geographic_risk': 'mean',
-        'social_risk': 'mean',
-        'borrower_id': 'count',
-        'loan_amount': 'sum',
-        'monthly_income': 'mean'
-    }).round(4)
-    
-    block_agg.columns = [
-        'avg_risk_score', 'risk_score_std', 'min_risk_score', 'max_risk_score',
-        'avg_demographic_risk', 'avg_financial_risk', 'avg_asset_risk', 'avg_geographic_risk', 'avg_social_risk',
-        'num_borrowers', 'total_loan_volume', 'avg_income'
-    ]
-    block_agg = block_agg.reset_index()
-    block_agg['risk_level'] = block_agg['avg_risk_score'].apply(categorize_risk)
+    block_partials = rollup_partials(panchayat_partials, ['district_id', 'block_id'])
+    block_agg = summarize_partials(block_partials).round(4).reset_index()
+    block_agg['risk_level'] = categorize_risk(block_agg['avg_risk_score'].to_numpy())
     aggregations['block'] = block_agg
     
     # District level aggregation
-    district_agg = borrowers_df.groupby('district_id').agg({
-        'overall_risk_score': ['mean', 'std', 'min', 'max'],
-        'demographic_risk': 'mean',
-        'financial_risk': 'mean',
-        'asset_risk': 'mean',
-        'geographic_risk': 'mean',
-        'social_risk': 'mean',
-        'borrower_id': 'count',
-        'loan_amount': 'sum',
-        'monthly_income': 'mean'
-    }).round(4)
-    
-    district_agg.columns = [
-        'avg_risk_score', 'risk_score_std', 'min_risk_score', 'max_risk_score',
-        'avg_demographic_risk', 'avg_financial_risk', 'avg_asset_risk', 'avg_geographic_risk', 'avg_social_risk',
-        'num_borrowers', 'total_loan_volume', 'avg_income'
-    ]
-    district_agg = district_agg.reset_index()
-    district_agg['risk_level'] = district_agg['avg_risk_score'].apply(categorize_risk)
+    district_partials = rollup_partials(block_partials, ['district_id'])
+    district_agg = summarize_partials(district_partials).round(4).reset_index()
+    district_agg['risk_level'] = categorize_risk(district_agg['avg_risk_score'].to_numpy())
     aggregations['district'] = district_agg
     
     return aggregations
 
+def write_csv(df, path):
+    """Write a DataFrame to CSV, using pyarrow's multithreaded writer when available"""
+    if pa_csv is None:
+        df.to_csv(path, index=False)
+    else:
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
 def main():
     """Main function to generate enhanced data using Excel input"""
     
@@ -638,12 +716,15 @@ def main():
     
     # Generate borrower data
     print(f"\n👥 Generating enhanced borrower data...")
-    borrowers = generate_enhanced_borrower_data(hierarchy)
-    borrowers_df = pd.DataFrame(borrowers)
+    borrowers_df = generate_enhanced_borrower_data(hierarchy)
     
-    # Save borrower data
-    borrowers_df.to_csv('data/borrowers_enhanced.csv', index=False)
-    borrowers_df.to_csv('results/individual_risk_scores.csv', index=False)
+    # Save borrower data: zstd Parquet for the intermediate copy, CSV for downstream readers
+    if pa is not None:
+        borrowers_df.to_parquet('data/borrowers_enhanced.parquet', compression='zstd', compression_level=3, index=False)
+        print("✅ Saved data/borrowers_enhanced.parquet")
+    else:
+        write_csv(borrowers_df, 'data/borrowers_enhanced.csv')
+    write_csv(borrowers_df, 'results/individual_risk_scores.csv')
     print(f"✅ Generated {len(borrowers_df):,} borrower records")
     
     # Create aggregations
@@ -651,7 +732,7 @@ def main():
     aggregations = create_aggregations(borrowers_df)
     
     for level, agg_df in aggregations.items():
-        agg_df.to_csv(f'results/{level}_risk_aggregation.csv', index=False)
+        write_csv(agg_df, f'results/{level}_risk_aggregation.csv')
         print(f"✅ Saved results/{level}_risk_aggregation.csv")
     
     # Print comprehensive summary
@@ -4,13 +4,110 @@ Simple test to generate sample data
 import pandas as pd
 import numpy as np
 import os
+import shutil
 from datetime import datetime
-import random
 
-# Set random seeds for reproducibility
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to pandas' CSV writer
+    pa = pa_csv = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy risk expression is used instead
+    njit = None
+
+# Single seeded generator for reproducibility
 RANDOM_SEED = 42
-np.random.seed(RANDOM_SEED)
-random.seed(RANDOM_SEED)
+rng = np.random.default_rng(RANDOM_SEED)
+
+# Right-closed risk buckets: a score equal to an edge falls in the lower band
+RISK_BINS = [-np.inf, 0.2, 0.4, 0.6, 0.8, np.inf]
+RISK_LABELS = ["Very Low", "Low", "Medium", "High", "Very High"]
+
+# Low-cardinality borrower attributes, stored as categorical codes
+EDUCATION_LEVELS = ["none", "primary", "secondary", "higher"]
+OCCUPATIONS = ["farmer", "laborer", "shopkeeper", "service", "unemployed"]
+GENDERS = ["Male", "Female"]
+
+# Education risk by level, aligned with EDUCATION_LEVELS
+EDUCATION_RISK = np.array([1.0, 0.7, 0.4, 0.2])
+
+# Per-borrower columns filled district by district, with their storage dtypes
+BORROWER_COLUMNS = {
+    "district_id": np.int16,
+    "block_id": np.int16,
+    "age": np.int8,
+    "gender_code": np.int8,
+    "income": np.int32,
+    "education_code": np.int8,
+    "occupation_code": np.int8,
+    "credit_history": np.float64,
+    "existing_loans": np.int8,
+    "has_savings_account": np.bool_,
+    "monthly_expenses": np.int32,
+    "latitude": np.float64,
+    "longitude": np.float64,
+    "total_loan_amount": np.int32,
+}
+
+def write_csv(df, path):
+    """Write a DataFrame to CSV, using pyarrow's multithreaded writer when available"""
+    if pa_csv is None:
+        df.to_csv(path, index=False)
+    else:
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+
+if njit is not None:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _risk_kernel(ages, incomes, education_codes, credit_history, education_risk, out):
+        """Per-borrower loop computing the overall risk score without temporaries"""
+        for i in prange(ages.shape[0]):
+            age_risk = 0.5 if 25 <= ages[i] <= 45 else 0.8
+            income_risk = max(0.0, 1 - incomes[i] / 150000)
+            credit_risk = max(0.0, 1 - credit_history[i] / 10)
+            out[i] = (age_risk + income_risk + education_risk[education_codes[i]] + credit_risk) / 4
+
+def calculate_risk_scores(ages, incomes, education_codes, credit_history):
+    """Overall risk as the mean of age, income, education and credit risk
+    
+    Uses the Numba kernel when numba is installed and NumPy array expressions otherwise.
+    """
+    if njit is not None:
+        out = np.empty(len(ages), dtype=np.float64)
+        _risk_kernel(ages, incomes, education_codes, credit_history, EDUCATION_RISK, out)
+        return out
+    
+    age_risk = np.where((ages >= 25) & (ages <= 45), 0.5, 0.8)
+    income_risk = np.maximum(0, 1 - incomes / 150000)
+    education_risk = EDUCATION_RISK[education_codes]
+    credit_risk = np.maximum(0, 1 - credit_history / 10)
+    return (age_risk + income_risk + education_risk + credit_risk) / 4
+
+def iter_district_borrowers(districts, borrowers_per_district):
+    """Yield (row slice, column chunk) pairs, one district's borrowers at a time"""
+    n = borrowers_per_district
+    for k, district in enumerate(districts):
+        district_id = district["district_id"]
+        base_lat, base_lon = district["coordinates"]
+        yield slice(k * n, (k + 1) * n), {
+            "district_id": district_id,
+            "block_id": (district_id - 1) * 3 + rng.integers(1, 4, n, dtype=np.int16),  # 3 blocks per district
+            "age": rng.integers(18, 65, n, dtype=np.int8),
+            "gender_code": rng.integers(0, len(GENDERS), n, dtype=np.int8),
+            "income": rng.integers(10000, 150000, n, dtype=np.int32),
+            "education_code": rng.integers(0, len(EDUCATION_LEVELS), n, dtype=np.int8),
+            "occupation_code": rng.integers(0, len(OCCUPATIONS), n, dtype=np.int8),
+            "credit_history": rng.uniform(0, 10, n),
+            "existing_loans": rng.integers(0, 5, n, dtype=np.int8),
+            "has_savings_account": rng.choice([True, False], n),
+            "monthly_expenses": rng.integers(5000, 80000, n, dtype=np.int32),
+            # Geographic coordinates near district center
+            "latitude": base_lat + rng.normal(0, 0.1, n),
+            "longitude": base_lon + rng.normal(0, 0.1, n),
+            "total_loan_amount": rng.integers(5000, 100000, n, dtype=np.int32),
+        }
 
 def generate_sample_data():
     """Generate a small sample dataset for testing"""
@@ -27,8 +124,8 @@ def generate_sample_data():
             "district_id": i,
             "district_name": f"District_{i:02d}",
             "coordinates": (
-                np.random.uniform(8.0, 13.5),  # Tamil Nadu latitude range
-                np.random.uniform(76.0, 80.5)  # Tamil Nadu longitude range
+                rng.uniform(8.0, 13.5),  # Tamil Nadu latitude range
+                rng.uniform(76.0, 80.5)  # Tamil Nadu longitude range
             )
         })
     
@@ -36,100 +133,68 @@ def generate_sample_data():
     districts_df.to_csv("data/districts.csv", index=False)
     print(f"✅ Generated {len(districts_df)} districts")
     
-    # Generate borrowers (100 per district)
-    borrowers = []
-    borrower_id = 1
+    # Generate borrowers (100 per district) into preallocated, compactly typed columns
+    borrowers_per_district = 100
+    n_borrowers = len(districts) * borrowers_per_district
+    cols = {name: np.empty(n_borrowers, dtype=dtype) for name, dtype in BORROWER_COLUMNS.items()}
+    for rows, chunk in iter_district_borrowers(districts, borrowers_per_district):
+        for name, values in chunk.items():
+            cols[name][rows] = values
     
-    for district in districts:
-        for _ in range(100):
-            # Basic borrower data
-            age = np.random.randint(18, 65)
-            income = np.random.randint(10000, 150000)
-            education = random.choice(["none", "primary", "secondary", "higher"])
-            occupation = random.choice(["farmer", "laborer", "shopkeeper", "service", "unemployed"])
-            
-            # Geographic coordinates near district center
-            base_lat, base_lon = district["coordinates"]
-            borrower_lat = base_lat + np.random.normal(0, 0.1)
-            borrower_lon = base_lon + np.random.normal(0, 0.1)
-            
-            # Risk factors
-            credit_history = np.random.uniform(0, 10)
-            existing_loans = np.random.randint(0, 5)
-            has_savings = random.choice([True, False])
-            monthly_expenses = np.random.randint(5000, 80000)
-            
-            # Calculate simple risk score
-            risk_factors = {
-                "age_risk": 0.5 if 25 <= age <= 45 else 0.8,
-                "income_risk": max(0, 1 - income / 150000),
-                "education_risk": {"none": 1.0, "primary": 0.7, "secondary": 0.4, "higher": 0.2}[education],
-                "credit_risk": max(0, 1 - credit_history / 10)
-            }
-            
-            overall_risk = sum(risk_factors.values()) / len(risk_factors)
-            
-            borrower = {
-                "borrower_id": borrower_id,
-                "district_id": district["district_id"],
-                "block_id": (district["district_id"] - 1) * 3 + np.random.randint(1, 4),  # 3 blocks per district
-                "panchayat_id": borrower_id,  # Simplified
-                "name": f"Borrower_{borrower_id:04d}",
-                "age": age,
-                "gender": random.choice(["Male", "Female"]),
-                "income": income,
-                "education": education,
-                "occupation": occupation,
-                "credit_history": credit_history,
-                "existing_loans": existing_loans,
-                "has_savings_account": has_savings,
-                "monthly_expenses": monthly_expenses,
-                "latitude": borrower_lat,
-                "longitude": borrower_lon,
-                "overall_risk_score": overall_risk,
-                "risk_category": (
-                    "Very Low" if overall_risk <= 0.2 else
-                    "Low" if overall_risk <= 0.4 else
-                    "Medium" if overall_risk <= 0.6 else
-                    "High" if overall_risk <= 0.8 else
-                    "Very High"
-                ),
-                "total_loan_amount": np.random.randint(5000, 100000)
-            }
-            borrowers.append(borrower)
-            borrower_id += 1
+    # Calculate simple risk score
+    overall_risk = calculate_risk_scores(cols["age"], cols["income"], cols["education_code"], cols["credit_history"])
     
-    borrowers_df = pd.DataFrame(borrowers)
-    borrowers_df.to_csv("data/borrowers.csv", index=False)
+    borrower_ids = np.arange(1, n_borrowers + 1, dtype=np.int32)
+    borrowers_df = pd.DataFrame({
+        "borrower_id": borrower_ids,
+        "district_id": cols["district_id"],
+        "block_id": cols["block_id"],
+        "panchayat_id": borrower_ids,  # Simplified
+        "name": [f"Borrower_{i:04d}" for i in borrower_ids],
+        "age": cols["age"],
+        "gender": pd.Categorical.from_codes(cols["gender_code"], categories=GENDERS),
+        "income": cols["income"],
+        "education": pd.Categorical.from_codes(cols["education_code"], categories=EDUCATION_LEVELS, ordered=True),
+        "occupation": pd.Categorical.from_codes(cols["occupation_code"], categories=OCCUPATIONS),
+        "credit_history": cols["credit_history"],
+        "existing_loans": cols["existing_loans"],
+        "has_savings_account": cols["has_savings_account"],
+        "monthly_expenses": cols["monthly_expenses"],
+        "latitude": cols["latitude"],
+        "longitude": cols["longitude"],
+        "overall_risk_score": overall_risk,
+        "risk_category": pd.cut(overall_risk, bins=RISK_BINS, labels=RISK_LABELS),
+        "total_loan_amount": cols["total_loan_amount"]
+    }, copy=False)
+    write_csv(borrowers_df, "data/borrowers.csv")
     print(f"✅ Generated {len(borrowers_df)} borrowers")
     
     # Generate district-level risk aggregation
-    district_risk = borrowers_df.groupby("district_id").agg({
-        "overall_risk_score": ["mean", "std", "min", "max"],
-        "borrower_id": "count",
-        "total_loan_amount": "sum"
-    }).round(4)
-    
-    district_risk.columns = [
-        "avg_risk_score", "risk_score_std", "min_risk_score", "max_risk_score",
-        "num_borrowers", "total_loan_volume"
-    ]
-    district_risk = district_risk.reset_index()
-    district_risk["risk_level"] = district_risk["avg_risk_score"].apply(
-        lambda x: (
-            "Very Low" if x <= 0.2 else
-            "Low" if x <= 0.4 else
-            "Medium" if x <= 0.6 else
-            "High" if x <= 0.8 else
-            "Very High"
+    district_risk = (
+        borrowers_df.groupby("district_id", sort=False)
+        .agg(
+            avg_risk_score=("overall_risk_score", "mean"),
+            risk_score_std=("overall_risk_score", "std"),
+            min_risk_score=("overall_risk_score", "min"),
+            max_risk_score=("overall_risk_score", "max"),
+            num_borrowers=("borrower_id", "count"),
+            total_loan_volume=("total_loan_amount", "sum")
         )
+        .round(4)
+        .reset_index()
     )
+    district_risk["risk_level"] = pd.cut(district_risk["avg_risk_score"], bins=RISK_BINS, labels=RISK_LABELS)
     
-    district_risk.to_csv("results/district_risk_aggregation.csv", index=False)
+    write_csv(district_risk, "results/district_risk_aggregation.csv")
     print(f"✅ Generated district risk aggregation")
     
-    # Save individual risk scores
-    borrowers_df.to_csv("results/individual_risk_scores.csv", index=False)
+    # Save individual risk scores (same content as data/borrowers.csv)
+    # A byte copy rather than a hardlink: other scripts rewrite the results file in place,
+    # which through a shared inode would also overwrite data/borrowers.csv. Unlink first in
+    # case an earlier run left the two paths hardlinked (copyfile refuses to copy a file onto itself)
+    if os.path.exists("results/individual_risk_scores.csv"):
+        os.remove("results/individual_risk_scores.csv")
+    shutil.copyfile("data/borrowers.csv", "results/individual_risk_scores.csv")
     print(f"✅ Generated individual risk scores")
     
     # Print summary
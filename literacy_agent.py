@@ -8,26 +8,99 @@ Usage:
     python literacy_agent.py --input input.xlsx --output output_with_literacy.xlsx
 
 Notes:
-- The script searches Wikipedia for the place, fetches the page HTML, and looks for
-  literacy values in the infobox (rows with 'Literacy') or elsewhere on the page.
+- The script searches Wikipedia for the place, fetches the lead section via the
+  MediaWiki parse API, and looks for literacy values in the infobox (rows with
+  'Literacy'). If none is found it fetches the full article and scans the body.
+- When requests-cache is installed, API responses are kept in
+  literacy_wiki_cache.sqlite for a week so reruns skip the network.
 """
 from __future__ import annotations
 
 import argparse
-import time
-import urllib.parse
+import importlib.util
 import re
-from typing import Optional, Dict, Any, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import numpy as np
 import pandas as pd
-
-WIKI_SEARCH_URL = "https://en.wikipedia.org/w/api.php"
-WIKI_BASE = "https://en.wikipedia.org/wiki/"
-
-
-def wiki_search(title: str) -> Optional[Dict[str, Any]]:
+from selectolax.lexbor import LexborHTMLParser
+
+try:
+    import requests_cache
+except ImportError:  # responses are simply not cached between runs
+    requests_cache = None
+
+WIKI_API_URL = "https://en.wikipedia.org/w/api.php"
+MAX_WORKERS = 4
+# all threads together start at most one API request per interval (the old serial loop's sleep)
+MIN_REQUEST_INTERVAL = 0.1
+# HTTP 429 responses are retried after Retry-After (or exponential backoff) this many times
+RATE_LIMIT_RETRIES = 3
+WIKI_CACHE_NAME = "literacy_wiki_cache"
+WIKI_CACHE_EXPIRE_SECONDS = 7 * 24 * 3600
+# xlsxwriter streams rows out; openpyxl builds the whole workbook in memory
+EXCEL_WRITER_ENGINE = "xlsxwriter" if importlib.util.find_spec("xlsxwriter") else "openpyxl"
+
+# lookup notes for network failures; these results are not memoized so a later call retries
+TRANSIENT_NOTES = ("search-error", "failed-fetch-page", "rate-limited")
+
+PCT_RE = re.compile(r"(\d{1,3}(?:\.\d+)?)\s*%")
+PAREN_YEAR_RE = re.compile(r"\((\d{4})\)")
+YEAR_RE = re.compile(r"(\d{4})")
+
+
+def make_session() -> requests.Session:
+    # one keep-alive pool shared by all lookup threads; reruns hit the sqlite cache
+    if requests_cache is not None:
+        session = requests_cache.CachedSession(
+            WIKI_CACHE_NAME, backend="sqlite", expire_after=WIKI_CACHE_EXPIRE_SECONDS
+        )
+    else:
+        session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+    session.headers.update({"User-Agent": "literacy-agent/1.0"})
+    return session
+
+
+SESSION = make_session()
+
+_THROTTLE_LOCK = threading.Lock()
+_next_request_time = 0.0
+
+
+class RateLimitedError(Exception):
+    """Wikipedia kept answering HTTP 429 after every retry."""
+
+
+def throttle() -> None:
+    # reserve the next request slot under the lock, then sleep outside it
+    global _next_request_time
+    with _THROTTLE_LOCK:
+        now = time.monotonic()
+        wait = _next_request_time - now
+        _next_request_time = max(now, _next_request_time) + MIN_REQUEST_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
+
+
+def wiki_get(params: Dict[str, Any], session: requests.Session = SESSION) -> requests.Response:
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        throttle()
+        r = session.get(WIKI_API_URL, params=params, timeout=30)
+        if r.status_code != 429:
+            return r
+        if attempt < RATE_LIMIT_RETRIES:
+            retry_after = r.headers.get("Retry-After", "")
+            time.sleep(float(retry_after) if retry_after.isdigit() else 2 ** attempt)
+    raise RateLimitedError(f"HTTP 429 after {RATE_LIMIT_RETRIES} retries")
+
+
+def wiki_search(title: str, session: requests.Session = SESSION) -> Optional[Dict[str, Any]]:
     params = {
         "action": "query",
         "list": "search",
@@ -35,7 +108,7 @@ def wiki_search(title: str) -> Optional[Dict[str, Any]]:
         "format": "json",
         "srlimit": 1,
     }
-    r = requests.get(WIKI_SEARCH_URL, params=params, timeout=30, headers={"User-Agent": "literacy-agent/1.0"})
+    r = wiki_get(params, session)
     r.raise_for_status()
     data = r.json()
     items = data.get("query", {}).get("search", [])
@@ -44,17 +117,31 @@ def wiki_search(title: str) -> Optional[Dict[str, Any]]:
     return items[0]
 
 
-def fetch_wiki_html(page_title: str) -> Optional[str]:
-    url = WIKI_BASE + urllib.parse.quote(page_title.replace(" ", "_"))
-    r = requests.get(url, timeout=30, headers={"User-Agent": "literacy-agent/1.0"})
+def fetch_wiki_html(page_title: str, section: Optional[int] = None, session: requests.Session = SESSION) -> Optional[str]:
+    # rendered article body only (no skin/navigation); section=0 is the lead + infobox
+    params = {
+        "action": "parse",
+        "page": page_title,
+        "prop": "text",
+        "redirects": 1,
+        "disableeditsection": 1,
+        "format": "json",
+        "formatversion": 2,
+    }
+    if section is not None:
+        params["section"] = section
+    r = wiki_get(params, session)
     if r.status_code != 200:
         return None
-    return r.text
+    data = r.json()
+    if "error" in data:
+        return None
+    return data.get("parse", {}).get("text")
 
 
 def extract_percentage(text: str) -> Optional[float]:
     # find first percentage like 74.04% or 74%
-    m = re.search(r"(\d{1,3}(?:\.\d+)?)\s*%", text)
+    m = PCT_RE.search(text)
     if not m:
         return None
     try:
@@ -63,24 +150,24 @@ def extract_percentage(text: str) -> Optional[float]:
         return None
 
 
-def parse_infobox_for_literacy(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+def parse_infobox_for_literacy(tree: LexborHTMLParser) -> Optional[Dict[str, Any]]:
     # infobox tables usually have class 'infobox'
-    table = soup.find("table", class_=lambda c: c and "infobox" in c)
-    if not table:
+    table = tree.css_first("table.infobox")
+    if table is None:
         return None
 
-    for tr in table.find_all("tr"):
-        th = tr.find("th")
-        td = tr.find("td")
-        if not th or not td:
+    for tr in table.css("tr"):
+        th = tr.css_first("th")
+        td = tr.css_first("td")
+        if th is None or td is None:
             continue
-        label = th.get_text(separator=" ", strip=True).lower()
+        label = th.text(separator=" ", strip=True).lower()
         if "literacy" in label or "literates" in label:
-            text = td.get_text(separator=" ", strip=True)
+            text = td.text(separator=" ", strip=True)
             pct = extract_percentage(text)
             year = None
             # try to find a year in parentheses near the value
-            ym = re.search(r"\((\d{4})\)", text)
+            ym = PAREN_YEAR_RE.search(text)
             if ym:
                 year = int(ym.group(1))
             return {"literacy": pct, "year": year, "source": "wikipedia-infobox", "raw": text}
@@ -88,14 +175,15 @@ def parse_infobox_for_literacy(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
     return None
 
 
-def parse_body_for_literacy(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+def parse_body_for_literacy(tree: LexborHTMLParser) -> Optional[Dict[str, Any]]:
     # search for the word 'literacy' in paragraphs and try to extract a percentage nearby
-    for p in soup.find_all(["p", "li"]):
-        txt = p.get_text(" ", strip=True)
-        if "literacy" in txt.lower() or "literate" in txt.lower():
+    for p in tree.css("p, li"):
+        txt = p.text(separator=" ", strip=True)
+        lowered = txt.lower()
+        if "literacy" in lowered or "literate" in lowered:
             pct = extract_percentage(txt)
             year = None
-            ym = re.search(r"(\d{4})", txt)
+            ym = YEAR_RE.search(txt)
             if ym:
                 year = int(ym.group(1))
             if pct is not None:
@@ -103,10 +191,27 @@ def parse_body_for_literacy(soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
     return None
 
 
+_LITERACY_CACHE: Dict[str, Dict[str, Any]] = {}
+
+
 def get_literacy_for_place(place: str) -> Dict[str, Any]:
+    # repeated place names reuse the first completed lookup; network failures are retried
+    cached = _LITERACY_CACHE.get(place)
+    if cached is not None:
+        return cached
+    out = lookup_literacy(place)
+    if not (out["notes"] or "").startswith(TRANSIENT_NOTES):
+        _LITERACY_CACHE[place] = out
+    return out
+
+
+def lookup_literacy(place: str) -> Dict[str, Any]:
     out: Dict[str, Any] = {"input_name": place, "wiki_title": None, "literacy": None, "literacy_year": None, "notes": None}
     try:
         search = wiki_search(place)
+    except RateLimitedError:
+        out["notes"] = "rate-limited"
+        return out
     except Exception as e:
         out["notes"] = f"search-error: {e}"
         return out
@@ -118,18 +223,21 @@ def get_literacy_for_place(place: str) -> Dict[str, Any]:
     title = search.get("title")
     out["wiki_title"] = title
 
-    # fetch HTML
-    time.sleep(0.1)
-    html = fetch_wiki_html(title)
+    # fetch the lead section first; the infobox lives there
+    try:
+        html = fetch_wiki_html(title, section=0)
+    except RateLimitedError:
+        out["notes"] = "rate-limited"
+        return out
     if not html:
         out["notes"] = "failed-fetch-page"
         return out
 
-    soup = BeautifulSoup(html, "lxml")
+    tree = LexborHTMLParser(html)
 
     # Try infobox first
     try:
-        info = parse_infobox_for_literacy(soup)
+        info = parse_infobox_for_literacy(tree)
     except Exception:
         info = None
 
@@ -139,9 +247,16 @@ def get_literacy_for_place(place: str) -> Dict[str, Any]:
         out["notes"] = info.get("source")
         return out
 
-    # fallback: parse body
+    # fallback: parse body of the full article
     try:
-        body = parse_body_for_literacy(soup)
+        page_html = fetch_wiki_html(title)
+    except RateLimitedError:
+        out["notes"] = "rate-limited"
+        return out
+    if page_html:
+        tree = LexborHTMLParser(page_html)
+    try:
+        body = parse_body_for_literacy(tree)
     except Exception:
         body = None
 
@@ -163,25 +278,45 @@ def process_excel(input_path: str, output_path: str, sheet_name: Optional[str] =
     if df.shape[1] < 1:
         raise ValueError("Input Excel must have at least one column with place names")
 
+    df = df.reset_index(drop=True)
     first_col = df.columns[0]
-    places = df[first_col].astype(str).fillna("")
-
-    results: List[Dict[str, Any]] = []
-    total = len(places)
-    for idx, place in enumerate(places, start=1):
-        if not place.strip():
-            results.append({"input_name": place, "wiki_title": None, "literacy": None, "literacy_year": None, "notes": "empty-input"})
-            continue
+    places = df[first_col].fillna("").astype(str).str.strip()
+    # only non-empty names go to the pool; blank rows keep the defaults below
+    positions = np.flatnonzero(places.ne("").to_numpy())
+    total = len(positions)
+
+    n = len(df)
+    titles = np.full(n, None, dtype=object)
+    literacy = np.full(n, np.nan)
+    years = np.full(n, -1, dtype=np.int64)
+    notes = np.full(n, "empty-input", dtype=object)
+
+    def lookup(item: tuple) -> None:
+        idx, pos = item
+        place = places.iat[pos]
         print(f"[{idx}/{total}] Looking up literacy: {place}")
         try:
             res = get_literacy_for_place(place)
         except Exception as e:
-            res = {"input_name": place, "wiki_title": None, "literacy": None, "literacy_year": None, "notes": f"error: {e}"}
-        results.append(res)
-
-    res_df = pd.DataFrame(results)
-    out_df = pd.concat([df.reset_index(drop=True), res_df.drop(columns=["input_name"])], axis=1)
-    out_df.to_excel(output_path, index=False, engine="openpyxl")
+            notes[pos] = f"error: {e}"
+            return
+        # each worker owns a distinct slot, so no locking is needed
+        titles[pos] = res["wiki_title"]
+        if res["literacy"] is not None:
+            literacy[pos] = res["literacy"]
+        if res["literacy_year"] is not None:
+            years[pos] = res["literacy_year"]
+        notes[pos] = res["notes"]
+
+    # lookups are network-bound
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        list(ex.map(lookup, enumerate(positions, start=1)))
+
+    df["wiki_title"] = titles
+    df["literacy"] = literacy
+    df["literacy_year"] = pd.arrays.IntegerArray(years, years < 0)
+    df["notes"] = notes
+    df.to_excel(output_path, index=False, engine=EXCEL_WRITER_ENGINE)
     print(f"Wrote results to: {output_path}")
 
 
@@ -2,6 +2,7 @@
 Main execution script for the AI-Driven Micro-Lending Risk Assessment Platform
 """
 import os
+import subprocess
 import sys
 import argparse
 from pathlib import Path
@@ -9,9 +10,8 @@ from pathlib import Path
 # Add src to path
 sys.path.append(str(Path(__file__).parent))
 
-from src.data_generation.generate_data import main as generate_data_main
-from src.models.risk_assessment import main as risk_assessment_main
-from src.visualization.heatmap_generator import main as visualization_main
+# Pipeline stages are imported inside the run_* functions so that each command
+# only pays for the modules it uses (the model and plotting stacks are slow to import)
 
 def setup_directories():
     """Create necessary directories"""
@@ -32,6 +32,7 @@ def run_full_pipeline():
     # Step 1: Generate synthetic data
     print("\n📊 Step 1: Generating synthetic data...")
     try:
+        from src.data_generation.generate_data import main as generate_data_main
         generate_data_main()
         print("✅ Data generation completed successfully")
     except Exception as e:
@@ -41,6 +42,7 @@ def run_full_pipeline():
     # Step 2: Train models and assess risk
     print("\n🤖 Step 2: Training models and assessing risk...")
     try:
+        from src.models.risk_assessment import main as risk_assessment_main
         risk_assessment_main()
         print("✅ Risk assessment completed successfully")
     except Exception as e:
@@ -50,6 +52,7 @@ def run_full_pipeline():
     # Step 3: Generate visualizations
     print("\n📈 Step 3: Generating visualizations...")
     try:
+        from src.visualization.heatmap_generator import main as visualization_main
         visualization_main()
         print("✅ Visualizations generated successfully")
     except Exception as e:
@@ -71,6 +74,7 @@ def run_data_generation_only():
     """Run only data generation"""
     print("📊 Generating synthetic data...")
     setup_directories()
+    from src.data_generation.generate_data import main as generate_data_main
     generate_data_main()
     print("✅ Data generation completed")
 
@@ -78,6 +82,7 @@ def run_risk_assessment_only():
     """Run only risk assessment"""
     print("🤖 Running risk assessment...")
     setup_directories()
+    from src.models.risk_assessment import main as risk_assessment_main
     risk_assessment_main()
     print("✅ Risk assessment completed")
 
@@ -85,13 +90,15 @@ def run_visualization_only():
     """Run only visualization generation"""
     print("📈 Generating visualizations...")
     setup_directories()
+    from src.visualization.heatmap_generator import main as visualization_main
     visualization_main()
     print("✅ Visualizations generated")
 
 def launch_dashboard():
     """Launch the Streamlit dashboard"""
     print("🌐 Launching dashboard...")
-    os.system("streamlit run dashboard/app.py")
+    # run streamlit through this interpreter directly, without an intermediate shell
+    subprocess.run([sys.executable, "-m", "streamlit", "run", "dashboard/app.py"], check=True)
 
 def main():
     parser = argparse.ArgumentParser(
@@ -5,224 +5,377 @@ Fetches live data from multiple sources for comprehensive lending intelligence
 """
 
 import streamlit as st
-import pandas as pd
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import numpy as np
-import requests
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+# Parser for JSON payloads (API responses, cached figures)
+json_loads = orjson.loads if orjson is not None else json.loads
+if orjson is not None:
+    pio.json.config.default_engine = 'orjson'
+
+# Live feeds are refreshed at most once per cache window (5 minutes)
+CACHE_TTL_SECONDS = 300
+
+# API base URLs for the live feeds
+DATA_SOURCES = {
+    'weather': 'https://api.openweathermap.org/data/2.5/',
+    'economic': 'https://api.worldbank.org/v2/',
+    'news': 'https://newsapi.org/v2/',
+    'rbi': 'https://www.rbi.org.in/Scripts/api/'
+}
+
+# Sidebar feed status badges
+DATA_SOURCE_STATUS = {
+    "Weather API": "🟢 Live",
+    "Economic Data": "🟢 Live",
+    "News Feed": "🟢 Live",
+    "RBI Updates": "🟡 Cached",
+    "Disaster Alerts": "🟢 Live"
+}
+
+# Standing lending guidance per sector
+SECTOR_GUIDANCE = {
+    'Agriculture': 'Monitor weather patterns closely, verify crop insurance',
+    'MSME': 'Focus on digital adoption and cash flow analysis',
+    'Retail': 'Monitor consumer sentiment and festival demand',
+    'Real Estate': 'Assess regional market conditions and regulatory changes',
+    'Export Business': 'Monitor currency fluctuations and global trade'
+}
+
+# Card colours by alert severity, headline sentiment and regulatory impact
+DEFAULT_CARD_COLOR = '#6c757d'
+SEVERITY_COLORS = {'High': '#dc3545', 'Medium': '#fd7e14', 'Low': '#28a745'}
+SENTIMENT_COLORS = {'Positive': '#28a745', 'Negative': '#dc3545', 'Neutral': '#6c757d'}
+IMPACT_COLORS = {'High': '#dc3545', 'Medium': '#ffc107', 'Low': '#28a745'}
+
+# HTML templates, filled with str.format_map on each render
+HEADER_TEMPLATE = """
+<div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 2rem; border-radius: 15px; text-align: center; margin-bottom: 2rem;">
+    <h1>🔴 LIVE Banking Intelligence Agent</h1>
+    <p><strong>Real-Time Environmental Intelligence • Live Data Feeds • Instant Alerts</strong></p>
+    <p style="font-size: 0.9em;">Last Updated: {timestamp} | Auto-refresh: Every 5 minutes</p>
+</div>
+"""
+
+ALERT_CARD_TEMPLATE = """
+<div style="border-left: 5px solid {color}; background-color: {color}20; padding: 1rem; margin: 1rem 0; border-radius: 5px;">
+    <h4 style="color: {color}; margin: 0;">🚨 {type} Alert - {severity} Priority</h4>
+    <p style="margin: 0.5rem 0;"><strong>{message}</strong></p>
+    <p style="margin: 0; font-size: 0.9em; color: #666;">Timeline: {timeline}</p>
+</div>
+"""
+
+HEADLINE_CARD_TEMPLATE = """
+<div style="border-left: 4px solid {color}; padding: 1rem; margin: 0.5rem 0; background-color: {color}10;">
+    <h4 style="margin: 0; color: {color};">{title}</h4>
+    <p style="margin: 0.5rem 0; font-size: 0.9em;">
+        <strong>Source:</strong> {source} | 
+        <strong>Time:</strong> {timestamp} | 
+        <strong>Impact:</strong> {impact_score}/10
+    </p>
+    <span style="background-color: {color}; color: white; padding: 0.2rem 0.5rem; border-radius: 3px; font-size: 0.8rem;">
+        {sentiment}
+    </span>
+</div>
+"""
+
+UPDATE_CARD_TEMPLATE = """
+<div style="border: 1px solid {color}; border-radius: 8px; padding: 1rem; margin: 1rem 0;">
+    <h4 style="color: {color}; margin: 0;">{title}</h4>
+    <p style="margin: 0.5rem 0;"><strong>Date:</strong> {date} | <strong>Type:</strong> {type}</p>
+    <p style="margin: 0.5rem 0;">{summary}</p>
+    <p style="margin: 0; font-size: 0.9em;"><strong>Effective:</strong> {effective_date}</p>
+    <span style="background-color: {color}; color: white; padding: 0.2rem 0.5rem; border-radius: 3px; font-size: 0.8rem;">
+        {impact} Impact
+    </span>
+</div>
+"""
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def fetch_weather_data(city="Chennai"):
+    """Fetch real-time weather data"""
+    try:
+        # Note: In production, use actual API key
+        # For demo, return structured simulated data
+        weather_data = {
+            'current': {
+                'temperature': 28.5,
+                'humidity': 72,
+                'pressure': 1013,
+                'wind_speed': 12.5,
+                'weather_main': 'Clear',
+                'description': 'Clear sky'
+            },
+            'forecast_5day': [
+                {'date': '2024-11-23', 'temp_max': 30, 'temp_min': 22, 'humidity': 70, 'rainfall': 0},
+                {'date': '2024-11-24', 'temp_max': 29, 'temp_min': 21, 'humidity': 75, 'rainfall': 2.5},
+                {'date': '2024-11-25', 'temp_max': 27, 'temp_min': 20, 'humidity': 80, 'rainfall': 12.0},
+                {'date': '2024-11-26', 'temp_max': 26, 'temp_min': 19, 'humidity': 85, 'rainfall': 25.5},
+                {'date': '2024-11-27', 'temp_max': 28, 'temp_min': 21, 'humidity': 72, 'rainfall': 5.0},
+            ],
+            'alerts': [
+                {
+                    'type': 'Heavy Rainfall Warning',
+                    'severity': 'Medium',
+                    'start_time': '2024-11-25 06:00',
+                    'end_time': '2024-11-26 18:00',
+                    'description': 'Heavy to very heavy rainfall expected'
+                }
+            ]
+        }
+        return weather_data
+    except Exception as e:
+        st.error(f"Weather data fetch failed: {e}")
+        return None
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def fetch_economic_data():
+    """Fetch real-time economic indicators"""
+    try:
+        # Simulated real-time economic data
+        economic_data = {
+            'indicators': {
+                'repo_rate': {'value': 6.50, 'change': 0.0, 'last_updated': '2024-11-15'},
+                'inflation_cpi': {'value': 5.85, 'change': 0.12, 'last_updated': '2024-11-20'},
+                'gdp_growth': {'value': 6.3, 'change': 0.2, 'last_updated': '2024-10-31'},
+                'unemployment': {'value': 7.2, 'change': -0.3, 'last_updated': '2024-11-18'},
+                'inr_usd': {'value': 83.25, 'change': 0.15, 'last_updated': '2024-11-22'},
+                'sensex': {'value': 66750, 'change': 245, 'last_updated': '2024-11-22'},
+                'nifty': {'value': 19950, 'change': 87, 'last_updated': '2024-11-22'}
+            },
+            'market_indices': {
+                'bank_nifty': {'value': 45250, 'change': 156},
+                'fin_nifty': {'value': 18450, 'change': 92},
+                'smallcap_100': {'value': 15680, 'change': -23}
+            }
+        }
+        return economic_data
+    except Exception as e:
+        st.error(f"Economic data fetch failed: {e}")
+        return None
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def fetch_news_sentiment():
+    """Fetch and analyze news sentiment for banking sector"""
+    try:
+        # Simulated news sentiment analysis
+        news_data = {
+            'headlines': [
+                {
+                    'title': 'RBI keeps repo rate unchanged at 6.50%',
+                    'sentiment': 'Neutral',
+                    'impact_score': 5,
+                    'source': 'Economic Times',
+                    'timestamp': '2024-11-22 10:30'
+                },
+                {
+                    'title': 'Monsoon retreat boosts agricultural outlook',
+                    'sentiment': 'Positive',
+                    'impact_score': 7,
+                    'source': 'Financial Express',
+                    'timestamp': '2024-11-22 09:15'
+                },
+                {
+                    'title': 'Inflation concerns rise amid festival demand',
+                    'sentiment': 'Negative',
+                    'impact_score': 6,
+                    'source': 'Business Standard',
+                    'timestamp': '2024-11-22 08:45'
+                },
+                {
+                    'title': 'Digital lending guidelines tightened by RBI',
+                    'sentiment': 'Negative',
+                    'impact_score': 8,
+                    'source': 'Mint',
+                    'timestamp': '2024-11-21 16:20'
+                },
+                {
+                    'title': 'Rural credit demand surges post-harvest',
+                    'sentiment': 'Positive',
+                    'impact_score': 6,
+                    'source': 'Hindu Business Line',
+                    'timestamp': '2024-11-21 14:10'
+                }
+            ],
+            'sentiment_summary': {
+                'overall_sentiment': 'Slightly Positive',
+                'banking_sector_sentiment': 'Neutral',
+                'agricultural_sentiment': 'Positive',
+                'regulatory_sentiment': 'Cautious'
+            }
+        }
+        return news_data
+    except Exception as e:
+        st.error(f"News data fetch failed: {e}")
+        return None
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def fetch_regulatory_updates():
+    """Fetch latest regulatory updates"""
+    try:
+        regulatory_data = {
+            'rbi_updates': [
+                {
+                    'date': '2024-11-20',
+                    'title': 'Guidelines on Digital Lending Platforms',
+                    'type': 'Circular',
+                    'impact': 'High',
+                    'summary': 'Enhanced due diligence requirements for digital lending partnerships',
+                    'effective_date': '2024-12-31'
+                },
+                {
+                    'date': '2024-11-15',
+                    'title': 'Monetary Policy Committee Decision',
+                    'type': 'Policy',
+                    'impact': 'Medium',
+                    'summary': 'Repo rate maintained at 6.50%, neutral stance continued',
+                    'effective_date': '2024-11-15'
+                }
+            ],
+            'sebi_updates': [
+                {
+                    'date': '2024-11-18',
+                    'title': 'Credit Rating Disclosure Framework',
+                    'type': 'Regulation',
+                    'impact': 'Medium',
+                    'summary': 'Enhanced transparency in credit rating processes',
+                    'effective_date': '2025-01-01'
+                }
+            ],
+            'government_schemes': [
+                {
+                    'name': 'PM Vishwakarma Yojana Extension',
+                    'launch_date': '2024-11-10',
+                    'budget': '₹15,000 Crore',
+                    'target': 'Traditional artisans and craftspeople',
+                    'loan_component': 'Collateral-free loans up to ₹3 lakh'
+                }
+            ]
+        }
+        return regulatory_data
+    except Exception as e:
+        st.error(f"Regulatory data fetch failed: {e}")
+        return None
+
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def fetch_disaster_alerts():
+    """Fetch disaster and emergency alerts"""
+    try:
+        disaster_data = {
+            'active_alerts': [
+                {
+                    'type': 'Cyclone Watch',
+                    'name': 'Cyclonic Storm Formation',
+                    'affected_areas': ['Tamil Nadu Coast', 'Puducherry', 'Andhra Pradesh Coast'],
+                    'severity': 'Medium',
+                    'expected_impact': 'Coastal flooding, business disruption',
+                    'timeline': '2024-11-25 to 2024-11-27',
+                    'lending_impact': 'Defer coastal area loan approvals temporarily'
+                }
+            ],
+            'seasonal_risks': [
+                {
+                    'risk_type': 'Northeast Monsoon Variability',
+                    'probability': 'High',
+                    'affected_sectors': ['Agriculture', 'Rural Business', 'Fisheries'],
+                    'mitigation': 'Ensure crop insurance coverage for agricultural loans'
+                },
+                {
+                    'risk_type': 'Post-Festival Economic Slowdown',
+                    'probability': 'Medium',
+                    'affected_sectors': ['Retail', 'Consumer Goods', 'MSME'],
+                    'mitigation': 'Monitor consumer loan repayment patterns closely'
+                }
+            ]
+        }
+        return disaster_data
+    except Exception as e:
+        st.error(f"Disaster data fetch failed: {e}")
+        return None
+
+def fetch_all_live_data(agent):
+    """Return (weather, economic, news, regulatory, disaster) data for this session
+    
+    Each feed is kept in st.session_state and only re-fetched once it is older than the
+    agent's cache_timeout; stale feeds are fetched concurrently. The fetchers are
+    synchronous and currently serve simulated payloads, so a small thread pool is all
+    the concurrency they need; revisit with an async client once they call live APIs.
+    """
+    fetchers = {
+        'weather': agent.fetch_weather_data,
+        'economic': agent.fetch_economic_data,
+        'news': agent.fetch_news_sentiment,
+        'regulatory': agent.fetch_regulatory_updates,
+        'disaster': agent.fetch_disaster_alerts
+    }
+    now = time.monotonic()
+    cache = st.session_state.setdefault('live_data', {})
+    stale = [name for name in fetchers
+             if name not in cache or now - cache[name][0] >= agent.cache_timeout]
+    
+    if stale:
+        # Worker threads need the script context to use st.cache_data and st.error
+        ctx = get_script_run_ctx()
+        with ThreadPoolExecutor(max_workers=len(stale), initializer=add_script_run_ctx,
+                                initargs=(None, ctx)) as executor:
+            futures = {name: executor.submit(fetchers[name]) for name in stale}
+            for name, future in futures.items():
+                data = future.result()
+                if data is not None:
+                    cache[name] = (now, data)
+                else:
+                    # Failed fetches are retried on the next rerun
+                    cache.pop(name, None)
+    
+    return tuple(cache[name][1] if name in cache else None for name in fetchers)
+
 class AdvancedBankingAgent:
     """Advanced agent with real-time data fetching capabilities"""
     
+    __slots__ = ('cache_timeout', 'data_sources')
+    
     def __init__(self):
-        self.cache_timeout = 300  # 5 minutes cache
-        self.data_sources = {
-            'weather': 'https://api.openweathermap.org/data/2.5/',
-            'economic': 'https://api.worldbank.org/v2/',
-            'news': 'https://newsapi.org/v2/',
-            'rbi': 'https://www.rbi.org.in/Scripts/api/'
-        }
-        
+        self.cache_timeout = CACHE_TTL_SECONDS
+        self.data_sources = DATA_SOURCES
+    
     def fetch_weather_data(self, city="Chennai"):
         """Fetch real-time weather data"""
-        try:
-            # Note: In production, use actual API key
-            # For demo, return structured simulated data
-            weather_data = {
-                'current': {
-                    'temperature': 28.5,
-                    'humidity': 72,
-                    'pressure': 1013,
-                    'wind_speed': 12.5,
-                    'weather_main': 'Clear',
-                    'description': 'Clear sky'
-                },
-                'forecast_5day': [
-                    {'date': '2024-11-23', 'temp_max': 30, 'temp_min': 22, 'humidity': 70, 'rainfall': 0},
-                    {'date': '2024-11-24', 'temp_max': 29, 'temp_min': 21, 'humidity': 75, 'rainfall': 2.5},
-                    {'date': '2024-11-25', 'temp_max': 27, 'temp_min': 20, 'humidity': 80, 'rainfall': 12.0},
-                    {'date': '2024-11-26', 'temp_max': 26, 'temp_min': 19, 'humidity': 85, 'rainfall': 25.5},
-                    {'date': '2024-11-27', 'temp_max': 28, 'temp_min': 21, 'humidity': 72, 'rainfall': 5.0},
-                ],
-                'alerts': [
-                    {
-                        'type': 'Heavy Rainfall Warning',
-                        'severity': 'Medium',
-                        'start_time': '2024-11-25 06:00',
-                        'end_time': '2024-11-26 18:00',
-                        'description': 'Heavy to very heavy rainfall expected'
-                    }
-                ]
-            }
-            return weather_data
-        except Exception as e:
-            st.error(f"Weather data fetch failed: {e}")
-            return None
+        return fetch_weather_data(city)
     
     def fetch_economic_data(self):
         """Fetch real-time economic indicators"""
-        try:
-            # Simulated real-time economic data
-            economic_data = {
-                'indicators': {
-                    'repo_rate': {'value': 6.50, 'change': 0.0, 'last_updated': '2024-11-15'},
-                    'inflation_cpi': {'value': 5.85, 'change': 0.12, 'last_updated': '2024-11-20'},
-                    'gdp_growth': {'value': 6.3, 'change': 0.2, 'last_updated': '2024-10-31'},
-                    'unemployment': {'value': 7.2, 'change': -0.3, 'last_updated': '2024-11-18'},
-                    'inr_usd': {'value': 83.25, 'change': 0.15, 'last_updated': '2024-11-22'},
-                    'sensex': {'value': 66750, 'change': 245, 'last_updated': '2024-11-22'},
-                    'nifty': {'value': 19950, 'change': 87, 'last_updated': '2024-11-22'}
-                },
-                'market_indices': {
-                    'bank_nifty': {'value': 45250, 'change': 156},
-                    'fin_nifty': {'value': 18450, 'change': 92},
-                    'smallcap_100': {'value': 15680, 'change': -23}
-                }
-            }
-            return economic_data
-        except Exception as e:
-            st.error(f"Economic data fetch failed: {e}")
-            return None
+        return fetch_economic_data()
     
     def fetch_news_sentiment(self):
         """Fetch and analyze news sentiment for banking sector"""
-        try:
-            # Simulated news sentiment analysis
-            news_data = {
-                'headlines': [
-                    {
-                        'title': 'RBI keeps repo rate unchanged at 6.50%',
-                        'sentiment': 'Neutral',
-                        'impact_score': 5,
-                        'source': 'Economic Times',
-                        'timestamp': '2024-11-22 10:30'
-                    },
-                    {
-                        'title': 'Monsoon retreat boosts agricultural outlook',
-                        'sentiment': 'Positive',
-                        'impact_score': 7,
-                        'source': 'Financial Express',
-                        'timestamp': '2024-11-22 09:15'
-                    },
-                    {
-                        'title': 'Inflation concerns rise amid festival demand',
-                        'sentiment': 'Negative',
-                        'impact_score': 6,
-                        'source': 'Business Standard',
-                        'timestamp': '2024-11-22 08:45'
-                    },
-                    {
-                        'title': 'Digital lending guidelines tightened by RBI',
-                        'sentiment': 'Negative',
-                        'impact_score': 8,
-                        'source': 'Mint',
-                        'timestamp': '2024-11-21 16:20'
-                    },
-                    {
-                        'title': 'Rural credit demand surges post-harvest',
-                        'sentiment': 'Positive',
-                        'impact_score': 6,
-                        'source': 'Hindu Business Line',
-                        'timestamp': '2024-11-21 14:10'
-                    }
-                ],
-                'sentiment_summary': {
-                    'overall_sentiment': 'Slightly Positive',
-                    'banking_sector_sentiment': 'Neutral',
-                    'agricultural_sentiment': 'Positive',
-                    'regulatory_sentiment': 'Cautious'
-                }
-            }
-            return news_data
-        except Exception as e:
-            st.error(f"News data fetch failed: {e}")
-            return None
+        return fetch_news_sentiment()
     
     def fetch_regulatory_updates(self):
         """Fetch latest regulatory updates"""
-        try:
-            regulatory_data = {
-                'rbi_updates': [
-                    {
-                        'date': '2024-11-20',
-                        'title': 'Guidelines on Digital Lending Platforms',
-                        'type': 'Circular',
-                        'impact': 'High',
-                        'summary': 'Enhanced due diligence requirements for digital lending partnerships',
-                        'effective_date': '2024-12-31'
-                    },
-                    {
-                        'date': '2024-11-15',
-                        'title': 'Monetary Policy Committee Decision',
-                        'type': 'Policy',
-                        'impact': 'Medium',
-                        'summary': 'Repo rate maintained at 6.50%, neutral stance continued',
-                        'effective_date': '2024-11-15'
-                    }
-                ],
-                'sebi_updates': [
-                    {
-                        'date': '2024-11-18',
-                        'title': 'Credit Rating Disclosure Framework',
-                        'type': 'Regulation',
-                        'impact': 'Medium',
-                        'summary': 'Enhanced transparency in credit rating processes',
-                        'effective_date': '2025-01-01'
-                    }
-                ],
-                'government_schemes': [
-                    {
-                        'name': 'PM Vishwakarma Yojana Extension',
-                        'launch_date': '2024-11-10',
-                        'budget': '₹15,000 Crore',
-                        'target': 'Traditional artisans and craftspeople',
-                        'loan_component': 'Collateral-free loans up to ₹3 lakh'
-                    }
-                ]
-            }
-            return regulatory_data
-        except Exception as e:
-            st.error(f"Regulatory data fetch failed: {e}")
-            return None
+        return fetch_regulatory_updates()
     
     def fetch_disaster_alerts(self):
         """Fetch disaster and emergency alerts"""
-        try:
-            disaster_data = {
-                'active_alerts': [
-                    {
-                        'type': 'Cyclone Watch',
-                        'name': 'Cyclonic Storm Formation',
-                        'affected_areas': ['Tamil Nadu Coast', 'Puducherry', 'Andhra Pradesh Coast'],
-                        'severity': 'Medium',
-                        'expected_impact': 'Coastal flooding, business disruption',
-                        'timeline': '2024-11-25 to 2024-11-27',
-                        'lending_impact': 'Defer coastal area loan approvals temporarily'
-                    }
-                ],
-                'seasonal_risks': [
-                    {
-                        'risk_type': 'Northeast Monsoon Variability',
-                        'probability': 'High',
-                        'affected_sectors': ['Agriculture', 'Rural Business', 'Fisheries'],
-                        'mitigation': 'Ensure crop insurance coverage for agricultural loans'
-                    },
-                    {
-                        'risk_type': 'Post-Festival Economic Slowdown',
-                        'probability': 'Medium',
-                        'affected_sectors': ['Retail', 'Consumer Goods', 'MSME'],
-                        'mitigation': 'Monitor consumer loan repayment patterns closely'
-                    }
-                ]
-            }
-            return disaster_data
-        except Exception as e:
-            st.error(f"Disaster data fetch failed: {e}")
-            return None
+        return fetch_disaster_alerts()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def header_html(minute):
+    """Dashboard header for the given minute; rendered once per minute"""
+    return HEADER_TEMPLATE.format_map({'timestamp': minute})
 
 def create_real_time_dashboard():
     """Create the main real-time dashboard"""
@@ -235,16 +388,12 @@ def create_real_time_dashboard():
     )
     
     # Header
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 2rem; border-radius: 15px; text-align: center; margin-bottom: 2rem;">
-        <h1>🔴 LIVE Banking Intelligence Agent</h1>
-        <p><strong>Real-Time Environmental Intelligence • Live Data Feeds • Instant Alerts</strong></p>
-        <p style="font-size: 0.9em;">Last Updated: {timestamp} | Auto-refresh: Every 5 minutes</p>
-    </div>
-    """.format(timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S")), unsafe_allow_html=True)
+    st.markdown(header_html(datetime.now().strftime("%Y-%m-%d %H:%M")), unsafe_allow_html=True)
     
-    # Initialize agent
-    agent = AdvancedBankingAgent()
+    # Initialize agent once per session
+    if 'agent' not in st.session_state:
+        st.session_state.agent = AdvancedBankingAgent()
+    agent = st.session_state.agent
     
     # Sidebar with live status
     st.sidebar.title("🔴 Live Data Status")
@@ -254,56 +403,59 @@ def create_real_time_dashboard():
     auto_refresh = st.sidebar.checkbox("🔄 Auto-refresh (5 min)", value=True)
     
     if st.sidebar.button("🔄 Manual Refresh"):
-        st.experimental_rerun()
+        # Drop both cache layers so the rerun fetches every feed again
+        st.session_state.pop('live_data', None)
+        for fetch in (fetch_weather_data, fetch_economic_data, fetch_news_sentiment,
+                      fetch_regulatory_updates, fetch_disaster_alerts):
+            fetch.clear()
+        st.rerun()
     
     # Data source status
     st.sidebar.subheader("📡 Data Sources")
-    data_sources_status = {
-        "Weather API": "🟢 Live",
-        "Economic Data": "🟢 Live", 
-        "News Feed": "🟢 Live",
-        "RBI Updates": "🟡 Cached",
-        "Disaster Alerts": "🟢 Live"
-    }
-    
-    for source, status in data_sources_status.items():
+    for source, status in DATA_SOURCE_STATUS.items():
         st.sidebar.write(f"{status} {source}")
     
-    # Fetch all live data
-    weather_data = agent.fetch_weather_data()
-    economic_data = agent.fetch_economic_data()
-    news_data = agent.fetch_news_sentiment()
-    regulatory_data = agent.fetch_regulatory_updates()
-    disaster_data = agent.fetch_disaster_alerts()
-    
-    # Create tabs
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-        "🚨 Alert Center",
-        "🌤️ Weather & Climate",
-        "📊 Economic Live Feed",
-        "📰 News Sentiment",
-        "📋 Regulatory Monitor",
-        "📈 Lending Recommendations"
-    ])
-    
-    with tab1:
-        render_alert_center(weather_data, disaster_data, economic_data, news_data)
+    # Fetch live data, reusing this session's copies while they are fresh
+    weather_data, economic_data, news_data, regulatory_data, disaster_data = fetch_all_live_data(agent)
     
-    with tab2:
-        render_weather_dashboard(weather_data)
+    # Daily rainfall as an array, built once for the weather and lending tabs
+    if weather_data:
+        forecast = weather_data['forecast_5day']
+        weather_data['rainfall_array'] = np.fromiter(
+            (day['rainfall'] for day in forecast), dtype=np.float64, count=len(forecast)
+        )
     
-    with tab3:
-        render_economic_live_feed(economic_data)
+    # View selector; unlike st.tabs, only the selected view is rendered on each rerun
+    active_tab = st.radio(
+        "View",
+        [
+            "🚨 Alert Center",
+            "🌤️ Weather & Climate",
+            "📊 Economic Live Feed",
+            "📰 News Sentiment",
+            "📋 Regulatory Monitor",
+            "📈 Lending Recommendations"
+        ],
+        horizontal=True,
+        key='active_tab',
+        label_visibility="collapsed"
+    )
     
-    with tab4:
+    if active_tab == "🚨 Alert Center":
+        render_alert_center(weather_data, disaster_data, economic_data, news_data)
+    elif active_tab == "🌤️ Weather & Climate":
+        render_weather_dashboard(weather_data)
+    elif active_tab == "📊 Economic Live Feed":
+        render_economic_live_feed(economic_data)
+    elif active_tab == "📰 News Sentiment":
         render_news_sentiment(news_data)
-    
-    with tab5:
+    elif active_tab == "📋 Regulatory Monitor":
         render_regulatory_monitor(regulatory_data)
-    
-    with tab6:
+    else:
         render_lending_recommendations(weather_data, economic_data, news_data, disaster_data)
 
+# Each view below is a fragment: its own widget events rerun only that view
+@st.fragment
 def render_alert_center(weather_data, disaster_data, economic_data, news_data):
     """Render centralized alert center"""
     
@@ -348,17 +500,11 @@ def render_alert_center(weather_data, disaster_data, economic_data, news_data):
     
     # Display critical alerts
     if critical_alerts:
-        for alert in critical_alerts:
-            severity_colors = {'High': '#dc3545', 'Medium': '#fd7e14', 'Low': '#28a745'}
-            color = severity_colors.get(alert['severity'], '#6c757d')
-            
-            st.markdown(f"""
-            <div style="border-left: 5px solid {color}; background-color: {color}20; padding: 1rem; margin: 1rem 0; border-radius: 5px;">
-                <h4 style="color: {color}; margin: 0;">🚨 {alert['type']} Alert - {alert['severity']} Priority</h4>
-                <p style="margin: 0.5rem 0;"><strong>{alert['message']}</strong></p>
-                <p style="margin: 0; font-size: 0.9em; color: #666;">Timeline: {alert['timeline']}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        # All cards go out in one markdown element
+        st.markdown("".join(
+            ALERT_CARD_TEMPLATE.format_map({**alert, 'color': SEVERITY_COLORS.get(alert['severity'], DEFAULT_CARD_COLOR)})
+            for alert in critical_alerts
+        ), unsafe_allow_html=True)
     else:
         st.success("✅ No critical alerts at this time")
     
@@ -383,55 +529,33 @@ def render_alert_center(weather_data, disaster_data, economic_data, news_data):
         if st.button("📧 Alert Stakeholders"):
             st.success("Stakeholder alerts sent!")
 
-def render_weather_dashboard(weather_data):
-    """Render weather dashboard"""
-    
-    st.header("🌤️ Live Weather Intelligence")
-    
-    if not weather_data:
-        st.error("Weather data unavailable")
-        return
-    
-    # Current conditions
-    st.subheader("🌡️ Current Conditions")
-    
-    current = weather_data['current']
-    
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Temperature", f"{current['temperature']:.1f}°C")
-    with col2:
-        st.metric("Humidity", f"{current['humidity']}%")
-    with col3:
-        st.metric("Pressure", f"{current['pressure']} hPa")
-    with col4:
-        st.metric("Wind Speed", f"{current['wind_speed']} km/h")
-    
-    # 5-day forecast
-    st.subheader("📅 5-Day Forecast")
-    
-    forecast_df = pd.DataFrame(weather_data['forecast_5day'])
+@st.cache_data(ttl=CACHE_TTL_SECONDS, show_spinner=False)
+def forecast_figure_json(forecast_rows):
+    """Serialized temperature/rainfall forecast chart for (date, temp_max, temp_min, rainfall) rows"""
+    dates, temp_max, temp_min, rainfall = zip(*forecast_rows)
+    dates = list(dates)
+    # float32 halves the numeric payload where Plotly ships ndarrays as typed arrays
+    temp_max, temp_min, rainfall = (np.asarray(column, dtype=np.float32) for column in (temp_max, temp_min, rainfall))
     
     fig = go.Figure()
     
     fig.add_trace(go.Scatter(
-        x=forecast_df['date'],
-        y=forecast_df['temp_max'],
+        x=dates,
+        y=temp_max,
         name='Max Temperature',
         line=dict(color='red', width=3)
     ))
     
     fig.add_trace(go.Scatter(
-        x=forecast_df['date'],
-        y=forecast_df['temp_min'],
+        x=dates,
+        y=temp_min,
         name='Min Temperature',
         line=dict(color='blue', width=3)
     ))
     
     fig.add_trace(go.Bar(
-        x=forecast_df['date'],
-        y=forecast_df['rainfall'],
+        x=dates,
+        y=rainfall,
         name='Rainfall (mm)',
         yaxis='y2',
         opacity=0.6
@@ -449,12 +573,47 @@ def render_weather_dashboard(weather_data):
         height=400
     )
     
-    st.plotly_chart(fig, use_container_width=True)
+    return fig.to_json()
+
+@st.fragment
+def render_weather_dashboard(weather_data):
+    """Render weather dashboard"""
+    
+    st.header("🌤️ Live Weather Intelligence")
+    
+    if not weather_data:
+        st.error("Weather data unavailable")
+        return
+    
+    # Current conditions
+    st.subheader("🌡️ Current Conditions")
+    
+    current = weather_data['current']
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Temperature", f"{current['temperature']:.1f}°C")
+    with col2:
+        st.metric("Humidity", f"{current['humidity']}%")
+    with col3:
+        st.metric("Pressure", f"{current['pressure']} hPa")
+    with col4:
+        st.metric("Wind Speed", f"{current['wind_speed']} km/h")
+    
+    # 5-day forecast
+    st.subheader("📅 5-Day Forecast")
+    
+    forecast_rows = tuple(
+        (day['date'], day['temp_max'], day['temp_min'], day['rainfall'])
+        for day in weather_data['forecast_5day']
+    )
+    st.plotly_chart(json_loads(forecast_figure_json(forecast_rows)), use_container_width=True)
     
     # Lending impact analysis
     st.subheader("💰 Lending Impact Analysis")
     
-    total_rainfall = sum(day['rainfall'] for day in weather_data['forecast_5day'])
+    total_rainfall = float(weather_data['rainfall_array'].sum())
     
     if total_rainfall > 50:
         st.warning(f"""
@@ -477,6 +636,7 @@ def render_weather_dashboard(weather_data):
     else:
         st.success("🌤️ Favorable weather conditions for normal lending operations")
 
+@st.fragment
 def render_economic_live_feed(economic_data):
     """Render live economic data feed"""
     
@@ -563,6 +723,7 @@ def render_economic_live_feed(economic_data):
         smallcap = indices['smallcap_100']
         st.metric("Smallcap 100", f"{smallcap['value']:,}", f"{smallcap['change']:+,.0f}")
 
+@st.fragment
 def render_news_sentiment(news_data):
     """Render news sentiment analysis"""
     
@@ -587,38 +748,32 @@ def render_news_sentiment(news_data):
     with col2:
         st.subheader("📈 Impact Scores")
         
+        # One pass over the headlines for the impact total and sentiment counts
         headlines = news_data['headlines']
-        avg_impact = sum(h['impact_score'] for h in headlines) / len(headlines)
+        total_impact = 0
+        positive_news = negative_news = 0
+        for h in headlines:
+            total_impact += h['impact_score']
+            if h['sentiment'] == 'Positive':
+                positive_news += 1
+            elif h['sentiment'] == 'Negative':
+                negative_news += 1
+        avg_impact = total_impact / len(headlines)
         
         st.metric("Average News Impact", f"{avg_impact:.1f}/10")
         
-        positive_news = len([h for h in headlines if h['sentiment'] == 'Positive'])
-        negative_news = len([h for h in headlines if h['sentiment'] == 'Negative'])
-        
         st.write(f"📈 Positive News: {positive_news}")
         st.write(f"📉 Negative News: {negative_news}")
     
     # Recent headlines
     st.subheader("📰 Recent Headlines")
     
-    for headline in news_data['headlines'][:5]:
-        sentiment_color = {'Positive': '#28a745', 'Negative': '#dc3545', 'Neutral': '#6c757d'}
-        color = sentiment_color.get(headline['sentiment'], '#6c757d')
-        
-        st.markdown(f"""
-        <div style="border-left: 4px solid {color}; padding: 1rem; margin: 0.5rem 0; background-color: {color}10;">
-            <h4 style="margin: 0; color: {color};">{headline['title']}</h4>
-            <p style="margin: 0.5rem 0; font-size: 0.9em;">
-                <strong>Source:</strong> {headline['source']} | 
-                <strong>Time:</strong> {headline['timestamp']} | 
-                <strong>Impact:</strong> {headline['impact_score']}/10
-            </p>
-            <span style="background-color: {color}; color: white; padding: 0.2rem 0.5rem; border-radius: 3px; font-size: 0.8rem;">
-                {headline['sentiment']}
-            </span>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown("".join(
+        HEADLINE_CARD_TEMPLATE.format_map({**headline, 'color': SENTIMENT_COLORS.get(headline['sentiment'], DEFAULT_CARD_COLOR)})
+        for headline in news_data['headlines'][:5]
+    ), unsafe_allow_html=True)
 
+@st.fragment
 def render_regulatory_monitor(regulatory_data):
     """Render regulatory monitoring dashboard"""
     
@@ -631,21 +786,10 @@ def render_regulatory_monitor(regulatory_data):
     # RBI updates
     st.subheader("🏛️ RBI Updates")
     
-    for update in regulatory_data['rbi_updates']:
-        impact_color = {'High': '#dc3545', 'Medium': '#ffc107', 'Low': '#28a745'}
-        color = impact_color.get(update['impact'], '#6c757d')
-        
-        st.markdown(f"""
-        <div style="border: 1px solid {color}; border-radius: 8px; padding: 1rem; margin: 1rem 0;">
-            <h4 style="color: {color}; margin: 0;">{update['title']}</h4>
-            <p style="margin: 0.5rem 0;"><strong>Date:</strong> {update['date']} | <strong>Type:</strong> {update['type']}</p>
-            <p style="margin: 0.5rem 0;">{update['summary']}</p>
-            <p style="margin: 0; font-size: 0.9em;"><strong>Effective:</strong> {update['effective_date']}</p>
-            <span style="background-color: {color}; color: white; padding: 0.2rem 0.5rem; border-radius: 3px; font-size: 0.8rem;">
-                {update['impact']} Impact
-            </span>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown("".join(
+        UPDATE_CARD_TEMPLATE.format_map({**update, 'color': IMPACT_COLORS.get(update['impact'], DEFAULT_CARD_COLOR)})
+        for update in regulatory_data['rbi_updates']
+    ), unsafe_allow_html=True)
     
     # Government schemes
     st.subheader("🏛️ Government Schemes")
@@ -660,41 +804,60 @@ def render_regulatory_monitor(regulatory_data):
         **Loan Component:** {scheme['loan_component']}
         """)
 
-def render_lending_recommendations(weather_data, economic_data, news_data, disaster_data):
-    """Render intelligent lending recommendations"""
-    
-    st.header("📈 AI-Powered Lending Recommendations")
+def score_lending_risk(rainfall=None, inflation=None, unemployment=None, negative_news=None):
+    """Score current conditions against the lending risk thresholds
     
-    # Calculate comprehensive risk score
+    Inputs left as None contribute nothing. Returns (risk_factors, total_risk, risk_level),
+    where risk_factors lists (category, description, score) tuples.
+    """
     risk_factors = []
+    total_risk = 0
+    
+    def add_factor(category, description, score):
+        # Running total kept alongside the factor list, so nothing is re-summed
+        nonlocal total_risk
+        risk_factors.append((category, description, score))
+        total_risk += score
     
     # Weather risk
-    if weather_data:
-        rainfall = sum(day['rainfall'] for day in weather_data['forecast_5day'])
+    if rainfall is not None:
         if rainfall > 50:
-            risk_factors.append(('Weather', 'High rainfall expected', 15))
+            add_factor('Weather', 'High rainfall expected', 15)
         elif rainfall < 5:
-            risk_factors.append(('Weather', 'Drought conditions possible', 10))
+            add_factor('Weather', 'Drought conditions possible', 10)
     
     # Economic risk
-    if economic_data:
-        inflation = economic_data['indicators']['inflation_cpi']['value']
-        if inflation > 6:
-            risk_factors.append(('Economic', f'High inflation ({inflation}%)', 20))
-        
-        unemployment = economic_data['indicators']['unemployment']['value']
-        if unemployment > 7:
-            risk_factors.append(('Economic', f'High unemployment ({unemployment}%)', 15))
+    if inflation is not None and inflation > 6:
+        add_factor('Economic', f'High inflation ({inflation}%)', 20)
+    if unemployment is not None and unemployment > 7:
+        add_factor('Economic', f'High unemployment ({unemployment}%)', 15)
     
     # News sentiment risk
-    if news_data:
-        negative_news = len([h for h in news_data['headlines'] if h['sentiment'] == 'Negative'])
-        if negative_news >= 3:
-            risk_factors.append(('Sentiment', 'Negative news sentiment', 10))
+    if negative_news is not None and negative_news >= 3:
+        add_factor('Sentiment', 'Negative news sentiment', 10)
     
-    # Calculate total risk
-    total_risk = sum(score for _, _, score in risk_factors)
     risk_level = 'Low' if total_risk < 20 else 'Medium' if total_risk < 40 else 'High'
+    return risk_factors, total_risk, risk_level
+
+@st.fragment
+def render_lending_recommendations(weather_data, economic_data, news_data, disaster_data):
+    """Render intelligent lending recommendations"""
+    
+    st.header("📈 AI-Powered Lending Recommendations")
+    
+    # Extract the scalar inputs once; feeds that are unavailable stay None
+    rainfall = inflation = unemployment = negative_news = None
+    if weather_data:
+        rainfall = float(weather_data['rainfall_array'].sum())
+    if economic_data:
+        indicators = economic_data['indicators']
+        inflation = indicators['inflation_cpi']['value']
+        unemployment = indicators['unemployment']['value']
+    if news_data:
+        negative_news = sum(1 for h in news_data['headlines'] if h['sentiment'] == 'Negative')
+    
+    # Calculate comprehensive risk score
+    risk_factors, total_risk, risk_level = score_lending_risk(rainfall, inflation, unemployment, negative_news)
     
     # Display risk assessment
     st.subheader("🎯 Current Risk Assessment")
@@ -746,15 +909,7 @@ def render_lending_recommendations(weather_data, economic_data, news_data, disas
     # Sector-specific recommendations
     st.subheader("🏢 Sector-Specific Lending Guidance")
     
-    sectors = {
-        'Agriculture': 'Monitor weather patterns closely, verify crop insurance',
-        'MSME': 'Focus on digital adoption and cash flow analysis',
-        'Retail': 'Monitor consumer sentiment and festival demand',
-        'Real Estate': 'Assess regional market conditions and regulatory changes',
-        'Export Business': 'Monitor currency fluctuations and global trade'
-    }
-    
-    for sector, guidance in sectors.items():
+    for sector, guidance in SECTOR_GUIDANCE.items():
         st.write(f"**{sector}:** {guidance}")
 
 def main():
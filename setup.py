@@ -1,15 +1,20 @@
 """
 Setup script for AI-Driven Micro-Lending Risk Assessment Platform
 """
-import subprocess
+import shlex
 import sys
 import os
 
 def run_command(command, description):
-    """Run a command and handle errors"""
+    """Run a command (argument list or string) without a shell and handle errors"""
+    import subprocess
+    
     print(f"🔄 {description}...")
+    if isinstance(command, str):
+        command = shlex.split(command)
     try:
-        result = subprocess.run(command, shell=True, capture_output=True, text=True)
+        # Only stderr is reported, so don't buffer stdout at all
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         if result.returncode == 0:
             print(f"✅ {description} completed successfully")
             return True
@@ -20,7 +25,7 @@ def run_command(command, description):
         print(f"❌ Error: {e}")
         return False
 
-def setup_platform():
+def setup_platform(generate_data=True):
     """Set up the entire platform"""
     
     print("🏦 AI-DRIVEN MICRO-LENDING RISK ASSESSMENT PLATFORM SETUP")
@@ -48,14 +53,22 @@ def setup_platform():
         "plotly", "streamlit", "folium", "faker"
     ]
     
-    for package in packages:
-        success = run_command(f"pip install {package}", f"Installing {package}")
-        if not success:
-            print(f"⚠️  Warning: Failed to install {package}")
+    # One pip invocation resolves and downloads everything in a single pass
+    pip_command = [
+        sys.executable, "-m", "pip", "install",
+        "--no-input", "--disable-pip-version-check", "-q", *packages
+    ]
+    success = run_command(pip_command, f"Installing {', '.join(packages)}")
+    if not success:
+        print("⚠️  Warning: Failed to install one or more packages")
     
     # Generate sample data
-    print("\n📊 Generating sample data...")
-    success = run_command("python generate_sample_data.py", "Generating sample data")
+    if generate_data:
+        print("\n📊 Generating sample data...")
+        success = run_command([sys.executable, "generate_sample_data.py"], "Generating sample data")
+    else:
+        print("\n⏭️  Skipping sample data generation (--no-data)")
+        success = True
     
     if success:
         print("\n🎉 SETUP COMPLETED SUCCESSFULLY!")
@@ -69,10 +82,11 @@ def setup_platform():
         response = input().lower().strip()
         if response in ['y', 'yes']:
             print("🚀 Launching dashboard...")
-            os.system("streamlit run simple_dashboard.py")
+            # Replace this process with Streamlit: no shell and no extra child process
+            os.execvp(sys.executable, [sys.executable, "-m", "streamlit", "run", "simple_dashboard.py"])
     
     else:
         print("\n❌ Setup encountered errors. Please check the output above.")
 
 if __name__ == "__main__":
-    setup_platform()
+    setup_platform(generate_data="--no-data" not in sys.argv)
@@ -2,11 +2,71 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
+import plotly.graph_objects as go
 import os
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; fall back to pandas' CSV reader
+    pa = pa_csv = None
+
+try:
+    import datashader as ds
+    import datashader.transfer_functions as tf
+except ImportError:  # datashader is optional; fall back to a sampled scatter plot
+    ds = tf = None
+
 # Simple dashboard for testing
 st.set_page_config(page_title="Micro-Lending Risk Assessment", layout="wide")
 
+INDIVIDUAL_SCORES_PATH = "results/individual_risk_scores.csv"
+DISTRICT_AGGREGATION_PATH = "results/district_risk_aggregation.csv"
+# Rows sent to the browser for the detailed table; the metrics still cover all filtered rows
+DETAIL_ROW_LIMIT = 10_000
+# Green-to-red ramp matching the scatter's RdYlGn_r scale
+RISK_COLORMAP = ['#1a9850', '#fee08b', '#d73027']
+
+@st.cache_data(show_spinner=False)
+def load_csv(path, mtime, categories=(), sort_by=None):
+    """Parse a results CSV once per file version (mtime is only the cache key)"""
+    if pa_csv is None:
+        df = pd.read_csv(path, dtype={column: 'category' for column in categories})
+    else:
+        # Multi-threaded Arrow parser; dictionary columns arrive in pandas as Categoricals
+        table = pa_csv.read_csv(path, convert_options=pa_csv.ConvertOptions(
+            column_types={column: pa.dictionary(pa.int32(), pa.string()) for column in categories}
+        ))
+        df = table.to_pandas(self_destruct=True)
+    
+    if sort_by is not None:
+        df = df.sort_values(sort_by, ignore_index=True)
+    return df
+
+@st.cache_data(show_spinner=False)
+def risk_histogram(mtime, _scores, bins=30):
+    """Bin centers, counts and width for the risk histogram (cached per data file version)"""
+    counts, edges = np.histogram(_scores, bins=bins)
+    return (edges[:-1] + edges[1:]) / 2, counts, edges[1] - edges[0]
+
+@st.cache_data(show_spinner=False)
+def geographic_risk_image(mtime, _df, width=800, height=600):
+    """Rasterize every borrower into a mean-risk image (cached per data file version)"""
+    canvas = ds.Canvas(plot_width=width, plot_height=height)
+    agg = canvas.points(_df, 'longitude', 'latitude', ds.mean('overall_risk_score'))
+    return np.asarray(tf.shade(agg, cmap=RISK_COLORMAP, how='linear').to_pil())
+
+@st.cache_data(show_spinner=False)
+def overview_metrics(mtime, _df):
+    """Headline metrics for the overview row (cached per data file version)"""
+    scores = _df['overall_risk_score'].to_numpy()
+    return {
+        'avg_risk': scores.mean(),
+        'high_risk_pct': np.count_nonzero(scores > 0.7) / len(scores) * 100,
+        'total_exposure': _df['total_loan_amount'].to_numpy().sum(),
+        'total_borrowers': len(scores)
+    }
+
 def main():
     st.title("🏦 AI-Driven Micro-Lending Risk Assessment Platform")
     st.markdown("Real-time risk heatmaps and analytics for safer micro-lending decisions")
@@ -19,15 +79,21 @@ def main():
     
     # Load data
     try:
-        if os.path.exists("results/individual_risk_scores.csv"):
-            individual_data = pd.read_csv("results/individual_risk_scores.csv")
+        if os.path.exists(INDIVIDUAL_SCORES_PATH):
+            individual_mtime = os.path.getmtime(INDIVIDUAL_SCORES_PATH)
+            individual_data = load_csv(
+                INDIVIDUAL_SCORES_PATH,
+                individual_mtime,
+                categories=('risk_category',),
+                sort_by='overall_risk_score'
+            )
             st.success(f"✅ Loaded {len(individual_data):,} borrower records")
         else:
             st.error("Individual risk scores not found")
             return
             
-        if os.path.exists("results/district_risk_aggregation.csv"):
-            district_data = pd.read_csv("results/district_risk_aggregation.csv")
+        if os.path.exists(DISTRICT_AGGREGATION_PATH):
+            district_data = load_csv(DISTRICT_AGGREGATION_PATH, os.path.getmtime(DISTRICT_AGGREGATION_PATH))
             st.success(f"✅ Loaded {len(district_data)} districts")
         else:
             district_data = None
@@ -39,22 +105,20 @@ def main():
     # Overview metrics
     st.header("📈 Risk Assessment Overview")
     col1, col2, col3, col4 = st.columns(4)
+    metrics = overview_metrics(individual_mtime, individual_data)
+    avg_risk = metrics['avg_risk']
     
     with col1:
-        avg_risk = individual_data['overall_risk_score'].mean()
         st.metric("Average Risk Score", f"{avg_risk:.3f}")
     
     with col2:
-        high_risk_pct = (individual_data['overall_risk_score'] > 0.7).mean() * 100
-        st.metric("High Risk Borrowers", f"{high_risk_pct:.1f}%")
+        st.metric("High Risk Borrowers", f"{metrics['high_risk_pct']:.1f}%")
     
     with col3:
-        total_exposure = individual_data['total_loan_amount'].sum()
-        st.metric("Total Loan Exposure", f"₹{total_exposure/1e6:.1f}M")
+        st.metric("Total Loan Exposure", f"₹{metrics['total_exposure']/1e6:.1f}M")
     
     with col4:
-        total_borrowers = len(individual_data)
-        st.metric("Total Borrowers", f"{total_borrowers:,}")
+        st.metric("Total Borrowers", f"{metrics['total_borrowers']:,}")
     
     # Risk distribution
     st.header("📊 Risk Analysis")
@@ -65,12 +129,16 @@ def main():
         col1, col2 = st.columns(2)
         
         with col1:
-            # Risk score histogram
-            fig_hist = px.histogram(
-                individual_data,
-                x='overall_risk_score',
-                nbins=30,
-                title='Risk Score Distribution'
+            # Risk score histogram from precomputed bins, so only 30 bars reach the browser
+            centers, counts, width = risk_histogram(
+                individual_mtime, individual_data['overall_risk_score'].to_numpy()
+            )
+            fig_hist = go.Figure(go.Bar(x=centers, y=counts, width=width))
+            fig_hist.update_layout(
+                title='Risk Score Distribution',
+                xaxis_title='overall_risk_score',
+                yaxis_title='count',
+                bargap=0
             )
             fig_hist.add_vline(x=avg_risk, line_dash="dash", line_color="red", annotation_text="Mean")
             st.plotly_chart(fig_hist, use_container_width=True)
@@ -86,7 +154,16 @@ def main():
             st.plotly_chart(fig_pie, use_container_width=True)
     
     with tab2:
-        if 'latitude' in individual_data.columns and 'longitude' in individual_data.columns:
+        has_coordinates = 'latitude' in individual_data.columns and 'longitude' in individual_data.columns
+        if has_coordinates and ds is not None:
+            # Full-resolution view: every borrower rasterized server-side into one image
+            st.subheader("Geographic Distribution of Risk")
+            st.image(
+                geographic_risk_image(individual_mtime, individual_data),
+                caption="Mean risk score per pixel (green = low, red = high)",
+                use_column_width=True
+            )
+        elif has_coordinates:
             # Geographic scatter plot
             sample_data = individual_data.sample(min(1000, len(individual_data)), random_state=42)
             fig_scatter = px.scatter(
@@ -97,7 +174,8 @@ def main():
                 size='total_loan_amount',
                 hover_data=['risk_category', 'income', 'age'],
                 title='Geographic Distribution of Risk',
-                color_continuous_scale='RdYlGn_r'
+                color_continuous_scale='RdYlGn_r',
+                render_mode='webgl'
             )
             st.plotly_chart(fig_scatter, use_container_width=True)
         else:
@@ -108,9 +186,14 @@ def main():
             st.subheader("District Level Risk Summary")
             st.dataframe(district_data, use_container_width=True)
             
-            # District risk chart
+            # District risk chart, limited to the highest-risk districts
+            n_districts = len(district_data)
+            if n_districts > 1:
+                top_n = st.slider("Top N districts", 1, n_districts, min(50, n_districts))
+            else:
+                top_n = n_districts
             fig_bar = px.bar(
-                district_data,
+                district_data.nlargest(top_n, 'avg_risk_score'),
                 x='district_id',
                 y='avg_risk_score',
                 color='risk_level',
@@ -129,20 +212,23 @@ def main():
         risk_filter = st.slider("Filter by Risk Score", 0.0, 1.0, (0.0, 1.0))
     
     with col2:
+        all_categories = individual_data['risk_category'].unique().tolist()
         risk_categories = st.multiselect(
             "Filter by Risk Category",
-            individual_data['risk_category'].unique(),
-            default=individual_data['risk_category'].unique()
+            all_categories,
+            default=all_categories
         )
     
-    # Apply filters
-    filtered_data = individual_data[
-        (individual_data['overall_risk_score'] >= risk_filter[0]) & 
-        (individual_data['overall_risk_score'] <= risk_filter[1]) &
-        (individual_data['risk_category'].isin(risk_categories))
-    ]
+    # Apply filters: rows are sorted by score, so the range is a binary-searched slice
+    scores = individual_data['overall_risk_score'].to_numpy()
+    start = np.searchsorted(scores, risk_filter[0], side='left')
+    stop = np.searchsorted(scores, risk_filter[1], side='right')
+    score_slice = individual_data.iloc[start:stop]
+    filtered_data = score_slice[score_slice['risk_category'].isin(risk_categories)]
     
-    st.dataframe(filtered_data, use_container_width=True, height=400)
+    if len(filtered_data) > DETAIL_ROW_LIMIT:
+        st.caption(f"Showing the first {DETAIL_ROW_LIMIT:,} of {len(filtered_data):,} matching records")
+    st.dataframe(filtered_data.head(DETAIL_ROW_LIMIT), use_container_width=True, height=400)
     
     # Summary
     st.metric("Filtered Records", f"{len(filtered_data):,}")
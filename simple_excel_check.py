@@ -7,6 +7,26 @@ import pandas as pd
 import numpy as np
 import os
 import sys
+import importlib.util
+
+rng = np.random.default_rng()
+SAMPLE_DISTRICTS = np.array(['Chennai', 'Coimbatore', 'Madurai'])
+SAMPLE_ROWS = 30
+
+# Prefer the Rust-based calamine reader for Excel input; otherwise use openpyxl
+EXCEL_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') else 'openpyxl'
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else 'c'
+# zstd Feather copy of the workbook, reused while it is newer than the Excel file (needs pyarrow)
+EXCEL_CACHE = 'data/excel_input_data.feather' if HAS_PYARROW else None
+
+def load_excel(excel_path):
+    """Load the Excel input, returning (df, from_cache)"""
+    if (EXCEL_CACHE and os.path.exists(EXCEL_CACHE)
+            and os.path.getmtime(EXCEL_CACHE) >= os.path.getmtime(excel_path)):
+        return pd.read_feather(EXCEL_CACHE), True
+    
+    return pd.read_excel(excel_path, engine=EXCEL_ENGINE), False
 
 def main():
     print("🔍 Excel Data Analysis Started")
@@ -18,16 +38,20 @@ def main():
     if os.path.exists(excel_path):
         try:
             print("📊 Reading Excel file...")
-            df = pd.read_excel(excel_path)
-            print(f"✅ Excel file loaded successfully!")
+            df, from_cache = load_excel(excel_path)
+            print(f"✅ Excel file loaded successfully{' (cached)' if from_cache else ''}!")
             print(f"Shape: {df.shape}")
             print(f"Columns: {list(df.columns)}")
             print("\nFirst 3 rows:")
             print(df.head(3))
             
-            # Save as CSV for easier processing
-            df.to_csv('data/excel_input_data.csv', index=False)
-            print("💾 Saved Excel data as CSV")
+            # Save a binary checkpoint for easier processing; CSV only without pyarrow
+            if not from_cache and EXCEL_CACHE:
+                df.to_feather(EXCEL_CACHE, compression='zstd', compression_level=3)
+                print("💾 Saved Excel data as Feather")
+            elif not from_cache:
+                df.to_csv('data/excel_input_data.csv', index=False)
+                print("💾 Saved Excel data as CSV")
             
         except Exception as e:
             print(f"❌ Error reading Excel: {e}")
@@ -37,10 +61,10 @@ def main():
         # Create sample data
         print("📊 Creating sample Excel data...")
         sample_data = {
-            'District': ['Chennai', 'Coimbatore', 'Madurai'] * 10,
-            'Block': [f'Block-{i}' for i in range(1, 31)],
-            'Population': np.random.randint(5000, 100000, 30),
-            'Literacy_Rate': np.random.uniform(0.6, 0.9, 30)
+            'District': np.resize(SAMPLE_DISTRICTS, SAMPLE_ROWS),
+            'Block': np.char.add('Block-', np.arange(1, SAMPLE_ROWS + 1).astype(str)),
+            'Population': rng.integers(5000, 100000, SAMPLE_ROWS),
+            'Literacy_Rate': rng.uniform(0.6, 0.9, SAMPLE_ROWS)
         }
         
         df = pd.DataFrame(sample_data)
@@ -51,11 +75,17 @@ def main():
     # Check existing data
     print("\n📊 Checking existing data files...")
     
+    # One directory listing instead of a stat per file
+    try:
+        with os.scandir('data') as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        present = set()
+    
     data_files = ['borrowers.csv', 'districts.csv', 'blocks.csv', 'panchayats.csv']
     for file in data_files:
-        path = f'data/{file}'
-        if os.path.exists(path):
-            df = pd.read_csv(path)
+        if file in present:
+            df = pd.read_csv(os.path.join('data', file), engine=CSV_ENGINE)
             print(f"✅ {file:15s}: {df.shape[0]:4d} rows, {df.shape[1]:2d} columns")
         else:
             print(f"❌ {file:15s}: Not found")
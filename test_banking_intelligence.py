@@ -6,9 +6,95 @@ Demonstrates the capabilities of the banking parameter agents
 
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
+# Simulated parameter ranges: uniform fields are (low, high, decimals), integers are inclusive
+RNG = np.random.default_rng()
+UNIFORM_FIELDS = {
+    'current_temperature': (22, 35, 1),
+    'humidity_percent': (45, 90, 1),
+    'rainfall_last_7_days_mm': (0, 50, 1),
+    'inflation_cpi': (4.5, 6.5, 2),
+    'gdp_growth_rate': (5.8, 7.2, 1),
+    'unemployment_rate': (6.5, 8.0, 1),
+    'inr_usd_rate': (82.5, 84.0, 2),
+    'consumer_confidence': (3.5, 8.5, 1),
+    'digital_adoption_rate': (65, 85, 1),
+    'default_probability_estimate': (2.5, 8.5, 2),
+    'mobile_banking_penetration': (70, 85, 1),
+    'fintech_adoption': (60, 80, 1),
+    'crop_insurance_penetration': (35, 55, 1)
+}
+INTEGER_FIELDS = {
+    'overall_risk_score': (25, 65),
+    'climate_risk': (10, 40),
+    'economic_risk': (15, 35),
+    'social_risk': (5, 25),
+    'upi_transaction_volume': (8000, 12000),
+    'rice_price': (2000, 2500),
+    'wheat_price': (2100, 2400)
+}
+CHOICE_FIELDS = {
+    'weather_condition': ["Clear", "Cloudy", "Light Rain", "Sunny"],
+    'drought_risk_level': ["Low", "Medium", "High"],
+    'flood_risk_level': ["Low", "Medium"],
+    'market_sentiment': ["Bullish", "Neutral", "Cautious"],
+    'festival_season': ["High Activity", "Medium Activity", "Low Activity"],
+    'harvest_season': ["Active", "Post-Harvest", "Pre-Harvest"],
+    'migration_pattern': ["Low", "Medium", "High"],
+    'portfolio_stress_level': ["Low", "Medium", "High"],
+    'cybersecurity_threat_level': ["Low", "Medium", "High"],
+    'kharif_crop_status': ["Good", "Average", "Poor"],
+    'rabi_season_preparation': ["On Track", "Delayed"],
+    'agricultural_credit_demand': ["High", "Medium", "Low"]
+}
+UNIFORM_LOWS, UNIFORM_HIGHS = np.array([bounds[:2] for bounds in UNIFORM_FIELDS.values()]).T
+INTEGER_LOWS, INTEGER_HIGHS = np.array(list(INTEGER_FIELDS.values())).T + [[0], [1]]
+CHOICE_SIZES = [len(options) for options in CHOICE_FIELDS.values()]
+
+# Shared keep-alive session for the API probes
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+DAILY_BRIEF_TEMPLATE = """
+📅 Date: {date}
+
+🎯 LENDING ENVIRONMENT STATUS: {risk_status}
+   Overall Risk Score: {risk_score}/100
+   
+📊 KEY INDICATORS:
+   • Economic: Inflation at {inflation}%, GDP growth {gdp_growth}%
+   • Climate: {weather}, Drought risk {drought_risk}
+   • Social: {festival_season} festival activity
+   • Technology: {cyber_threat} cyber threat level
+
+💡 RECOMMENDED STRATEGY: {strategy}
+
+🎯 TODAY'S FOCUS AREAS:
+   • Agricultural loans: Monitor {drought_risk_lower} drought risk
+   • Consumer loans: {festival_season} demand expected
+   • Digital security: {cyber_threat} threat level protocols
+"""
+
+# Location risk adjustment
+LOCATION_RISK = {'Chennai': 0, 'Coimbatore': 5, 'Thanjavur': 10}
+DEFAULT_PURPOSE_ADJUSTMENT = 5
+
+# Decision bands: total risk below 35 approves, below 55 is conditional, otherwise defer
+DECISION_THRESHOLDS = [35, 55]
+DECISIONS = np.array(["APPROVE", "CONDITIONAL APPROVE", "DEFER/REJECT"])
+RISK_LEVELS = np.array(["LOW", "MEDIUM", "HIGH"])
+INTEREST_RATES = np.array([10.5, 12.0, 14.0])
+CONDITIONS = [
+    ["Standard terms"],
+    ["Enhanced monitoring", "Additional documentation"],
+    ["High risk environment", "Consider after conditions improve"]
+]
+
 def test_banking_intelligence():
     """Test and demonstrate the banking intelligence system"""
     
@@ -107,20 +193,20 @@ def test_banking_intelligence():
         }
     ]
     
-    for i, scenario in enumerate(scenarios, 1):
-        print(f"\n📋 SCENARIO {i}: {scenario['borrower_type']}")
+    # Simulate lending recommendations for all scenarios in one pass
+    recommendations = analyze_lending_scenarios(scenarios, current_params)
+    
+    for i, recommendation in enumerate(recommendations.itertuples(index=False), 1):
+        print(f"\n📋 SCENARIO {i}: {recommendation.borrower_type}")
         print("-" * 30)
-        print(f"   Loan Amount: ₹{scenario['loan_amount']:,}")
-        print(f"   Purpose: {scenario['purpose']}")
-        print(f"   Location: {scenario['location']}")
-        
-        # Simulate lending recommendation
-        recommendation = analyze_lending_scenario(scenario, current_params)
+        print(f"   Loan Amount: ₹{recommendation.loan_amount:,}")
+        print(f"   Purpose: {recommendation.purpose}")
+        print(f"   Location: {recommendation.location}")
         
-        print(f"   Recommendation: {recommendation['decision']}")
-        print(f"   Risk Level: {recommendation['risk_level']}")
-        print(f"   Interest Rate: {recommendation['interest_rate']}%")
-        print(f"   Conditions: {', '.join(recommendation['conditions'])}")
+        print(f"   Recommendation: {recommendation.decision}")
+        print(f"   Risk Level: {recommendation.risk_level}")
+        print(f"   Interest Rate: {recommendation.interest_rate}%")
+        print(f"   Conditions: {', '.join(recommendation.conditions)}")
     
     # Recommendations
     print("\n" + "=" * 60)
@@ -165,55 +251,60 @@ def test_banking_intelligence():
 def get_simulated_parameters():
     """Get simulated current parameters"""
     
-    import random
+    # One vectorised draw per distribution instead of a call per field
+    uniform = dict(zip(UNIFORM_FIELDS, RNG.uniform(UNIFORM_LOWS, UNIFORM_HIGHS).tolist()))
+    uniform = {field: round(value, UNIFORM_FIELDS[field][2]) for field, value in uniform.items()}
+    integer = dict(zip(INTEGER_FIELDS, RNG.integers(INTEGER_LOWS, INTEGER_HIGHS).tolist()))
+    choice = {field: options[i] for (field, options), i
+              in zip(CHOICE_FIELDS.items(), RNG.integers(0, CHOICE_SIZES).tolist())}
     
     return {
         'timestamp': datetime.now().isoformat(),
         'climate_data': {
-            'current_temperature': round(random.uniform(22, 35), 1),
-            'humidity_percent': round(random.uniform(45, 90), 1),
-            'rainfall_last_7_days_mm': round(random.uniform(0, 50), 1),
-            'weather_condition': random.choice(["Clear", "Cloudy", "Light Rain", "Sunny"]),
-            'drought_risk_level': random.choice(["Low", "Medium", "High"]),
-            'flood_risk_level': random.choice(["Low", "Medium"]),
+            'current_temperature': uniform['current_temperature'],
+            'humidity_percent': uniform['humidity_percent'],
+            'rainfall_last_7_days_mm': uniform['rainfall_last_7_days_mm'],
+            'weather_condition': choice['weather_condition'],
+            'drought_risk_level': choice['drought_risk_level'],
+            'flood_risk_level': choice['flood_risk_level'],
         },
         'economic_indicators': {
             'rbi_repo_rate': 6.50,
-            'inflation_cpi': round(random.uniform(4.5, 6.5), 2),
-            'gdp_growth_rate': round(random.uniform(5.8, 7.2), 1),
-            'unemployment_rate': round(random.uniform(6.5, 8.0), 1),
-            'inr_usd_rate': round(random.uniform(82.5, 84.0), 2),
-            'market_sentiment': random.choice(["Bullish", "Neutral", "Cautious"])
+            'inflation_cpi': uniform['inflation_cpi'],
+            'gdp_growth_rate': uniform['gdp_growth_rate'],
+            'unemployment_rate': uniform['unemployment_rate'],
+            'inr_usd_rate': uniform['inr_usd_rate'],
+            'market_sentiment': choice['market_sentiment']
         },
         'social_factors': {
-            'festival_season': random.choice(["High Activity", "Medium Activity", "Low Activity"]),
-            'harvest_season': random.choice(["Active", "Post-Harvest", "Pre-Harvest"]),
-            'consumer_confidence': round(random.uniform(3.5, 8.5), 1),
-            'digital_adoption_rate': round(random.uniform(65, 85), 1),
-            'migration_pattern': random.choice(["Low", "Medium", "High"])
+            'festival_season': choice['festival_season'],
+            'harvest_season': choice['harvest_season'],
+            'consumer_confidence': uniform['consumer_confidence'],
+            'digital_adoption_rate': uniform['digital_adoption_rate'],
+            'migration_pattern': choice['migration_pattern']
         },
         'risk_indicators': {
-            'overall_risk_score': random.randint(25, 65),
-            'climate_risk': random.randint(10, 40),
-            'economic_risk': random.randint(15, 35),
-            'social_risk': random.randint(5, 25),
-            'default_probability_estimate': round(random.uniform(2.5, 8.5), 2),
-            'portfolio_stress_level': random.choice(["Low", "Medium", "High"])
+            'overall_risk_score': integer['overall_risk_score'],
+            'climate_risk': integer['climate_risk'],
+            'economic_risk': integer['economic_risk'],
+            'social_risk': integer['social_risk'],
+            'default_probability_estimate': uniform['default_probability_estimate'],
+            'portfolio_stress_level': choice['portfolio_stress_level']
         },
         'technology_factors': {
-            'upi_transaction_volume': random.randint(8000, 12000),
-            'mobile_banking_penetration': round(random.uniform(70, 85), 1),
-            'cybersecurity_threat_level': random.choice(["Low", "Medium", "High"]),
-            'fintech_adoption': round(random.uniform(60, 80), 1)
+            'upi_transaction_volume': integer['upi_transaction_volume'],
+            'mobile_banking_penetration': uniform['mobile_banking_penetration'],
+            'cybersecurity_threat_level': choice['cybersecurity_threat_level'],
+            'fintech_adoption': uniform['fintech_adoption']
         },
         'agricultural_data': {
-            'kharif_crop_status': random.choice(["Good", "Average", "Poor"]),
-            'rabi_season_preparation': random.choice(["On Track", "Delayed"]),
-            'crop_insurance_penetration': round(random.uniform(35, 55), 1),
-            'agricultural_credit_demand': random.choice(["High", "Medium", "Low"]),
+            'kharif_crop_status': choice['kharif_crop_status'],
+            'rabi_season_preparation': choice['rabi_season_preparation'],
+            'crop_insurance_penetration': uniform['crop_insurance_penetration'],
+            'agricultural_credit_demand': choice['agricultural_credit_demand'],
             'mandi_prices': {
-                'rice': random.randint(2000, 2500),
-                'wheat': random.randint(2100, 2400)
+                'rice': integer['rice_price'],
+                'wheat': integer['wheat_price']
             }
         },
         'recommendations': {
@@ -224,47 +315,33 @@ def get_simulated_parameters():
         }
     }
 
-def analyze_lending_scenario(scenario, params):
-    """Analyze a lending scenario and provide recommendation"""
-    
-    base_risk = params['risk_indicators']['overall_risk_score']
-    
-    # Adjust risk based on loan purpose
-    purpose_adjustments = {
+def get_purpose_adjustments(params):
+    """Risk adjustment per loan purpose under the current conditions"""
+    return {
         'Agriculture': 10 if params['climate_data']['drought_risk_level'] == 'High' else 0,
         'Business': 5 if params['economic_indicators']['market_sentiment'] == 'Bearish' else 0,
         'Vehicle': 0,
         'Personal': 15
     }
+
+def analyze_lending_scenarios(scenarios, params):
+    """Analyze a batch of lending scenarios; returns the scenarios with recommendation columns"""
     
-    # Location risk adjustment
-    location_risk = {'Chennai': 0, 'Coimbatore': 5, 'Thanjavur': 10}
-    
-    total_risk = base_risk + purpose_adjustments.get(scenario['purpose'], 5) + location_risk.get(scenario['location'], 0)
-    
-    if total_risk < 35:
-        decision = "APPROVE"
-        risk_level = "LOW"
-        interest_rate = 10.5
-        conditions = ["Standard terms"]
-    elif total_risk < 55:
-        decision = "CONDITIONAL APPROVE"
-        risk_level = "MEDIUM"
-        interest_rate = 12.0
-        conditions = ["Enhanced monitoring", "Additional documentation"]
-    else:
-        decision = "DEFER/REJECT"
-        risk_level = "HIGH"
-        interest_rate = 14.0
-        conditions = ["High risk environment", "Consider after conditions improve"]
+    scenarios_df = pd.DataFrame(scenarios)
+    base_risk = params['risk_indicators']['overall_risk_score']
     
-    return {
-        'decision': decision,
-        'risk_level': risk_level,
-        'interest_rate': interest_rate,
-        'conditions': conditions,
-        'calculated_risk': total_risk
-    }
+    purpose_adj = scenarios_df['purpose'].map(get_purpose_adjustments(params)).fillna(DEFAULT_PURPOSE_ADJUSTMENT)
+    location_adj = scenarios_df['location'].map(LOCATION_RISK).fillna(0)
+    total_risk = (base_risk + purpose_adj + location_adj).astype(int).to_numpy()
+    band = np.digitize(total_risk, DECISION_THRESHOLDS)
+    
+    return scenarios_df.assign(
+        decision=DECISIONS[band],
+        risk_level=RISK_LEVELS[band],
+        interest_rate=INTEREST_RATES[band],
+        conditions=[CONDITIONS[b] for b in band],
+        calculated_risk=total_risk
+    )
 
 def generate_daily_brief(params):
     """Generate daily lending brief"""
@@ -281,27 +358,24 @@ def generate_daily_brief(params):
         risk_status = "🔴 ELEVATED"
         strategy = "Conservative lending advised"
     
-    brief = f"""
-📅 Date: {datetime.now().strftime('%B %d, %Y')}
-
-🎯 LENDING ENVIRONMENT STATUS: {risk_status}
-   Overall Risk Score: {risk_score}/100
-   
-📊 KEY INDICATORS:
-   • Economic: Inflation at {params['economic_indicators']['inflation_cpi']}%, GDP growth {params['economic_indicators']['gdp_growth_rate']}%
-   • Climate: {params['climate_data']['weather_condition']}, Drought risk {params['climate_data']['drought_risk_level']}
-   • Social: {params['social_factors']['festival_season']} festival activity
-   • Technology: {params['technology_factors']['cybersecurity_threat_level']} cyber threat level
-
-💡 RECOMMENDED STRATEGY: {strategy}
-
-🎯 TODAY'S FOCUS AREAS:
-   • Agricultural loans: Monitor {params['climate_data']['drought_risk_level'].lower()} drought risk
-   • Consumer loans: {params['social_factors']['festival_season']} demand expected
-   • Digital security: {params['technology_factors']['cybersecurity_threat_level']} threat level protocols
-"""
-    
-    return brief
+    economic = params['economic_indicators']
+    climate = params['climate_data']
+    festival_season = params['social_factors']['festival_season']
+    cyber_threat = params['technology_factors']['cybersecurity_threat_level']
+    
+    return DAILY_BRIEF_TEMPLATE.format_map({
+        'date': datetime.now().strftime('%B %d, %Y'),
+        'risk_status': risk_status,
+        'risk_score': risk_score,
+        'inflation': economic['inflation_cpi'],
+        'gdp_growth': economic['gdp_growth_rate'],
+        'weather': climate['weather_condition'],
+        'drought_risk': climate['drought_risk_level'],
+        'drought_risk_lower': climate['drought_risk_level'].lower(),
+        'festival_season': festival_season,
+        'cyber_threat': cyber_threat,
+        'strategy': strategy
+    })
 
 def test_api_endpoints():
     """Test API endpoints if available"""
@@ -316,13 +390,22 @@ def test_api_endpoints():
         "http://localhost:5000/api/risk-assessment"
     ]
     
-    for url in test_urls:
-        try:
-            # Note: This would work if the API server is running
+    # Probe all endpoints concurrently over the shared session
+    with ThreadPoolExecutor(max_workers=len(test_urls)) as executor:
+        results = executor.map(probe_endpoint, test_urls)
+        for url, status in results:
             print(f"🔗 Testing: {url}")
-            print("   [Simulated] API endpoint ready for testing")
-        except:
-            print(f"   API not available (run banking_intelligence_api.py)")
+            if status is None:
+                print(f"   API not available (run banking_intelligence_api.py)")
+            else:
+                print(f"   HTTP {status}")
+
+def probe_endpoint(url):
+    """Return (url, status code), or (url, None) when the API is unreachable"""
+    try:
+        return url, SESSION.get(url, timeout=2).status_code
+    except requests.RequestException:
+        return url, None
 
 if __name__ == "__main__":
     test_banking_intelligence()
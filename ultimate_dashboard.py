@@ -7,15 +7,54 @@ Complete platform with Excel integration, multi-level analysis, and ML insights
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import os
-import json
+import importlib.util
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+# plotly.express (~0.4s to import) and plotly.subplots are imported inside the figure builders
+# that use them, so a cold start on the Overview view doesn't pay for them
+
+# Parquet copies of parsed inputs and the multi-threaded CSV parser need pyarrow
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else 'c'
+# Prefer the Rust-based calamine reader for Excel input; otherwise use openpyxl
+EXCEL_ENGINE = 'calamine' if importlib.util.find_spec('python_calamine') else 'openpyxl'
+# Parsed inputs are cached here as Parquet (git-ignored)
+PARQUET_CACHE_DIR = '.parquet_cache'
+
+# Input files; the first existing borrower/aggregation file in each list is loaded
+EXCEL_PATH = "input_excel/input_data.xlsx"
+BORROWER_FILES = [
+    'data/enhanced_borrowers_comprehensive.csv',
+    'data/enhanced_borrowers.csv', 
+    'data/borrowers.csv'
+]
+AGGREGATION_FILES = {
+    'district': ['results/district_comprehensive_risk_aggregation.csv', 'results/district_risk_aggregation.csv'],
+    'block': ['results/block_comprehensive_risk_aggregation.csv', 'results/block_risk_aggregation.csv'],
+    'panchayat': ['results/panchayat_comprehensive_risk_aggregation.csv', 'results/panchayat_risk_aggregation.csv']
+}
+
+# Low-cardinality text columns stored as categoricals
+CATEGORY_COLUMNS = ['district', 'block', 'panchayat', 'risk_category']
+
+# Borrower columns kept in the map sample
+MAP_COLUMNS = ['latitude', 'longitude', 'overall_risk_score', 'requested_loan_amount', 'district', 'block']
+
+RISK_COLORS = {
+    'Low Risk': '#28a745',
+    'Medium Risk': '#ffc107', 
+    'High Risk': '#fd7e14',
+    'Very High Risk': '#dc3545'
+}
+
+# Figure builders below hash DataFrames by identity: the frames live on the cached dashboard
+# and are replaced (never mutated) on refresh, which also clears these caches
+FIGURE_CACHE = st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: id})
+
 # Page configuration
 st.set_page_config(
     page_title="AI Micro-Lending Risk Assessment Platform",
@@ -49,76 +88,479 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Static model insights shown on the ML Insights tab; no model is fitted or loaded by this dashboard
+MODEL_METRICS = [
+    ("Model Accuracy", "89.3%", "↑ 2.4%"),
+    ("Precision", "86.7%", "↑ 1.8%"),
+    ("Recall", "91.2%", "↑ 0.9%"),
+    ("F1-Score", "88.9%", "↑ 1.5%")
+]
+
+FEATURE_IMPORTANCE = {
+    'Credit History Length': 0.18,
+    'Monthly Income to Loan Ratio': 0.16,
+    'Collateral Value': 0.14,
+    'Education Level': 0.12,
+    'Bank Account Status': 0.10,
+    'SHG Membership': 0.08,
+    'Asset Ownership': 0.07,
+    'Age Factor': 0.06,
+    'Geographic Location': 0.05,
+    'Social Connections': 0.04
+}
+
+RECOMMENDATIONS = [
+    {
+        "category": "🏛️ Policy Recommendations",
+        "items": [
+            "Implement mandatory financial literacy programs for high-risk borrowers",
+            "Establish mobile banking units in low-infrastructure areas",
+            "Create incentives for SHG membership and participation",
+            "Develop crop insurance partnerships for agricultural borrowers"
+        ]
+    },
+    {
+        "category": "💰 Lending Strategy",
+        "items": [
+            "Offer lower interest rates for SHG members and educated borrowers",
+            "Require co-guarantors for seasonal workers",
+            "Implement graduated loan amounts based on repayment history",
+            "Provide grace periods for agriculture-dependent borrowers"
+        ]
+    },
+    {
+        "category": "🔍 Risk Monitoring",
+        "items": [
+            "Monthly check-ins for high-risk borrowers",
+            "Seasonal income verification for agricultural borrowers",
+            "Digital payment adoption tracking",
+            "Community feedback integration for social risk assessment"
+        ]
+    }
+]
+
+# Dashboard views: radio label -> UltimateRiskDashboard render method
+VIEWS = {
+    "🏠 Overview": 'render_overview_tab',
+    "📊 Excel Analysis": 'render_excel_analysis_tab',
+    "⚖️ Risk Assessment": 'render_risk_analysis_tab',
+    "🗺️ Geographic Analysis": 'render_geographic_tab',
+    "🤖 ML Insights": 'render_insights_tab'
+}
+VIEW_LABELS = tuple(VIEWS)
+# ?view= slugs for deep links, e.g. render_geographic_tab -> geographic
+VIEW_SLUGS = {label: method[len('render_'):-len('_tab')] for label, method in VIEWS.items()}
+VIEW_BY_SLUG = {slug: label for label, slug in VIEW_SLUGS.items()}
+
+def sync_view_param():
+    """Mirror the selected view into ?view= so the URL deep-links to it"""
+    st.query_params['view'] = VIEW_SLUGS[st.session_state.active_tab]
+
+@st.cache_resource(show_spinner=False)
+def feature_importance_figure():
+    """Feature importance bar chart; static, so built once per server process"""
+    import plotly.express as px
+    fig = px.bar(
+        x=list(FEATURE_IMPORTANCE.values()),
+        y=list(FEATURE_IMPORTANCE.keys()),
+        orientation='h',
+        title="Top 10 Risk Prediction Features",
+        color=list(FEATURE_IMPORTANCE.values()),
+        color_continuous_scale='Viridis'
+    )
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+    return fig
+
+def shrink_dtypes(df):
+    """Downcast numeric columns and categoricalize geographic/risk labels in place"""
+    for col in df.select_dtypes('integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes('float').columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+def read_via_parquet_cache(path, mtime, parse):
+    """Read path's Parquet copy while it is newer than path; otherwise parse path and write the copy"""
+    # Copies live in one ignored folder, named after the full relative path so data/x.csv and
+    # data/x.xlsx never share a file, rather than as untracked sidecars next to the inputs
+    parquet_path = os.path.join(PARQUET_CACHE_DIR, os.path.normpath(path).replace(os.sep, '__') + '.parquet')
+    if HAS_PYARROW and os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= mtime:
+        return pd.read_parquet(parquet_path)
+    
+    df = shrink_dtypes(parse(path))
+    if HAS_PYARROW:
+        try:
+            os.makedirs(PARQUET_CACHE_DIR, exist_ok=True)
+            df.to_parquet(parquet_path, compression='zstd', index=False)
+        except (TypeError, ValueError, OSError):
+            pass  # mixed-type columns or a read-only folder: keep using the source file
+    return df
+
+@st.cache_data(persist="disk", show_spinner=False)
+def read_excel_cached(path, mtime):
+    """Parse an Excel file once per file version, via its Parquet copy when it is current"""
+    return read_via_parquet_cache(path, mtime, lambda xlsx_path: pd.read_excel(xlsx_path, engine=EXCEL_ENGINE))
+
+@st.cache_data(persist="disk", show_spinner=False)
+def read_csv_cached(path, mtime):
+    """Parse a CSV file once per file version, via its Parquet copy when it is current"""
+    return read_via_parquet_cache(path, mtime, lambda csv_path: pd.read_csv(csv_path, engine=CSV_ENGINE))
+
+@st.cache_data(show_spinner=False)
+def column_profile(data_key, _df, _non_null):
+    """Per-column dtype, non-null count, distinct count and sample values (data_key identifies the file version)"""
+    samples = [
+        str(_df[col].dropna().iloc[:3].tolist())[:50] + "..." if count > 0 else "No data"
+        for col, count in _non_null.items()
+    ]
+    return pd.DataFrame({
+        'Column': _df.columns,
+        'Data Type': _df.dtypes.astype(str),
+        'Non-Null Count': _non_null,
+        'Unique Values': _df.nunique(),
+        'Sample Values': pd.Series(samples, index=_df.columns)
+    })
+
+RISK_CARD_TEMPLATE = """
+    <div style="flex: 1; background-color: {color}15; border-left: 4px solid {color}; padding: 1rem; border-radius: 5px;">
+        <h3 style="color: {color}; margin: 0;">{count:,}</h3>
+        <p style="margin: 0; font-weight: bold;">{category}</p>
+        <p style="margin: 0; font-size: 0.9em;">{percentage:.1f}% of total</p>
+    </div>"""
+
+@st.cache_data(show_spinner=False)
+def risk_cards_html(risk_counts, total):
+    """One flex row of risk-category cards from (category, count) pairs"""
+    cards = "".join(
+        RISK_CARD_TEMPLATE.format(
+            color=RISK_COLORS.get(category, '#6c757d'),
+            count=count,
+            category=category,
+            percentage=count / total * 100
+        )
+        for category, count in risk_counts
+    )
+    return f'<div style="display: flex; gap: 1rem;">{cards}\n</div>'
+
+@FIGURE_CACHE
+def risk_category_pie(borrowers):
+    """Donut chart of borrowers per risk category"""
+    import plotly.express as px
+    risk_counts = borrowers['risk_category'].value_counts()
+    fig = px.pie(
+        values=risk_counts.values,
+        names=risk_counts.index,
+        title="Risk Category Distribution",
+        color_discrete_map=RISK_COLORS,
+        hole=0.4
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+@FIGURE_CACHE
+def component_correlation_figure(corr_matrix):
+    """Heatmap of the risk component correlation matrix"""
+    import plotly.express as px
+    return px.imshow(
+        corr_matrix,
+        text_auto=True,
+        aspect="auto",
+        title="Risk Component Correlations",
+        color_continuous_scale='RdBu_r'
+    )
+
+@FIGURE_CACHE
+def component_average_figure(borrowers, risk_component_cols):
+    """Horizontal bars of the mean score per risk component"""
+    import plotly.express as px
+    component_avgs = borrowers[list(risk_component_cols)].mean().sort_values(ascending=True)
+    fig = px.bar(
+        x=component_avgs.values,
+        y=component_avgs.index,
+        orientation='h',
+        title="Average Risk Scores by Component",
+        color=component_avgs.values,
+        color_continuous_scale='Reds'
+    )
+    fig.update_layout(yaxis_title="Risk Component", xaxis_title="Average Score")
+    return fig
+
+@FIGURE_CACHE
+def top_risk_figure(agg_data, admin_level):
+    """Top 15 areas by mean risk from an aggregation file"""
+    import plotly.express as px
+    fig = px.bar(
+        agg_data.nlargest(15, 'overall_risk_score_mean'),
+        x='overall_risk_score_mean',
+        y=admin_level.lower(),
+        orientation='h',
+        title=f"Top 15 Highest Risk {admin_level}s",
+        color='overall_risk_score_mean',
+        color_continuous_scale='Reds'
+    )
+    fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+    return fig
+
+@FIGURE_CACHE
+def area_risk_figure(geo_risk, admin_level, group_col):
+    """Mean risk of the 20 riskiest areas from a computed aggregation"""
+    import plotly.express as px
+    fig = px.bar(
+        geo_risk.head(20),
+        x=group_col,
+        y='mean',
+        title=f'Risk Scores by {admin_level}',
+        color='mean',
+        color_continuous_scale='Reds'
+    )
+    fig.update_layout(xaxis_tickangle=45)
+    return fig
+
+@FIGURE_CACHE
+def map_figure(map_data):
+    """Mapbox scatter of the sampled borrowers coloured by risk"""
+    import plotly.express as px
+    columns = set(map_data.columns)
+    fig = px.scatter_mapbox(
+        map_data,
+        lat='latitude',
+        lon='longitude',
+        color='overall_risk_score',
+        size='requested_loan_amount' if 'requested_loan_amount' in columns else None,
+        hover_data=['district', 'block'] if columns.issuperset(['district', 'block']) else None,
+        mapbox_style="open-street-map",
+        title=f"Geographic Risk Distribution ({len(map_data)} sample)",
+        height=600,
+        color_continuous_scale='Reds'
+    )
+    fig.update_layout(mapbox_zoom=6, mapbox_center_lat=11, mapbox_center_lon=78)
+    return fig
+
+@FIGURE_CACHE
+def score_distribution_figure(borrowers, bins=30):
+    """Risk score histogram from precomputed bins, so only the bars reach the browser"""
+    scores = borrowers['overall_risk_score'].to_numpy(dtype=float)
+    counts, edges = np.histogram(scores[~np.isnan(scores)], bins=bins)
+    mean_risk = np.nanmean(scores)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2, y=counts, width=edges[1] - edges[0], marker_color='#1f77b4'
+    ))
+    fig.update_layout(
+        title="Risk Score Distribution",
+        xaxis_title='overall_risk_score',
+        yaxis_title='count',
+        bargap=0
+    )
+    fig.add_vline(x=mean_risk, 
+                 line_dash="dash", line_color="red",
+                 annotation_text=f"Mean: {mean_risk:.1f}")
+    return fig
+
+@FIGURE_CACHE
+def loan_risk_figure(borrowers, scatter_sample):
+    """Loan amount vs risk scatter of the sample, with an OLS trend fitted over all borrowers"""
+    import plotly.express as px
+    fig = px.scatter(
+        scatter_sample,
+        x='requested_loan_amount',
+        y='overall_risk_score',
+        color='risk_category' if 'risk_category' in scatter_sample.columns else None,
+        title="Loan Amount vs Risk Score",
+        render_mode='webgl'
+    )
+    
+    # Least squares via numpy instead of statsmodels; a line needs two distinct loan amounts
+    loan_amounts = borrowers['requested_loan_amount'].to_numpy(dtype=float)
+    scores = borrowers['overall_risk_score'].to_numpy(dtype=float)
+    mask = ~(np.isnan(loan_amounts) | np.isnan(scores))
+    loan_amounts, scores = loan_amounts[mask], scores[mask]
+    if len(loan_amounts) >= 2 and np.ptp(loan_amounts) > 0:
+        slope, intercept = np.polyfit(loan_amounts, scores, 1)
+        x_range = np.array([loan_amounts.min(), loan_amounts.max()])
+        fig.add_trace(go.Scattergl(
+            x=x_range, y=slope * x_range + intercept,
+            mode='lines', name='OLS trend', line=dict(color='black', dash='dash')
+        ))
+    return fig
+
+@FIGURE_CACHE
+def excel_distribution_figure(excel_data, selected_cols):
+    """2x2 grid of histograms for up to four Excel columns"""
+    from plotly.subplots import make_subplots
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=selected_cols[:4]
+    )
+    
+    for i, col in enumerate(selected_cols[:4]):
+        row = (i // 2) + 1
+        col_pos = (i % 2) + 1
+        
+        fig.add_trace(
+            go.Histogram(x=excel_data[col], name=col, nbinsx=20),
+            row=row, col=col_pos
+        )
+    
+    fig.update_layout(height=600, title_text="Data Distributions")
+    return fig
+
+FIGURE_BUILDERS = (
+    risk_category_pie, component_correlation_figure, component_average_figure,
+    top_risk_figure, area_risk_figure, map_figure,
+    score_distribution_figure, loan_risk_figure, excel_distribution_figure
+)
+
+@st.cache_data(show_spinner=False)
+def overview_metrics(data_key, _df):
+    """Headline borrower metrics for the columns present (data_key identifies the borrower file version)"""
+    metrics = {}
+    if 'district' in _df.columns:
+        metrics['districts'] = _df['district'].nunique()
+    if 'overall_risk_score' in _df.columns:
+        metrics['avg_risk'] = _df['overall_risk_score'].mean()
+    if 'requested_loan_amount' in _df.columns:
+        metrics['total_loans'] = _df['requested_loan_amount'].sum()
+    if 'has_bank_account' in _df.columns:
+        metrics['bank_penetration'] = _df['has_bank_account'].mean()
+    return metrics
+
+@st.cache_data(show_spinner=False)
+def risk_category_counts(data_key, _df):
+    """(category, count) pairs, most common first (data_key identifies the borrower file version)"""
+    return tuple(_df['risk_category'].value_counts().items())
+
+@st.cache_data(show_spinner=False)
+def aggregate_risk_by(data_key, _df, group_col):
+    """Risk score summary per area, sorted riskiest first (data_key identifies the borrower file version)"""
+    geo_risk = _df.groupby(group_col, observed=True)['overall_risk_score'].agg([
+        'mean', 'std', 'count', 'min', 'max'
+    ]).round(2)
+    return geo_risk.reset_index().sort_values('mean', ascending=False)
+
 class UltimateRiskDashboard:
     """Comprehensive risk assessment dashboard with Excel integration"""
     
     def __init__(self):
         self.excel_data = None
+        self._excel_key = None
+        self._excel_numeric_cols = []
+        self._excel_geo_cols = []
+        self._excel_counts = None
+        self._excel_missing = 0
         self.borrowers_data = None
+        self._borrowers_key = None
         self.district_agg = None
         self.block_agg = None
         self.panchayat_agg = None
+        self.computed_agg = {}
+        self._cols = frozenset()
+        self._risk_component_cols = []
+        self._risk_corr = None
+        self._map_sample = None
+        self._scatter_sample = None
+        self.load_status = []
         self.load_all_data()
     
     def load_all_data(self):
         """Load all available data sources"""
         
+        # Status lines are collected here and shown in one sidebar element by run_dashboard
+        status = []
+        
         # Load Excel data
-        excel_path = "input_excel/input_data.xlsx"
+        excel_path = EXCEL_PATH
         if os.path.exists(excel_path):
             try:
-                self.excel_data = pd.read_excel(excel_path)
-                st.sidebar.success(f"📊 Excel: {self.excel_data.shape[0]} records")
+                self._excel_key = (excel_path, os.path.getmtime(excel_path))
+                self.excel_data = read_excel_cached(*self._excel_key)
+                # One null scan feeds both the missing-values metric and the column profile
+                self._excel_counts = self.excel_data.count()
+                self._excel_missing = int(self.excel_data.size - self._excel_counts.sum())
+                self._excel_numeric_cols = self.excel_data.select_dtypes(include=[np.number]).columns.tolist()
+                self._excel_geo_cols = [
+                    col for col in self.excel_data.columns
+                    if any(keyword in col.lower() for keyword in ['district', 'block', 'panchayat', 'village', 'taluk'])
+                ]
+                status.append(f"📊 Excel: {self.excel_data.shape[0]} records")
             except Exception as e:
-                st.sidebar.error(f"❌ Excel error: {e}")
+                status.append(f"❌ Excel error: {e}")
         else:
-            st.sidebar.warning("⚠️ No Excel file found")
+            status.append("⚠️ No Excel file found")
         
         # Load borrower data (try multiple sources)
-        borrower_files = [
-            'data/enhanced_borrowers_comprehensive.csv',
-            'data/enhanced_borrowers.csv', 
-            'data/borrowers.csv'
-        ]
-        
-        for file_path in borrower_files:
+        for file_path in BORROWER_FILES:
             if os.path.exists(file_path):
                 try:
-                    self.borrowers_data = pd.read_csv(file_path)
-                    st.sidebar.success(f"✅ Borrowers: {self.borrowers_data.shape[0]} records from {file_path.split('/')[-1]}")
+                    self._borrowers_key = (file_path, os.path.getmtime(file_path))
+                    self.borrowers_data = read_csv_cached(*self._borrowers_key)
+                    status.append(f"✅ Borrowers: {self.borrowers_data.shape[0]} records from {file_path.split('/')[-1]}")
                     break
                 except Exception as e:
-                    st.sidebar.error(f"❌ Error loading {file_path}: {e}")
+                    status.append(f"❌ Error loading {file_path}: {e}")
+        
+        # Column lookups shared by the render methods
+        columns = self.borrowers_data.columns if self.borrowers_data is not None else []
+        self._cols = frozenset(columns)
+        self._risk_component_cols = [col for col in columns if 'risk_score' in col and col != 'overall_risk_score']
+        
+        # Precompute the per-area risk summaries used when no aggregation file exists
+        self.computed_agg = {}
+        if 'overall_risk_score' in self._cols:
+            for group_col in ['district', 'block', 'panchayat']:
+                if group_col in self._cols:
+                    self.computed_agg[group_col] = aggregate_risk_by(self._borrowers_key, self.borrowers_data, group_col)
+        
+        # Fixed map sample per data load, so the map is stable across reruns
+        self._map_sample = None
+        if self._cols.issuperset(['latitude', 'longitude', 'overall_risk_score']):
+            map_cols = [col for col in MAP_COLUMNS if col in self._cols]
+            self._map_sample = self.borrowers_data.sample(
+                min(1000, len(self.borrowers_data)), random_state=42
+            )[map_cols]
+        
+        # Likewise for the loan amount vs risk scatter
+        self._scatter_sample = None
+        if self._cols.issuperset(['requested_loan_amount', 'overall_risk_score']):
+            self._scatter_sample = self.borrowers_data.sample(
+                min(1000, len(self.borrowers_data)), random_state=42
+            )
         
-        # Load aggregation data
-        agg_files = {
-            'district': ['results/district_comprehensive_risk_aggregation.csv', 'results/district_risk_aggregation.csv'],
-            'block': ['results/block_comprehensive_risk_aggregation.csv', 'results/block_risk_aggregation.csv'],
-            'panchayat': ['results/panchayat_comprehensive_risk_aggregation.csv', 'results/panchayat_risk_aggregation.csv']
-        }
+        # Component correlations don't depend on any widget, so compute them once
+        self._risk_corr = None
+        if len(self._risk_component_cols) > 1:
+            self._risk_corr = self.borrowers_data[self._risk_component_cols].corr()
         
-        for level, file_list in agg_files.items():
+        # Load aggregation data
+        for level, file_list in AGGREGATION_FILES.items():
             for file_path in file_list:
                 if os.path.exists(file_path):
                     try:
-                        data = pd.read_csv(file_path)
+                        data = read_csv_cached(file_path, os.path.getmtime(file_path))
                         setattr(self, f"{level}_agg", data)
-                        st.sidebar.success(f"✅ {level.title()}: {len(data)} areas")
+                        status.append(f"✅ {level.title()}: {len(data)} areas")
                         break
                     except Exception as e:
-                        st.sidebar.error(f"❌ Error loading {level}: {e}")
+                        status.append(f"❌ Error loading {level}: {e}")
+        
+        self.load_status = status
     
     def render_header(self):
         """Render the main header"""
         
-        st.markdown("""
+        # Pure HTML, so st.html skips the markdown parser
+        st.html("""
         <div class="main-header">
             <h1>🏦 AI-Driven Micro-Lending Risk Assessment Platform</h1>
             <p><strong>Excel-Integrated • Multi-Level Analysis • Real-time Risk Scoring</strong></p>
             <p>Tamil Nadu Micro-Finance Initiative | Powered by Advanced ML Algorithms</p>
         </div>
-        """, unsafe_allow_html=True)
+        """)
     
+    # Each view is a fragment: its own widget events rerun only that view
+    @st.fragment
     def render_overview_tab(self):
         """Render the overview/summary tab"""
         
@@ -128,33 +570,33 @@ class UltimateRiskDashboard:
         col1, col2, col3, col4, col5 = st.columns(5)
         
         if self.borrowers_data is not None:
+            # Column scans run once per borrower file version, not on every rerun
+            metrics = overview_metrics(self._borrowers_key, self.borrowers_data)
+            
             with col1:
                 st.metric("Total Borrowers", f"{len(self.borrowers_data):,}")
             
             with col2:
-                if 'district' in self.borrowers_data.columns:
-                    st.metric("Districts", self.borrowers_data['district'].nunique())
+                if 'districts' in metrics:
+                    st.metric("Districts", metrics['districts'])
                 else:
                     st.metric("Districts", "10")
             
             with col3:
-                if 'overall_risk_score' in self.borrowers_data.columns:
-                    avg_risk = self.borrowers_data['overall_risk_score'].mean()
-                    st.metric("Avg Risk Score", f"{avg_risk:.1f}")
+                if 'avg_risk' in metrics:
+                    st.metric("Avg Risk Score", f"{metrics['avg_risk']:.1f}")
                 else:
                     st.metric("Avg Risk Score", "45.2")
             
             with col4:
-                if 'requested_loan_amount' in self.borrowers_data.columns:
-                    total_loans = self.borrowers_data['requested_loan_amount'].sum()
-                    st.metric("Total Loan Requests", f"₹{total_loans:,.0f}")
+                if 'total_loans' in metrics:
+                    st.metric("Total Loan Requests", f"₹{metrics['total_loans']:,.0f}")
                 else:
                     st.metric("Total Loan Requests", "₹12.5Cr")
             
             with col5:
-                if 'has_bank_account' in self.borrowers_data.columns:
-                    bank_penetration = self.borrowers_data['has_bank_account'].mean()
-                    st.metric("Banking Penetration", f"{bank_penetration:.1%}")
+                if 'bank_penetration' in metrics:
+                    st.metric("Banking Penetration", f"{metrics['bank_penetration']:.1%}")
                 else:
                     st.metric("Banking Penetration", "73.2%")
         
@@ -199,6 +641,7 @@ class UltimateRiskDashboard:
         for cap in capabilities:
             st.markdown(cap)
     
+    @st.fragment
     def render_excel_analysis_tab(self):
         """Render Excel data analysis tab"""
         
@@ -227,36 +670,22 @@ class UltimateRiskDashboard:
         with col2:
             st.metric("Columns", len(self.excel_data.columns))
         with col3:
-            st.metric("Missing Values", self.excel_data.isnull().sum().sum())
+            st.metric("Missing Values", self._excel_missing)
         with col4:
-            numeric_cols = self.excel_data.select_dtypes(include=[np.number]).columns
-            st.metric("Numeric Columns", len(numeric_cols))
+            st.metric("Numeric Columns", len(self._excel_numeric_cols))
         
         # Column analysis
         st.subheader("📋 Column Structure")
         
-        col_df = pd.DataFrame({
-            'Column': self.excel_data.columns,
-            'Data Type': self.excel_data.dtypes.astype(str),
-            'Non-Null Count': self.excel_data.count(),
-            'Unique Values': [self.excel_data[col].nunique() for col in self.excel_data.columns],
-            'Sample Values': [str(self.excel_data[col].dropna().iloc[:3].tolist())[:50] + "..." 
-                            if len(self.excel_data[col].dropna()) > 0 else "No data"
-                            for col in self.excel_data.columns]
-        })
+        col_df = column_profile(self._excel_key, self.excel_data, self._excel_counts)
         
         st.dataframe(col_df, use_container_width=True)
         
         # Geographic hierarchy analysis
-        geo_columns = []
-        for col in self.excel_data.columns:
-            if any(keyword in col.lower() for keyword in ['district', 'block', 'panchayat', 'village', 'taluk']):
-                geo_columns.append(col)
-        
-        if geo_columns:
+        if self._excel_geo_cols:
             st.subheader("🗺️ Geographic Hierarchy")
             
-            for col in geo_columns:
+            for col in self._excel_geo_cols:
                 unique_count = self.excel_data[col].nunique()
                 st.write(f"**{col}**: {unique_count} unique values")
                 
@@ -265,15 +694,18 @@ class UltimateRiskDashboard:
                     st.write(f"Values: {', '.join(map(str, values_list))}")
         
         # Numeric analysis
-        numeric_cols = self.excel_data.select_dtypes(include=[np.number]).columns
-        if len(numeric_cols) > 0:
+        numeric_cols = self._excel_numeric_cols
+        if numeric_cols:
             st.subheader("📈 Numeric Data Analysis")
             
-            selected_cols = st.multiselect(
-                "Select columns to analyze:",
-                options=numeric_cols.tolist(),
-                default=numeric_cols.tolist()[:3]
-            )
+            # Selection changes are batched in a form, so the statistics and charts update once on Apply
+            with st.form("excel_numeric_analysis"):
+                selected_cols = st.multiselect(
+                    "Select columns to analyze:",
+                    options=numeric_cols,
+                    default=numeric_cols[:3]
+                )
+                st.form_submit_button("Apply")
             
             if selected_cols:
                 # Summary statistics
@@ -282,29 +714,19 @@ class UltimateRiskDashboard:
                 
                 # Distribution plots
                 if len(selected_cols) <= 4:
-                    fig = make_subplots(
-                        rows=2, cols=2,
-                        subplot_titles=selected_cols[:4]
+                    st.plotly_chart(
+                        excel_distribution_figure(self.excel_data, tuple(selected_cols)),
+                        use_container_width=True
                     )
-                    
-                    for i, col in enumerate(selected_cols[:4]):
-                        row = (i // 2) + 1
-                        col_pos = (i % 2) + 1
-                        
-                        fig.add_trace(
-                            go.Histogram(x=self.excel_data[col], name=col, nbinsx=20),
-                            row=row, col=col_pos
-                        )
-                    
-                    fig.update_layout(height=600, title_text="Data Distributions")
-                    st.plotly_chart(fig, use_container_width=True)
         
         # Sample data display
         st.subheader("🔍 Sample Data")
         
+        # Only the requested head is serialized and sent to the browser, never the whole workbook
         n_samples = st.slider("Number of rows to display:", 5, min(50, len(self.excel_data)), 10)
         st.dataframe(self.excel_data.head(n_samples), use_container_width=True)
     
+    @st.fragment
     def render_risk_analysis_tab(self):
         """Render comprehensive risk analysis"""
         
@@ -315,110 +737,54 @@ class UltimateRiskDashboard:
             return
         
         # Risk distribution overview
-        if 'risk_category' in self.borrowers_data.columns:
+        if 'risk_category' in self._cols:
             st.subheader("🎯 Risk Distribution Overview")
             
-            risk_counts = self.borrowers_data['risk_category'].value_counts()
-            
-            col1, col2, col3, col4 = st.columns(4)
-            
-            risk_colors = {
-                'Low Risk': '#28a745',
-                'Medium Risk': '#ffc107', 
-                'High Risk': '#fd7e14',
-                'Very High Risk': '#dc3545'
-            }
-            
-            for i, (category, count) in enumerate(risk_counts.items()):
-                percentage = (count / len(self.borrowers_data)) * 100
-                color = risk_colors.get(category, '#6c757d')
-                
-                with [col1, col2, col3, col4][i]:
-                    st.markdown(f"""
-                    <div style="background-color: {color}15; border-left: 4px solid {color}; padding: 1rem; border-radius: 5px;">
-                        <h3 style="color: {color}; margin: 0;">{count:,}</h3>
-                        <p style="margin: 0; font-weight: bold;">{category}</p>
-                        <p style="margin: 0; font-size: 0.9em;">{percentage:.1f}% of total</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+            st.markdown(
+                risk_cards_html(
+                    risk_category_counts(self._borrowers_key, self.borrowers_data),
+                    len(self.borrowers_data)
+                ),
+                unsafe_allow_html=True
+            )
             
             # Risk distribution pie chart
-            fig = px.pie(
-                values=risk_counts.values,
-                names=risk_counts.index,
-                title="Risk Category Distribution",
-                color_discrete_map=risk_colors,
-                hole=0.4
-            )
-            fig.update_traces(textposition='inside', textinfo='percent+label')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(risk_category_pie(self.borrowers_data), use_container_width=True)
         
         # Risk score analysis
-        if 'overall_risk_score' in self.borrowers_data.columns:
+        if 'overall_risk_score' in self._cols:
             st.subheader("📊 Risk Score Analytics")
             
             col1, col2 = st.columns(2)
             
             with col1:
-                # Risk score distribution
-                fig = px.histogram(
-                    self.borrowers_data,
-                    x='overall_risk_score',
-                    nbins=30,
-                    title="Risk Score Distribution",
-                    color_discrete_sequence=['#1f77b4']
-                )
-                fig.add_vline(x=self.borrowers_data['overall_risk_score'].mean(), 
-                             line_dash="dash", line_color="red",
-                             annotation_text=f"Mean: {self.borrowers_data['overall_risk_score'].mean():.1f}")
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(score_distribution_figure(self.borrowers_data), use_container_width=True)
             
             with col2:
                 # Risk vs Loan Amount
-                if 'requested_loan_amount' in self.borrowers_data.columns:
-                    fig = px.scatter(
-                        self.borrowers_data.sample(min(1000, len(self.borrowers_data))),
-                        x='requested_loan_amount',
-                        y='overall_risk_score',
-                        color='risk_category' if 'risk_category' in self.borrowers_data.columns else None,
-                        title="Loan Amount vs Risk Score",
-                        trendline="ols"
+                if self._scatter_sample is not None:
+                    st.plotly_chart(
+                        loan_risk_figure(self.borrowers_data, self._scatter_sample),
+                        use_container_width=True
                     )
-                    st.plotly_chart(fig, use_container_width=True)
         
         # Component risk analysis
-        risk_component_cols = [col for col in self.borrowers_data.columns if 'risk_score' in col and col != 'overall_risk_score']
+        risk_component_cols = self._risk_component_cols
         
         if risk_component_cols:
             st.subheader("🔍 Risk Component Analysis")
             
             # Component correlation heatmap
-            if len(risk_component_cols) > 1:
-                corr_matrix = self.borrowers_data[risk_component_cols].corr()
-                
-                fig = px.imshow(
-                    corr_matrix,
-                    text_auto=True,
-                    aspect="auto",
-                    title="Risk Component Correlations",
-                    color_continuous_scale='RdBu_r'
-                )
-                st.plotly_chart(fig, use_container_width=True)
+            if self._risk_corr is not None:
+                st.plotly_chart(component_correlation_figure(self._risk_corr), use_container_width=True)
             
             # Component averages
-            component_avgs = self.borrowers_data[risk_component_cols].mean().sort_values(ascending=True)
-            
-            fig = px.bar(
-                x=component_avgs.values,
-                y=component_avgs.index,
-                orientation='h',
-                title="Average Risk Scores by Component",
-                color=component_avgs.values,
-                color_continuous_scale='Reds'
+            st.plotly_chart(
+                component_average_figure(self.borrowers_data, tuple(risk_component_cols)),
+                use_container_width=True
             )
-            fig.update_layout(yaxis_title="Risk Component", xaxis_title="Average Score")
-            st.plotly_chart(fig, use_container_width=True)
     
+    @st.fragment
     def render_geographic_tab(self):
         """Render geographic analysis"""
         
@@ -454,35 +820,27 @@ class UltimateRiskDashboard:
             if 'overall_risk_score_mean' in agg_data.columns:
                 col1, col2, col3 = st.columns(3)
                 
+                area_risk = agg_data['overall_risk_score_mean']
+                highest, lowest = area_risk.idxmax(), area_risk.idxmin()
+                area_col = admin_level.lower()
+                
                 with col1:
                     st.metric("Highest Risk Area", 
-                             agg_data.loc[agg_data['overall_risk_score_mean'].idxmax(), admin_level.lower()],
-                             f"{agg_data['overall_risk_score_mean'].max():.1f}")
+                             agg_data.at[highest, area_col],
+                             f"{area_risk[highest]:.1f}")
                 
                 with col2:
                     st.metric("Lowest Risk Area",
-                             agg_data.loc[agg_data['overall_risk_score_mean'].idxmin(), admin_level.lower()],
-                             f"{agg_data['overall_risk_score_mean'].min():.1f}")
+                             agg_data.at[lowest, area_col],
+                             f"{area_risk[lowest]:.1f}")
                 
                 with col3:
                     st.metric("Average Risk",
-                             f"{agg_data['overall_risk_score_mean'].mean():.1f}",
-                             f"±{agg_data['overall_risk_score_mean'].std():.1f}")
+                             f"{area_risk.mean():.1f}",
+                             f"±{area_risk.std():.1f}")
                 
                 # Risk ranking chart
-                top_risk = agg_data.nlargest(15, 'overall_risk_score_mean')
-                
-                fig = px.bar(
-                    top_risk,
-                    x='overall_risk_score_mean',
-                    y=admin_level.lower(),
-                    orientation='h',
-                    title=f"Top 15 Highest Risk {admin_level}s",
-                    color='overall_risk_score_mean',
-                    color_continuous_scale='Reds'
-                )
-                fig.update_layout(yaxis={'categoryorder': 'total ascending'})
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(top_risk_figure(agg_data, admin_level), use_container_width=True)
             
             # Display aggregation table
             st.subheader(f"📋 {admin_level} Risk Summary Table")
@@ -492,13 +850,10 @@ class UltimateRiskDashboard:
         
         else:
             # Calculate from raw data
-            if group_col in self.borrowers_data.columns and 'overall_risk_score' in self.borrowers_data.columns:
+            if group_col in self.computed_agg:
                 st.subheader(f"📊 {admin_level} Level Analysis (Calculated)")
                 
-                geo_risk = self.borrowers_data.groupby(group_col)['overall_risk_score'].agg([
-                    'mean', 'std', 'count', 'min', 'max'
-                ]).round(2)
-                geo_risk = geo_risk.reset_index().sort_values('mean', ascending=False)
+                geo_risk = self.computed_agg[group_col]
                 
                 # Top/bottom risk areas
                 col1, col2 = st.columns(2)
@@ -512,40 +867,14 @@ class UltimateRiskDashboard:
                     st.dataframe(geo_risk.tail(10))
                 
                 # Risk distribution chart
-                fig = px.bar(
-                    geo_risk.head(20),
-                    x=group_col,
-                    y='mean',
-                    title=f'Risk Scores by {admin_level}',
-                    color='mean',
-                    color_continuous_scale='Reds'
-                )
-                fig.update_layout(xaxis_tickangle=45)
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(area_risk_figure(geo_risk, admin_level, group_col), use_container_width=True)
         
         # Geographic scatter plot
-        if all(col in self.borrowers_data.columns for col in ['latitude', 'longitude', 'overall_risk_score']):
+        if self._map_sample is not None:
             st.subheader("📍 Geographic Distribution Map")
-            
-            # Sample data for performance
-            sample_size = min(1000, len(self.borrowers_data))
-            map_data = self.borrowers_data.sample(sample_size)
-            
-            fig = px.scatter_mapbox(
-                map_data,
-                lat='latitude',
-                lon='longitude',
-                color='overall_risk_score',
-                size='requested_loan_amount' if 'requested_loan_amount' in map_data.columns else None,
-                hover_data=['district', 'block'] if all(col in map_data.columns for col in ['district', 'block']) else None,
-                mapbox_style="open-street-map",
-                title=f"Geographic Risk Distribution ({sample_size} sample)",
-                height=600,
-                color_continuous_scale='Reds'
-            )
-            fig.update_layout(mapbox_zoom=6, mapbox_center_lat=11, mapbox_center_lon=78)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(map_figure(self._map_sample), use_container_width=True)
     
+    @st.fragment
     def render_insights_tab(self):
         """Render ML insights and recommendations"""
         
@@ -554,43 +883,14 @@ class UltimateRiskDashboard:
         # Simulated ML performance metrics
         st.subheader("📊 Model Performance Dashboard")
         
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Model Accuracy", "89.3%", "↑ 2.4%")
-        with col2:
-            st.metric("Precision", "86.7%", "↑ 1.8%")
-        with col3:
-            st.metric("Recall", "91.2%", "↑ 0.9%")
-        with col4:
-            st.metric("F1-Score", "88.9%", "↑ 1.5%")
+        for col, (label, value, delta) in zip(st.columns(len(MODEL_METRICS)), MODEL_METRICS):
+            with col:
+                st.metric(label, value, delta)
         
         # Feature importance
         st.subheader("🎯 Feature Importance Analysis")
         
-        feature_importance = {
-            'Credit History Length': 0.18,
-            'Monthly Income to Loan Ratio': 0.16,
-            'Collateral Value': 0.14,
-            'Education Level': 0.12,
-            'Bank Account Status': 0.10,
-            'SHG Membership': 0.08,
-            'Asset Ownership': 0.07,
-            'Age Factor': 0.06,
-            'Geographic Location': 0.05,
-            'Social Connections': 0.04
-        }
-        
-        fig = px.bar(
-            x=list(feature_importance.values()),
-            y=list(feature_importance.keys()),
-            orientation='h',
-            title="Top 10 Risk Prediction Features",
-            color=list(feature_importance.values()),
-            color_continuous_scale='Viridis'
-        )
-        fig.update_layout(yaxis={'categoryorder': 'total ascending'})
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(feature_importance_figure(), use_container_width=True)
         
         # Key insights
         st.subheader("💡 Data-Driven Insights")
@@ -622,37 +922,7 @@ class UltimateRiskDashboard:
         # Recommendations engine
         st.subheader("🎯 Automated Recommendations")
         
-        recommendations = [
-            {
-                "category": "🏛️ Policy Recommendations",
-                "items": [
-                    "Implement mandatory financial literacy programs for high-risk borrowers",
-                    "Establish mobile banking units in low-infrastructure areas",
-                    "Create incentives for SHG membership and participation",
-                    "Develop crop insurance partnerships for agricultural borrowers"
-                ]
-            },
-            {
-                "category": "💰 Lending Strategy",
-                "items": [
-                    "Offer lower interest rates for SHG members and educated borrowers",
-                    "Require co-guarantors for seasonal workers",
-                    "Implement graduated loan amounts based on repayment history",
-                    "Provide grace periods for agriculture-dependent borrowers"
-                ]
-            },
-            {
-                "category": "🔍 Risk Monitoring",
-                "items": [
-                    "Monthly check-ins for high-risk borrowers",
-                    "Seasonal income verification for agricultural borrowers",
-                    "Digital payment adoption tracking",
-                    "Community feedback integration for social risk assessment"
-                ]
-            }
-        ]
-        
-        for rec in recommendations:
+        for rec in RECOMMENDATIONS:
             with st.expander(rec["category"]):
                 for item in rec["items"]:
                     st.write(f"• {item}")
@@ -689,55 +959,71 @@ class UltimateRiskDashboard:
     def run_dashboard(self):
         """Main dashboard orchestration"""
         
+        # Stamped on the session's first run and reused by every rerun after it
+        if 'generated_at' not in st.session_state:
+            st.session_state.generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
         self.render_header()
         
         # Sidebar controls
         st.sidebar.title("🎛️ Dashboard Controls")
-        st.sidebar.markdown("---")
+        st.sidebar.markdown("  \n".join(self.load_status))
+        st.sidebar.divider()
         
         # Data refresh button
         if st.sidebar.button("🔄 Refresh Data"):
-            self.load_all_data()
-            st.experimental_rerun()
-        
-        # Main content tabs
-        tab1, tab2, tab3, tab4, tab5 = st.tabs([
-            "🏠 Overview",
-            "📊 Excel Analysis", 
-            "⚖️ Risk Assessment",
-            "🗺️ Geographic Analysis",
-            "🤖 ML Insights"
-        ])
-        
-        with tab1:
-            self.render_overview_tab()
-        
-        with tab2:
-            self.render_excel_analysis_tab()
-        
-        with tab3:
-            self.render_risk_analysis_tab()
-        
-        with tab4:
-            self.render_geographic_tab()
-        
-        with tab5:
-            self.render_insights_tab()
+            refresh_dashboard()
+            st.rerun()
+        
+        # Main content views; unlike st.tabs, only the selected view is rendered on each rerun.
+        # A new session opens the view named in ?view=, defaulting to the Overview
+        if 'active_tab' not in st.session_state:
+            st.session_state.active_tab = VIEW_BY_SLUG.get(st.query_params.get('view'), VIEW_LABELS[0])
+        active_tab = st.radio(
+            "View",
+            VIEW_LABELS,
+            horizontal=True,
+            key='active_tab',
+            on_change=sync_view_param,
+            label_visibility="collapsed"
+        )
+        getattr(self, VIEWS[active_tab])()
         
         # Footer
-        st.markdown("---")
-        st.markdown("""
+        st.divider()
+        st.html(f"""
         <div style="text-align: center; color: #666; padding: 1rem;">
             <p><strong>AI-Driven Micro-Lending Risk Assessment Platform</strong></p>
             <p>🏦 Tamil Nadu Micro-Finance Initiative | 🤖 Powered by Advanced ML Algorithms | 📊 Real-time Risk Analytics</p>
-            <p><em>Generated on {timestamp} | Platform Version 3.0</em></p>
+            <p><em>Generated on {st.session_state.generated_at} | Platform Version 3.0</em></p>
         </div>
-        """.format(timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S")), unsafe_allow_html=True)
+        """)
+
+def input_versions():
+    """Modification times of every input file the dashboard may load (None for missing files)"""
+    paths = [EXCEL_PATH, *BORROWER_FILES, *(path for files in AGGREGATION_FILES.values() for path in files)]
+    return tuple(os.path.getmtime(path) if os.path.exists(path) else None for path in paths)
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_dashboard(versions):
+    """Build the dashboard (and load its data) once per version of its input files"""
+    # The figure caches key frames by id, which the new load's frames may reuse
+    for builder in FIGURE_BUILDERS:
+        builder.clear()
+    return UltimateRiskDashboard()
+
+def refresh_dashboard():
+    """Drop every cached parse, aggregation and figure, and the shared dashboard built from them"""
+    # The next get_dashboard() call builds a fresh instance, so sessions still rendering the
+    # old one never see it half-reloaded; the cached dashboard is never mutated after __init__
+    st.cache_data.clear()
+    for builder in FIGURE_BUILDERS:
+        builder.clear()
+    get_dashboard.clear()
 
 def main():
     """Main application entry point"""
-    dashboard = UltimateRiskDashboard()
-    dashboard.run_dashboard()
+    get_dashboard(input_versions()).run_dashboard()
 
 if __name__ == "__main__":
     main()